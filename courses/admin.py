@@ -1,5 +1,6 @@
 from django.contrib import admin
 
-from .models import Course
+from .models import Course, IntakeWindow
 
-admin.site.register(Course)
\ No newline at end of file
+admin.site.register(Course)
+admin.site.register(IntakeWindow)
\ No newline at end of file
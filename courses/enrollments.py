@@ -0,0 +1,53 @@
+from typing import Iterable
+
+from .models import Course, StudentCourseEnrollment
+
+
+def enroll_student(
+    student_id: int,
+    semester_id: int,
+    courses: Iterable[Course],
+    enrollment_status: str | None = "enrolled",
+) -> tuple[dict[int, int], list[Course]]:
+    """
+    Enroll a student profile in every course, in one INSERT. Courses the
+    student is already enrolled in for the semester are left untouched.
+
+    Returns the ids of the new enrollments keyed by course id, and the
+    courses that were already enrolled. A concurrent request enrolling the
+    same course is absorbed by ignore_conflicts on the unique_together
+    constraint instead of failing.
+    """
+    courses = list(courses)
+    course_ids = [course.id for course in courses]
+    enrollments = StudentCourseEnrollment.objects.filter(
+        student_id=student_id, semester_id=semester_id, course_id__in=course_ids
+    )
+    existing = set(enrollments.values_list("course_id", flat=True))
+
+    new_course_ids = [
+        course_id
+        for course_id in dict.fromkeys(course_ids)
+        if course_id not in existing
+    ]
+    if not new_course_ids:
+        return {}, courses
+
+    StudentCourseEnrollment.objects.bulk_create(
+        [
+            StudentCourseEnrollment(
+                student_id=student_id,
+                course_id=course_id,
+                semester_id=semester_id,
+                enrollment_status=enrollment_status,
+            )
+            for course_id in new_course_ids
+        ],
+        ignore_conflicts=True,
+    )
+    # ignore_conflicts leaves primary keys unset, so read the new ids back.
+    created = dict(
+        enrollments.filter(course_id__in=new_course_ids).values_list("course_id", "id")
+    )
+    duplicates = [course for course in courses if course.id not in created]
+    return created, duplicates
@@ -0,0 +1,210 @@
+"""
+The semester calendar: which intake, and which SemesterInfo, is current for
+an institution on a given day.
+
+Intake windows and semester ids are loaded into an in-process index once
+and answered from memory. Any change to a window or a semester bumps a
+version in the shared cache, and every process rebuilds its index the next
+time it sees a new version.
+"""
+
+import calendar
+import logging
+import threading
+import uuid
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import date
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from professor.cache import MISSING, TTLCache
+
+from .models import IntakeWindow, SemesterInfo
+from .utils import canonicalize_semester_code
+
+logger = logging.getLogger(__name__)
+
+CALENDAR_VERSION_KEY = "courses:calendar-version"
+# How often a process checks the shared version for changes made elsewhere.
+VERSION_CHECK_INTERVAL = 30
+
+# (label, start_month, start_day, end_month, end_day), used by institutions
+# without windows of their own when no default windows are stored.
+DEFAULT_WINDOWS = (
+    ("Jan", 1, 1, 4, None),
+    ("May", 5, 1, 8, None),
+    ("Sep", 9, 1, 12, None),
+)
+
+
+@dataclass(frozen=True)
+class Intake:
+    code: str
+    name: str
+    start_date: date
+    end_date: date
+    year: int
+    semester_id: int | None = None
+
+    def defaults(self) -> dict:
+        """
+        The fields of the SemesterInfo created for this intake on first use.
+        """
+        return {
+            "name": self.name,
+            "start_date": self.start_date,
+            "end_date": self.end_date,
+            "year": self.year,
+            "is_current": True,
+        }
+
+
+def _day(year: int, month: int, day: int | None) -> date:
+    last_day = calendar.monthrange(year, month)[1]
+    return date(year, month, min(day or last_day, last_day))
+
+
+def _window_dates(window: tuple, year: int) -> tuple[date, date]:
+    _, start_month, start_day, end_month, end_day = window
+    wraps = (end_month, end_day or 31) < (start_month, start_day)
+    return (
+        _day(year, start_month, start_day),
+        _day(year + 1 if wraps else year, end_month, end_day),
+    )
+
+
+class SemesterCalendar:
+    """
+    An interval index over a snapshot of every institution's intake windows.
+    Intakes are materialized per (institution, year) on first use and kept
+    sorted by start date, so a lookup is a binary search.
+    """
+
+    def __init__(self, windows: dict, semester_ids: dict[str, int]) -> None:
+        self.windows = windows
+        self.semester_ids = semester_ids
+        self._years = {}
+        self._lock = threading.Lock()
+
+    def current(self, institution_id=None, day: date | None = None) -> Intake:
+        """
+        The intake running on ``day``, or the latest one to have started
+        when ``day`` falls between two windows.
+        """
+        day = day or date.today()
+        windows = self.windows.get(institution_id) or self.windows.get(None)
+        starts, intakes = self._materialize(institution_id, windows, day.year)
+        index = bisect_right(starts, day) - 1
+        return intakes[index]
+
+    def _materialize(self, institution_id, windows, year):
+        key = (institution_id if institution_id in self.windows else None, year)
+        materialized = self._years.get(key)
+        if materialized is None:
+            intakes = sorted(
+                (
+                    self._intake(window, window_year)
+                    for window_year in (year - 1, year)
+                    for window in windows
+                ),
+                key=lambda intake: intake.start_date,
+            )
+            materialized = ([intake.start_date for intake in intakes], intakes)
+            with self._lock:
+                self._years[key] = materialized
+        return materialized
+
+    def _intake(self, window, year) -> Intake:
+        label = window[0]
+        start_date, end_date = _window_dates(window, year)
+        code = f"{label}{year}"
+        return Intake(
+            code=code,
+            name=f"{label} {year}",
+            start_date=start_date,
+            end_date=end_date,
+            year=year,
+            semester_id=self.semester_ids.get(canonicalize_semester_code(code)),
+        )
+
+
+def load_calendar() -> SemesterCalendar:
+    windows = {}
+    for window in IntakeWindow.objects.order_by("start_month", "start_day"):
+        windows.setdefault(window.institution_id, []).append(
+            (
+                window.label,
+                window.start_month,
+                window.start_day,
+                window.end_month,
+                window.end_day,
+            )
+        )
+    windows.setdefault(None, list(DEFAULT_WINDOWS))
+
+    # Oldest id wins, as in resolve_semester_ids.
+    semester_ids = {}
+    for canonical, semester_id in SemesterInfo.objects.order_by("id").values_list(
+        "canonical_code", "id"
+    ):
+        semester_ids.setdefault(canonical, semester_id)
+    return SemesterCalendar(windows, semester_ids)
+
+
+_state = {"calendar": None, "version": None}
+_version_check = TTLCache(maxsize=1, ttl=VERSION_CHECK_INTERVAL)
+_reload_lock = threading.Lock()
+
+
+def calendar_version() -> str:
+    """
+    The shared version of the calendar, checked at most every
+    VERSION_CHECK_INTERVAL seconds. It changes whenever an intake window or
+    a semester is saved or deleted.
+    """
+    version = _version_check.get(CALENDAR_VERSION_KEY)
+    if version is MISSING:
+        version = cache.get(CALENDAR_VERSION_KEY)
+        if version is None:
+            version = uuid.uuid4().hex
+            if not cache.add(CALENDAR_VERSION_KEY, version, None):
+                version = cache.get(CALENDAR_VERSION_KEY, version)
+        _version_check.set(CALENDAR_VERSION_KEY, version)
+    return version
+
+
+def get_calendar() -> SemesterCalendar:
+    version = calendar_version()
+    if _state["calendar"] is None or _state["version"] != version:
+        with _reload_lock:
+            if _state["calendar"] is None or _state["version"] != version:
+                _state["calendar"] = load_calendar()
+                _state["version"] = version
+    return _state["calendar"]
+
+
+def current_intake(institution_id=None, today: date | None = None) -> Intake:
+    return get_calendar().current(institution_id, today)
+
+
+def invalidate_calendar() -> None:
+    """
+    Rebuild the calendar in this process on next use, and tell the other
+    processes to do the same.
+    """
+    _version_check.clear()
+    _state["calendar"] = None
+    cache.set(CALENDAR_VERSION_KEY, uuid.uuid4().hex, None)
+    logger.info("Invalidated semester calendar")
+
+
+@receiver(post_save, sender=IntakeWindow)
+@receiver(post_delete, sender=IntakeWindow)
+@receiver(post_save, sender=SemesterInfo)
+@receiver(post_delete, sender=SemesterInfo)
+def _calendar_changed(sender, **kwargs) -> None:
+    transaction.on_commit(invalidate_calendar)
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.13 on 2026-10-18 02:42
+
+import re
+
+from django.db import migrations, models
+
+
+def backfill_canonical_code(apps, schema_editor):
+    SemesterInfo = apps.get_model("courses", "SemesterInfo")
+    semesters = list(SemesterInfo.objects.only("id", "code"))
+    for semester in semesters:
+        canonical = re.sub(r"[^A-Z0-9]", "", semester.code.upper())
+        canonical = re.sub(r"^([A-Z]+)20(\d{2})$", r"\1\2", canonical)
+        semester.canonical_code = canonical or semester.code.strip()
+    SemesterInfo.objects.bulk_update(semesters, ["canonical_code"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("courses", "0002_course_institution"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="semesterinfo",
+            name="canonical_code",
+            field=models.CharField(
+                blank=True, db_index=True, default="", editable=False, max_length=50
+            ),
+        ),
+        migrations.RunPython(backfill_canonical_code, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 5.2.13 on 2026-10-18 02:57
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("courses", "0003_semesterinfo_canonical_code"),
+        ("institutions", "0002_alter_institution_state_province"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="IntakeWindow",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("label", models.CharField(max_length=20)),
+                ("start_month", models.PositiveSmallIntegerField()),
+                ("start_day", models.PositiveSmallIntegerField(default=1)),
+                ("end_month", models.PositiveSmallIntegerField()),
+                ("end_day", models.PositiveSmallIntegerField(blank=True, null=True)),
+                (
+                    "institution",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="intake_windows",
+                        to="institutions.institution",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("institution", "label"),
+                        name="unique_intake_window",
+                        nulls_distinct=False,
+                    )
+                ],
+            },
+        ),
+    ]
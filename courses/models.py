@@ -2,19 +2,66 @@ from users.models import StudentProfile
 from institutions.models import Institution
 from django.db import models
 
+from .utils import canonicalize_semester_code
+
 
 class SemesterInfo(models.Model):
     code = models.CharField(max_length=50, unique=True)
+    canonical_code = models.CharField(
+        max_length=50, db_index=True, default="", blank=True, editable=False
+    )
     name = models.CharField(max_length=255)
     start_date = models.DateField()
     end_date = models.DateField()
     is_current = models.BooleanField(default=False)
     year = models.IntegerField(null=True, blank=True)
 
+    def save(self, *args, **kwargs):
+        self.canonical_code = canonicalize_semester_code(self.code)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "code" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "canonical_code"}
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f"{self.name} ({self.code})"
 
 
+class IntakeWindow(models.Model):
+    """
+    A recurring intake an institution runs every year, e.g. Jan from 1 January
+    to 30 April. Windows without an institution apply to institutions that
+    have none of their own. A window whose end comes before its start runs
+    into the next year.
+    """
+
+    institution = models.ForeignKey(
+        Institution,
+        on_delete=models.CASCADE,
+        related_name="intake_windows",
+        null=True,
+        blank=True,
+    )
+    label = models.CharField(max_length=20)
+    start_month = models.PositiveSmallIntegerField()
+    start_day = models.PositiveSmallIntegerField(default=1)
+    end_month = models.PositiveSmallIntegerField()
+    # Blank means the last day of end_month.
+    end_day = models.PositiveSmallIntegerField(null=True, blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["institution", "label"],
+                name="unique_intake_window",
+                nulls_distinct=False,
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.label} ({self.institution_id or 'default'})"
+
+
 class Course(models.Model):
     course_code = models.CharField(max_length=50)
     course_name = models.CharField(max_length=255)
@@ -0,0 +1,92 @@
+from dataclasses import dataclass, field
+
+from django.db import transaction
+from django.utils import timezone
+
+from .enrollments import enroll_student
+from .models import Course
+
+# Registration field -> Course field, for the optional course details.
+COURSE_FIELDS = {
+    "course_name": "course_name",
+    "course_id": "course_id",
+    "instructor": "instructor",
+    "credits": "credits",
+    "department": "department",
+    "meeting_times": "meeting_times",
+    "campus": "location",
+}
+
+
+@dataclass
+class RegistrationResult:
+    courses: list[Course] = field(default_factory=list)
+    created_course_ids: set[int] = field(default_factory=set)
+    enrollment_ids: dict[int, int] = field(default_factory=dict)
+
+    @property
+    def created_count(self) -> int:
+        return len(self.created_course_ids)
+
+    @property
+    def updated_count(self) -> int:
+        return len(self.courses) - self.created_count
+
+
+def register_courses(
+    student_id: int, institution_id: int, semester_id: int, items: list[dict]
+) -> RegistrationResult:
+    """
+    Create or update every course a student registered for and enroll the
+    student in all of them, in one short transaction: one query for the
+    existing courses, one INSERT, one UPDATE and the enrollment statements.
+
+    Courses are matched on (course_code, semester, institution) like
+    CourseRegistrationView; the last item wins when a code repeats.
+    """
+    items_by_code = {item["course_code"]: item for item in items}
+    result = RegistrationResult()
+    now = timezone.now()
+
+    with transaction.atomic():
+        existing = {}
+        for course in Course.objects.filter(
+            institution_id=institution_id,
+            semester_id=semester_id,
+            course_code__in=items_by_code,
+        ).order_by("id"):
+            existing.setdefault(course.course_code, course)
+
+        new_courses = []
+        updated_courses = []
+        for course_code, item in items_by_code.items():
+            course = existing.get(course_code)
+            if course is None:
+                course = Course(
+                    course_code=course_code,
+                    semester_id=semester_id,
+                    institution_id=institution_id,
+                    raw_data=item,
+                    **{COURSE_FIELDS[name]: item.get(name) for name in COURSE_FIELDS},
+                )
+                new_courses.append(course)
+            else:
+                for name, model_field in COURSE_FIELDS.items():
+                    if name in item:
+                        setattr(course, model_field, item[name])
+                course.updated_at = now
+                updated_courses.append(course)
+            result.courses.append(course)
+
+        Course.objects.bulk_create(new_courses)
+        if updated_courses:
+            Course.objects.bulk_update(
+                updated_courses, [*COURSE_FIELDS.values(), "updated_at"]
+            )
+        result.created_course_ids = {course.pk for course in new_courses}
+
+        result.enrollment_ids, _ = enroll_student(
+            student_id, semester_id, result.courses
+        )
+
+    return result
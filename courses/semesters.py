@@ -0,0 +1,113 @@
+import logging
+from typing import Callable, Iterable
+
+from django.db import transaction
+
+from professor.cache import MISSING, TTLCache
+
+from .intakes import calendar_version, current_intake, invalidate_calendar
+from .models import SemesterInfo
+from .utils import canonicalize_semester_code
+
+logger = logging.getLogger(__name__)
+
+# Keyed by the calendar version, which every change to a semester bumps, so
+# ids of renamed or deleted semesters stop being served in every process.
+_semester_ids = TTLCache(maxsize=1024, ttl=15 * 60)
+
+
+def resolve_semester_ids(
+    codes: Iterable[str], defaults: Callable[[str], dict] | None = None
+) -> dict[str, int]:
+    """
+    Map raw semester codes to SemesterInfo ids, treating variants of a code
+    (``JAN26``, ``Jan-26``, ``JAN/2026``) as the same semester.
+
+    Codes are resolved from a process-wide cache first, then with one query
+    for all the misses. When ``defaults`` is given, semesters that still do
+    not exist are created in one bulk insert from ``defaults(raw_code)``,
+    keeping the first submitted spelling as their code. Otherwise they are
+    left out of the result.
+
+    Ids are only cached once the caller's transaction commits, so semesters
+    created in a transaction that is rolled back are never served.
+    """
+    by_canonical = {}
+    for code in codes:
+        by_canonical.setdefault(canonicalize_semester_code(code), []).append(code)
+
+    version = calendar_version()
+    ids = {}
+    misses = []
+    for canonical in by_canonical:
+        semester_id = _semester_ids.get((version, canonical))
+        if semester_id is MISSING:
+            misses.append(canonical)
+        else:
+            ids[canonical] = semester_id
+
+    if misses:
+        found = _lookup(misses)
+        missing = [canonical for canonical in misses if canonical not in found]
+        if missing and defaults is not None:
+            SemesterInfo.objects.bulk_create(
+                [
+                    SemesterInfo(
+                        code=by_canonical[canonical][0],
+                        canonical_code=canonical,
+                        **defaults(by_canonical[canonical][0]),
+                    )
+                    for canonical in missing
+                ],
+                ignore_conflicts=True,
+            )
+            found.update(_lookup(missing))
+            # bulk_create sends no post_save for the calendar to see.
+            transaction.on_commit(invalidate_calendar)
+            logger.info("Created semesters", extra={"codes": missing})
+
+        transaction.on_commit(lambda: _remember(found))
+        ids.update(found)
+
+    return {
+        code: ids[canonical]
+        for canonical, raw_codes in by_canonical.items()
+        if canonical in ids
+        for code in raw_codes
+    }
+
+
+def _remember(found: dict[str, int]) -> None:
+    # Read the version again: creating semesters has just bumped it.
+    version = calendar_version()
+    for canonical, semester_id in found.items():
+        _semester_ids.set((version, canonical), semester_id)
+
+
+def _lookup(canonical_codes: list[str]) -> dict[str, int]:
+    # Older data can hold several spellings of one semester; the first one
+    # created wins so that every variant keeps resolving to the same row.
+    found = {}
+    for canonical, semester_id in (
+        SemesterInfo.objects.filter(canonical_code__in=canonical_codes)
+        .order_by("canonical_code", "id")
+        .values_list("canonical_code", "id")
+    ):
+        found.setdefault(canonical, semester_id)
+    return found
+
+
+def resolve_registration_semester(code: str, institution_id=None) -> int | None:
+    """
+    Resolve the semester a student registers courses under. The institution's
+    current intake is answered from the semester calendar and created on first
+    use; any other semester must already exist.
+    """
+    intake = current_intake(institution_id)
+    if canonicalize_semester_code(code) != canonicalize_semester_code(intake.code):
+        return resolve_semester_ids([code]).get(code)
+    if intake.semester_id is not None:
+        return intake.semester_id
+    return resolve_semester_ids(
+        [code], defaults=lambda raw_code: intake.defaults()
+    ).get(code)
@@ -1,6 +1,7 @@
 from rest_framework import serializers
 from .models import SemesterInfo, Course, Grade, ScheduleEntry, Transcript, StudentCourseEnrollment
 from institutions.models import Institution
+from professor.eager import EagerLoadingMixin
 from users.models import StudentProfile
 
 class SemesterInfoSerializer(serializers.ModelSerializer):
@@ -8,7 +9,7 @@ class SemesterInfoSerializer(serializers.ModelSerializer):
     model = SemesterInfo
     fields = '__all__'
 
-class CourseSerializer(serializers.ModelSerializer):
+class CourseSerializer(EagerLoadingMixin, serializers.ModelSerializer):
   semester_code = serializers.CharField(source='semester.code', read_only=True)
   semester_name = serializers.CharField(source='semester.name', read_only=True)
   semester_id = serializers.IntegerField(write_only=True, required=True)
@@ -95,7 +96,7 @@ class TranscriptSerializer(serializers.ModelSerializer):
       validated_data['student'] = StudentProfile.objects.get(id=student_profile_id)
     return super().update(instance, validated_data)
 
-class StudentCourseEnrollmentSerializer(serializers.ModelSerializer):
+class StudentCourseEnrollmentSerializer(EagerLoadingMixin, serializers.ModelSerializer):
   student_id = serializers.CharField(source='student.student_id', read_only=True)
   student_name = serializers.CharField(source='student.user.username', read_only=True)
   course_code = serializers.CharField(source='course.course_code', read_only=True)
@@ -158,3 +159,25 @@ class CourseRegistrationSerializer(serializers.Serializer):
 
     # Enrollment
     student_id = serializers.CharField(required=True)
+
+
+class RegisteredCourseSerializer(serializers.Serializer):
+    course_code = serializers.CharField(max_length=50)
+    course_name = serializers.CharField(max_length=255)
+
+    # Optional fields
+    course_id = serializers.CharField(required=False, allow_null=True)
+    instructor = serializers.CharField(required=False, allow_null=True)
+    credits = serializers.FloatField(required=False, allow_null=True)
+    department = serializers.CharField(required=False, allow_null=True)
+
+    # Schedule info
+    meeting_times = serializers.JSONField(required=False, default=dict)
+    campus = serializers.CharField(required=False, allow_null=True)
+
+
+class CourseRegistrationBatchSerializer(serializers.Serializer):
+    semester = serializers.CharField(max_length=50)
+    institution = serializers.IntegerField()
+    student_id = serializers.CharField(required=True)
+    courses = RegisteredCourseSerializer(many=True, allow_empty=False)
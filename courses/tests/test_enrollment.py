@@ -0,0 +1,85 @@
+from datetime import date
+
+from django.test import TestCase
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from courses.models import Course, SemesterInfo, StudentCourseEnrollment
+from courses.views import StudentCourseEnrollmentView
+from institutions.models import Institution
+from users.models import StudentProfile, User
+
+
+class StudentCourseEnrollmentViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.institution = Institution.objects.create(
+            name="Test University",
+            web_pages=["https://test.ac.ke"],
+            domains=["test.ac.ke"],
+            country="Kenya",
+        )
+        cls.semester = SemesterInfo.objects.create(
+            code="JAN26",
+            name="JAN26",
+            start_date=date(2026, 1, 1),
+            end_date=date(2026, 4, 30),
+        )
+        cls.user = User.objects.create(name="Test Student", username="student")
+        cls.student = StudentProfile.objects.create(
+            user=cls.user, student_id="S-0001", institution=cls.institution
+        )
+        for course_code in ("BIT101", "BIT102", "BIT103"):
+            Course.objects.create(
+                course_code=course_code,
+                course_name=f"Course {course_code}",
+                semester=cls.semester,
+                institution=cls.institution,
+            )
+
+    def enroll(self, course_codes, semester_id=None):
+        request = APIRequestFactory().post(
+            "/api/courses/enrollments/",
+            {
+                "student_id": self.student.student_id,
+                "semester_id": semester_id or self.semester.pk,
+                "course_codes": course_codes,
+            },
+            format="json",
+        )
+        force_authenticate(request, user=self.user)
+        return StudentCourseEnrollmentView.as_view()(request)
+
+    def test_enrolls_in_every_course(self):
+        # Student, courses, existing enrollments, insert, new ids.
+        with self.assertNumQueries(5):
+            response = self.enroll(["BIT101", "BIT102", "BIT103"])
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["total_created"], 3)
+        self.assertEqual(response.data["duplicates"], [])
+        self.assertEqual(
+            StudentCourseEnrollment.objects.filter(student=self.student).count(), 3
+        )
+
+    def test_reports_duplicates(self):
+        self.enroll(["BIT101"])
+        response = self.enroll(["BIT101", "BIT102"])
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(
+            [course["course_code"] for course in response.data["created"]],
+            ["BIT102"],
+        )
+        self.assertEqual(response.data["duplicates"], ["BIT101"])
+
+    def test_only_duplicates_is_ok(self):
+        self.enroll(["BIT101"])
+        response = self.enroll(["BIT101"])
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["total_created"], 0)
+        self.assertEqual(response.data["total_duplicates"], 1)
+
+    def test_invalid_semester(self):
+        self.assertEqual(self.enroll(["BIT101"], semester_id="abc").status_code, 400)
+        self.assertEqual(self.enroll(["BIT101"], semester_id=999).status_code, 404)
@@ -0,0 +1,109 @@
+import time
+from datetime import date
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+
+from courses import intakes
+from courses.intakes import DEFAULT_WINDOWS, SemesterCalendar
+from courses.models import IntakeWindow, SemesterInfo
+from institutions.models import Institution
+
+# Trimester windows with a gap over the long vacation and one that runs
+# into the next year.
+TRIMESTERS = [
+    ("T1", 2, 1, 5, None),
+    ("T2", 9, 1, 12, 20),
+    ("T3", 12, 21, 1, 31),
+]
+
+
+class SemesterCalendarTests(SimpleTestCase):
+    def setUp(self):
+        self.calendar = SemesterCalendar(
+            {None: list(DEFAULT_WINDOWS), 7: TRIMESTERS}, {"MAY26": 42}
+        )
+
+    def current(self, day, institution_id=None):
+        return self.calendar.current(institution_id, day)
+
+    def test_default_windows(self):
+        self.assertEqual(self.current(date(2026, 1, 1)).code, "Jan2026")
+        self.assertEqual(self.current(date(2026, 4, 30)).code, "Jan2026")
+        self.assertEqual(self.current(date(2026, 5, 1)).code, "May2026")
+        self.assertEqual(self.current(date(2026, 12, 31)).code, "Sep2026")
+
+    def test_intake_dates(self):
+        intake = self.current(date(2024, 3, 15))
+        self.assertEqual(intake.name, "Jan 2024")
+        self.assertEqual(intake.start_date, date(2024, 1, 1))
+        self.assertEqual(intake.end_date, date(2024, 4, 30))
+        self.assertEqual(intake.year, 2024)
+
+    def test_semester_ids_are_matched_by_canonical_code(self):
+        self.assertEqual(self.current(date(2026, 6, 1)).semester_id, 42)
+        self.assertIsNone(self.current(date(2026, 2, 1)).semester_id)
+
+    def test_window_running_into_the_next_year(self):
+        intake = self.current(date(2027, 1, 10), institution_id=7)
+        self.assertEqual(intake.code, "T32026")
+        self.assertEqual(intake.start_date, date(2026, 12, 21))
+        self.assertEqual(intake.end_date, date(2027, 1, 31))
+        self.assertEqual(self.current(date(2026, 12, 21), 7).code, "T32026")
+
+    def test_day_between_windows_is_in_the_latest_to_start(self):
+        self.assertEqual(self.current(date(2026, 7, 15), 7).code, "T12026")
+        self.assertEqual(self.current(date(2026, 1, 31), 7).code, "T32025")
+        self.assertEqual(self.current(date(2026, 2, 1), 7).code, "T12026")
+
+    def test_institutions_without_windows_use_the_defaults(self):
+        self.assertEqual(self.current(date(2026, 7, 15), 8).code, "May2026")
+
+
+class CalendarInvalidationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        intakes._version_check.clear()
+        intakes._state.update(calendar=None, version=None)
+
+    def test_new_semester_is_picked_up(self):
+        today = date(2026, 2, 10)
+        self.assertIsNone(intakes.current_intake(None, today).semester_id)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            semester = SemesterInfo.objects.create(
+                code="JAN-26",
+                name="Jan 2026",
+                start_date=date(2026, 1, 1),
+                end_date=date(2026, 4, 30),
+            )
+
+        self.assertEqual(intakes.current_intake(None, today).semester_id, semester.pk)
+
+    def test_window_changes_are_picked_up(self):
+        institution = Institution.objects.create(
+            name="Test University",
+            web_pages=["https://test.ac.ke"],
+            domains=["test.ac.ke"],
+            country="Kenya",
+        )
+        today = date(2026, 7, 15)
+        self.assertEqual(intakes.current_intake(institution.pk, today).code, "May2026")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            IntakeWindow.objects.create(
+                institution=institution, label="T1", start_month=6, end_month=9
+            )
+
+        self.assertEqual(intakes.current_intake(institution.pk, today).code, "T12026")
+
+    def test_version_bumped_by_another_process_is_seen(self):
+        calendar = intakes.get_calendar()
+        # What invalidate_calendar does in another process.
+        cache.set(intakes.CALENDAR_VERSION_KEY, "bumped", None)
+
+        self.assertIs(intakes.get_calendar(), calendar)
+        later = time.monotonic() + intakes.VERSION_CHECK_INTERVAL + 1
+        with mock.patch("professor.cache.time.monotonic", return_value=later):
+            self.assertIsNot(intakes.get_calendar(), calendar)
@@ -0,0 +1,119 @@
+from datetime import date
+from unittest import mock
+
+from django.db import IntegrityError
+from django.test import TestCase
+
+from courses.models import Course, SemesterInfo, StudentCourseEnrollment
+from courses.registration import register_courses
+from institutions.models import Institution
+from users.models import StudentProfile, User
+
+
+def item(course_code, course_name, **fields):
+    return {
+        "course_code": course_code,
+        "course_name": course_name,
+        "meeting_times": {},
+        **fields,
+    }
+
+
+class RegisterCoursesTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.institution = Institution.objects.create(
+            name="Test University",
+            web_pages=["https://test.ac.ke"],
+            domains=["test.ac.ke"],
+            country="Kenya",
+        )
+        cls.semester = SemesterInfo.objects.create(
+            code="JAN26",
+            name="JAN26",
+            start_date=date(2026, 1, 1),
+            end_date=date(2026, 4, 30),
+        )
+        user = User.objects.create(name="Test Student", username="student")
+        cls.student = StudentProfile.objects.create(
+            user=user, student_id="S-0001", institution=cls.institution
+        )
+        cls.existing = Course.objects.create(
+            course_code="BIT101",
+            course_name="Old name",
+            semester=cls.semester,
+            institution=cls.institution,
+            instructor="Dr. Kamau",
+        )
+
+    def register(self, items):
+        return register_courses(
+            self.student.pk, self.institution.pk, self.semester.pk, items
+        )
+
+    def enrolled_codes(self):
+        return set(
+            StudentCourseEnrollment.objects.filter(student=self.student).values_list(
+                "course__course_code", flat=True
+            )
+        )
+
+    def test_counts_created_and_updated_courses(self):
+        result = self.register(
+            [
+                item("BIT101", "Programming I", campus="Main"),
+                item("BIT102", "Databases"),
+            ]
+        )
+
+        self.assertEqual(result.created_count, 1)
+        self.assertEqual(result.updated_count, 1)
+        self.assertEqual(
+            set(result.enrollment_ids), {course.pk for course in result.courses}
+        )
+        self.assertEqual(self.enrolled_codes(), {"BIT101", "BIT102"})
+
+        self.existing.refresh_from_db()
+        self.assertEqual(self.existing.course_name, "Programming I")
+        self.assertEqual(self.existing.location, "Main")
+        # Fields left out of an item are kept.
+        self.assertEqual(self.existing.instructor, "Dr. Kamau")
+
+    def test_registering_again_updates_without_new_enrollments(self):
+        self.register([item("BIT102", "Databases")])
+        result = self.register([item("BIT102", "Databases II")])
+
+        self.assertEqual(result.created_count, 0)
+        self.assertEqual(result.updated_count, 1)
+        self.assertEqual(result.enrollment_ids, {})
+        self.assertEqual(
+            Course.objects.get(course_code="BIT102").course_name, "Databases II"
+        )
+
+    def test_last_item_wins_for_a_repeated_code(self):
+        result = self.register(
+            [
+                item("BIT103", "First", instructor="A"),
+                item("BIT103", "Second", instructor="B"),
+            ]
+        )
+
+        self.assertEqual(result.created_count, 1)
+        self.assertEqual(len(result.courses), 1)
+        course = Course.objects.get(course_code="BIT103")
+        self.assertEqual((course.course_name, course.instructor), ("Second", "B"))
+
+    def test_failed_enrollment_rolls_back_the_courses(self):
+        with mock.patch(
+            "courses.registration.enroll_student",
+            side_effect=IntegrityError("enrollment failed"),
+        ):
+            with self.assertRaises(IntegrityError):
+                self.register(
+                    [item("BIT101", "Programming I"), item("BIT104", "Networks")]
+                )
+
+        self.assertFalse(Course.objects.filter(course_code="BIT104").exists())
+        self.existing.refresh_from_db()
+        self.assertEqual(self.existing.course_name, "Old name")
+        self.assertEqual(self.enrolled_codes(), set())
@@ -0,0 +1,71 @@
+from datetime import date
+
+from django.core.cache import cache
+from django.db import transaction
+from django.test import TestCase
+
+from courses import intakes, semesters
+from courses.models import SemesterInfo
+
+
+def defaults(code):
+    return {
+        "name": f"{code} semester",
+        "start_date": date(2026, 1, 1),
+        "end_date": date(2026, 4, 30),
+    }
+
+
+class ResolveSemesterIdsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        intakes._version_check.clear()
+        semesters._semester_ids.clear()
+
+    def test_variants_resolve_to_one_semester_stored_as_submitted(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            ids = semesters.resolve_semester_ids(
+                ["Jan2026", "JAN/26"], defaults=defaults
+            )
+
+        semester = SemesterInfo.objects.get()
+        self.assertEqual(ids, {"Jan2026": semester.pk, "JAN/26": semester.pk})
+        self.assertEqual(semester.code, "Jan2026")
+        self.assertEqual(semester.canonical_code, "JAN26")
+
+    def test_existing_semesters_are_cached(self):
+        semester = SemesterInfo.objects.create(code="MAY26", **defaults("MAY26"))
+        with self.captureOnCommitCallbacks(execute=True):
+            intakes.invalidate_calendar()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(
+                semesters.resolve_semester_ids(["May-26"]), {"May-26": semester.pk}
+            )
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                semesters.resolve_semester_ids(["MAY/2026"]),
+                {"MAY/2026": semester.pk},
+            )
+
+    def test_semesters_created_in_a_rolled_back_transaction_are_not_cached(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    semesters.resolve_semester_ids(["SEP26"], defaults=defaults)
+                    raise ValueError("a later chunk failed")
+            except ValueError:
+                pass
+
+        self.assertEqual(len(semesters._semester_ids), 0)
+        self.assertEqual(semesters.resolve_semester_ids(["SEP26"]), {})
+
+    def test_deleted_semesters_are_not_served(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            semesters.resolve_semester_ids(["SEP26"], defaults=defaults)
+        self.assertEqual(len(semesters._semester_ids), 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            SemesterInfo.objects.get(code="SEP26").delete()
+
+        self.assertEqual(semesters.resolve_semester_ids(["SEP26"]), {})
@@ -5,6 +5,7 @@ urlpatterns = [
     path('student/', views.StudentCoursesListView.as_view(), name='student-courses'),
     path('enrollments/', views.StudentCourseEnrollmentView.as_view(), name='enrollment-create'),
     path('register/', views.CourseRegistrationView.as_view(), name='course-registration'),
+    path('register/batch/', views.CourseRegistrationBatchView.as_view(), name='course-registration-batch'),
     path('', views.CoursesListView.as_view(), name='courses-list'),
     path('create/', views.CourseCreateView.as_view(), name='course-create'),
     path('<int:id>/', views.CourseDetailView.as_view(), name='course-detail'),
@@ -0,0 +1,13 @@
+import re
+
+_YEAR = re.compile(r"^([A-Z]+)20(\d{2})$")
+
+
+def canonicalize_semester_code(code: str) -> str:
+    """
+    Reduce a semester code to the form its variants share: upper case, with
+    punctuation and whitespace removed and a four-digit year shortened, so
+    ``Jan-26``, ``JAN/26`` and ``Jan2026`` all become ``JAN26``.
+    """
+    canonical = re.sub(r"[^A-Z0-9]", "", code.upper())
+    return _YEAR.sub(r"\1\2", canonical) or code.strip()
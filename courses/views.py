@@ -4,12 +4,19 @@ from rest_framework.generics import CreateAPIView, ListAPIView, RetrieveAPIView
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from examtimetable.cache import bump_student_version
 from institutions.models import Institution
+from professor.eager import EagerQuerysetMixin
 from professor.pagination import ResultsSetPagination
 from users.models import StudentProfile
 
+from .enrollments import enroll_student
 from .models import Course, SemesterInfo, StudentCourseEnrollment
+from .registration import register_courses
+from .intakes import current_intake
+from .semesters import resolve_registration_semester
 from .serializers import (
+    CourseRegistrationBatchSerializer,
     CourseRegistrationSerializer,
     CourseSerializer,
     SemesterInfoSerializer,
@@ -38,7 +45,9 @@ class StudentCoursesListView(APIView):
                 {"error": "Student not found"}, status=status.HTTP_404_NOT_FOUND
             )
 
-        enrollments = StudentCourseEnrollment.objects.filter(student=student)
+        enrollments = StudentCourseEnrollmentSerializer.eager_load(
+            StudentCourseEnrollment.objects.filter(student=student)
+        )
         serializer = StudentCourseEnrollmentSerializer(enrollments, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
@@ -46,7 +55,9 @@ class StudentCoursesListView(APIView):
 class StudentCourseEnrollmentView(APIView):
     """
     Enroll student in a course.
-    Works for a single course and multiple courses.
+    Works for a single course and multiple courses; courses the student is
+    already enrolled in are reported as duplicates. Answers 201 when any
+    enrollment was created, and 200 when every course was a duplicate.
     """
 
     def post(self, request):
@@ -60,6 +71,14 @@ class StudentCourseEnrollmentView(APIView):
                 {"error": "semester_id is required"}, status=status.HTTP_400_BAD_REQUEST
             )
 
+        try:
+            semester_id = int(semester_id)
+        except (TypeError, ValueError):
+            return Response(
+                {"error": "semester_id must be an integer"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
         if not (student_id or student_profile_id):
             return Response(
                 {"error": "student_id or student_profile_id is required"},
@@ -78,25 +97,38 @@ class StudentCourseEnrollmentView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+        enrollment_status = request.data.get("enrollment_status", "enrolled")
+        if enrollment_status is not None and (
+            not isinstance(enrollment_status, str) or len(enrollment_status) > 50
+        ):
+            return Response(
+                {
+                    "error": "enrollment_status must be a string of at most 50 characters"
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
         try:
             if student_profile_id:
-                student = StudentProfile.objects.get(id=student_profile_id)
+                student = StudentProfile.objects.only("id").get(id=student_profile_id)
             else:
-                student = StudentProfile.objects.get(student_id=student_id)
-
-            semester = SemesterInfo.objects.get(id=semester_id)
-        except StudentProfile.DoesNotExist:
+                student = StudentProfile.objects.only("id").get(student_id=student_id)
+        except (StudentProfile.DoesNotExist, ValueError):
             return Response(
                 {"error": "Student not found"}, status=status.HTTP_404_NOT_FOUND
             )
-        except SemesterInfo.DoesNotExist:
-            return Response(
-                {"error": "Semester not found"}, status=status.HTTP_404_NOT_FOUND
-            )
 
-        courses = Course.objects.filter(course_code__in=course_codes, semester=semester)
+        courses = list(
+            Course.objects.filter(
+                course_code__in=course_codes, semester_id=semester_id
+            ).only("id", "course_code", "course_name")
+        )
 
-        if not courses.exists():
+        if not courses:
+            if not SemesterInfo.objects.filter(id=semester_id).exists():
+                return Response(
+                    {"error": "Semester not found"}, status=status.HTTP_404_NOT_FOUND
+                )
             return Response(
                 {
                     "error": "No courses found for the given course_codes in this semester"
@@ -104,7 +136,7 @@ class StudentCourseEnrollmentView(APIView):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        found_course_codes = set(courses.values_list("course_code", flat=True))
+        found_course_codes = {course.course_code for course in courses}
         missing_codes = set(course_codes) - found_course_codes
         if missing_codes:
             return Response(
@@ -116,47 +148,29 @@ class StudentCourseEnrollmentView(APIView):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        created = []
-        errors = []
-
-        for course in courses:
-            enrollment_data = {
-                "student_profile_id": student.id,
-                "course_id": course.id,
-                "semester_id": semester.id,
-                "enrollment_status": request.data.get("enrollment_status", "enrolled"),
-            }
-
-            serializer = StudentCourseEnrollmentSerializer(data=enrollment_data)
-            if serializer.is_valid():
-                try:
-                    enrollment = serializer.save()
-                    created.append(
-                        {
-                            "course_code": course.course_code,
-                            "course_name": course.course_name,
-                            "enrollment_id": enrollment.id,
-                        }
-                    )
-                except Exception as e:
-                    errors.append({"course_code": course.course_code, "error": str(e)})
-            else:
-                errors.append(
-                    {"course_code": course.course_code, "error": serializer.errors}
-                )
-
-        response_status = (
-            status.HTTP_201_CREATED if created else status.HTTP_400_BAD_REQUEST
+        enrollment_ids, duplicates = enroll_student(
+            student.pk, semester_id, courses, enrollment_status
         )
+        if enrollment_ids:
+            bump_student_version(student.pk)
 
+        created = [
+            {
+                "course_code": course.course_code,
+                "course_name": course.course_name,
+                "enrollment_id": enrollment_ids[course.id],
+            }
+            for course in courses
+            if course.id in enrollment_ids
+        ]
         return Response(
             {
                 "created": created,
-                "errors": errors,
+                "duplicates": [course.course_code for course in duplicates],
                 "total_created": len(created),
-                "total_errors": len(errors),
+                "total_duplicates": len(duplicates),
             },
-            status=response_status,
+            status=status.HTTP_201_CREATED if created else status.HTTP_200_OK,
         )
 
 
@@ -186,67 +200,19 @@ class CourseRegistrationView(APIView):
                 {"error": "Institution not found"}, status=status.HTTP_404_NOT_FOUND
             )
 
-        # Verify Semester or create based on current time
-        import calendar
-        from datetime import date
-
-        # Helper to get current semester info
-        today = date.today()
-        year = today.year
-        month = today.month
-
-        if 1 <= month <= 4:
-            current_intake = "Jan"
-            start_month = 1
-            end_month = 4
-        elif 5 <= month <= 8:
-            current_intake = "May"
-            start_month = 5
-            end_month = 8
-        else:
-            current_intake = "Sep"
-            start_month = 9
-            end_month = 12
-
-        current_sem_code = f"{current_intake}{year}"
-        current_sem_name = f"{current_intake} {year}"
-        current_start_date = date(year, start_month, 1)
-        # End date approx
-        if end_month == 12:
-            current_end_date = date(year, 12, 31)
-        else:
-            last_day = calendar.monthrange(year, end_month)[1]
-            current_end_date = date(year, end_month, last_day)
-
-        target_semester = None
-
-        if semester_code == current_sem_code:
-            target_semester, _ = SemesterInfo.objects.get_or_create(
-                code=current_sem_code,
-                defaults={
-                    "name": current_sem_name,
-                    "start_date": current_start_date,
-                    "end_date": current_end_date,
-                    "year": year,
-                    "is_current": True,
+        # Verify Semester, creating the current intake on first use
+        semester_id = resolve_registration_semester(semester_code, institution_id)
+        if semester_id is None:
+            return Response(
+                {
+                    "error": f"Semester {semester_code} not found and does not match current intake {current_intake(institution_id).code}"
                 },
+                status=status.HTTP_404_NOT_FOUND,
             )
-        else:
-            try:
-                target_semester = SemesterInfo.objects.get(code=semester_code)
-            except SemesterInfo.DoesNotExist:
-                return Response(
-                    {
-                        "error": f"Semester {semester_code} not found and does not match current intake {current_sem_code}"
-                    },
-                    status=status.HTTP_404_NOT_FOUND,
-                )
-
-        semester = target_semester
 
         course, created = Course.objects.get_or_create(
             course_code=course_code,
-            semester=semester,
+            semester_id=semester_id,
             institution=institution,
             defaults={
                 "course_name": data.get("course_name"),
@@ -281,9 +247,11 @@ class CourseRegistrationView(APIView):
         enrollment, enrolled = StudentCourseEnrollment.objects.get_or_create(
             student=student,
             course=course,
-            semester=semester,
+            semester_id=semester_id,
             defaults={"enrollment_status": "enrolled"},
         )
+        if enrolled:
+            bump_student_version(student.pk)
 
         return Response(
             {
@@ -301,7 +269,72 @@ class CourseRegistrationView(APIView):
         )
 
 
-class CoursesListView(ListAPIView):
+class CourseRegistrationBatchView(APIView):
+    """
+    Register a student's whole course list and enroll them in every course.
+    Body: student_id, institution, semester and courses (a list of the
+    course fields CourseRegistrationView accepts).
+    """
+
+    def post(self, request):
+        serializer = CourseRegistrationBatchSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        data = serializer.validated_data
+        semester_code = data["semester"]
+
+        if not Institution.objects.filter(institution_id=data["institution"]).exists():
+            return Response(
+                {"error": "Institution not found"}, status=status.HTTP_404_NOT_FOUND
+            )
+
+        semester_id = resolve_registration_semester(semester_code, data["institution"])
+        if semester_id is None:
+            return Response(
+                {
+                    "error": f"Semester {semester_code} not found and does not match current intake {current_intake(data['institution']).code}"
+                },
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        student = (
+            StudentProfile.objects.filter(student_id=data["student_id"])
+            .only("id")
+            .first()
+        )
+        if student is None:
+            return Response(
+                {"error": "Student not found"}, status=status.HTTP_404_NOT_FOUND
+            )
+
+        result = register_courses(
+            student.pk, data["institution"], semester_id, data["courses"]
+        )
+        if result.enrollment_ids:
+            bump_student_version(student.pk)
+
+        return Response(
+            {
+                "courses": [
+                    {
+                        "course_code": course.course_code,
+                        "course_name": course.course_name,
+                        "id": course.course_id,
+                        "created": course.pk in result.created_course_ids,
+                        "enrolled": course.pk in result.enrollment_ids,
+                    }
+                    for course in result.courses
+                ],
+                "created_count": result.created_count,
+                "updated_count": result.updated_count,
+                "enrolled_count": len(result.enrollment_ids),
+            },
+            status=status.HTTP_201_CREATED,
+        )
+
+
+class CoursesListView(EagerQuerysetMixin, ListAPIView):
     """
     List all courses (paginated).
     Admin endpoint.
@@ -323,7 +356,7 @@ class CourseCreateView(CreateAPIView):
     queryset = Course.objects.all()
 
 
-class CourseDetailView(RetrieveAPIView):
+class CourseDetailView(EagerQuerysetMixin, RetrieveAPIView):
     """
     Retrieve a specific course by ID.
     """
@@ -1,4 +1,5 @@
 from django.contrib import admin
-from .models import ExamSchedule
+from .models import ExamSchedule, IngestionJob
 
 admin.site.register(ExamSchedule)
+admin.site.register(IngestionJob)
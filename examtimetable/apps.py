@@ -6,4 +6,4 @@ class ExamtimetableConfig(AppConfig):
     name = 'examtimetable'
 
     def ready(self) -> None:
-        pass
+        from . import checks  # noqa: F401
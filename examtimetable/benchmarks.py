@@ -0,0 +1,186 @@
+"""
+Synthetic exam timetables shaped like the uploads we receive from partner
+institutions, used by the ingestion benchmarks. Output is deterministic for a
+given profile, size, revision and seed, so runs can be compared over time.
+"""
+
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone as dt_timezone
+from typing import Callable, Iterator
+
+from django.conf import settings
+from django.core.management.base import CommandError
+from django.db import connection
+
+BENCHMARK_SEMESTER = "BENCH26"
+BENCHMARK_SIZES = [100, 1_000, 10_000, 100_000]
+
+EAT = dt_timezone(timedelta(hours=3))
+FIRST_EXAM_DAY = datetime(2026, 4, 6, tzinfo=EAT)
+DAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"]
+
+
+@dataclass(frozen=True)
+class Profile:
+    name: str
+    prefixes: list[str]
+    venues: list[str]
+    # (hour, minute) each exam session starts at
+    sessions: list[tuple[int, int]]
+    hours: int
+    extra: Callable[[random.Random, dict], dict]
+    # Nursing codes carry a cohort letter that normalization strips.
+    cohort_suffix: bool = False
+
+
+def _daystar(rng: random.Random, exam: dict) -> dict:
+    return {
+        "day": exam["day"],
+        "time": exam["time"],
+        "shift": rng.choice(["Day", "Evening"]),
+    }
+
+
+def _kca(rng: random.Random, exam: dict) -> dict:
+    return {
+        "day": exam["day"],
+        "time": exam["time"],
+        "program": rng.choice(["BBIT", "BSD", "BCOM", "DIT", "BSc IS"]),
+        "campus": rng.choice(["Town", "Main"]),
+    }
+
+
+def _strath(rng: random.Random, exam: dict) -> dict:
+    return {
+        "day": exam["day"],
+        "time": exam["time"],
+        "group": rng.choice(["A", "B", "C", "D"]),
+        "lecturer": f"Dr. {rng.choice(['Mwangi', 'Otieno', 'Wanjiku', 'Kamau'])}",
+    }
+
+
+def _nursing(rng: random.Random, exam: dict) -> dict:
+    return {
+        "day": exam["day"],
+        "time": exam["time"],
+        "campus": rng.choice(["Athi River", "Nairobi", "Valley Road"]),
+        "invigilator": f"Invigilator {rng.randint(1, 40)}",
+    }
+
+
+PROFILES = {
+    "du": Profile(
+        name="Daystar University",
+        prefixes=["ACS", "BIL", "COM", "CHD", "DEV", "ECO", "ENG", "MAT", "PSY"],
+        venues=[f"LR {n}" for n in range(1, 31)] + ["Auditorium", "ICT Lab 2"],
+        sessions=[(8, 30), (11, 30), (14, 30)],
+        hours=2,
+        extra=_daystar,
+    ),
+    "kca": Profile(
+        name="KCA University",
+        prefixes=["BIT", "BBM", "BAC", "BCS", "DIT", "BSD"],
+        venues=[f"Room {n}" for n in range(101, 141)] + ["Lab 1", "Lab 3"],
+        sessions=[(9, 0), (12, 0), (15, 0)],
+        hours=2,
+        extra=_kca,
+    ),
+    "strath": Profile(
+        name="Strathmore University",
+        prefixes=["BBS", "BCM", "ICS", "HLE", "BFS", "DBT", "LLB"],
+        venues=[f"STMB {n}" for n in range(1, 25)] + ["Auditorium", "Phase 2 Hall"],
+        sessions=[(8, 0), (11, 0), (14, 0)],
+        hours=3,
+        extra=_strath,
+    ),
+    "nursing": Profile(
+        name="Nursing School",
+        prefixes=["NUR", "NUP"],
+        venues=["Skills Lab", "Hall A", "Hall B", "Anatomy Lab"],
+        sessions=[(9, 0), (14, 0)],
+        hours=3,
+        extra=_nursing,
+        cohort_suffix=True,
+    ),
+}
+
+
+def add_allow_writes_argument(parser) -> None:
+    parser.add_argument(
+        "--allow-writes",
+        action="store_true",
+        help="Run even though DEBUG is off. The benchmark creates and deletes "
+        "institutions and exam schedules in the configured database.",
+    )
+
+
+def ensure_writes_allowed(options: dict) -> None:
+    """
+    Refuse to benchmark outside DEBUG unless --allow-writes was passed, as the
+    benchmarks create and delete institutions, exams and the BENCH26 semester
+    in whatever database is configured.
+    """
+    if settings.DEBUG or options["allow_writes"]:
+        return
+    database = connection.settings_dict
+    raise CommandError(
+        "Refusing to write benchmark data to database "
+        f"{database['NAME']!r} on {database.get('HOST') or 'localhost'!r} with "
+        "DEBUG off. Point the settings at a scratch database and pass "
+        "--allow-writes."
+    )
+
+
+def _course_code(profile: Profile, index: int) -> str:
+    prefix = profile.prefixes[index % len(profile.prefixes)]
+    number = 100 + index // len(profile.prefixes)
+    if profile.cohort_suffix:
+        return f"{prefix} {number}{'AB'[index % 2]}"
+    return f"{prefix} {number}"
+
+
+def generate_items(
+    profile_name: str,
+    institution_id: int,
+    count: int,
+    revision: int = 0,
+    seed: int = 0,
+) -> Iterator[dict]:
+    """
+    Yield ``count`` ingestion items for one institution. Every item has a
+    distinct course code. A non-zero ``revision`` moves one exam in ten to
+    another venue, which is what a corrected draft usually looks like.
+    """
+    profile = PROFILES[profile_name]
+    rng = random.Random(f"{profile_name}:{seed}")
+    per_day = len(profile.sessions)
+
+    for index in range(count):
+        slot = index % (per_day * 15)
+        day = FIRST_EXAM_DAY + timedelta(days=(slot // per_day) // 5 * 7)
+        day += timedelta(days=(slot // per_day) % 5)
+        hour, minute = profile.sessions[slot % per_day]
+        start = day.replace(hour=hour, minute=minute)
+        end = start + timedelta(hours=profile.hours)
+
+        venue = rng.choice(profile.venues)
+        if revision and index % 10 == 0:
+            position = profile.venues.index(venue) + revision
+            venue = profile.venues[position % len(profile.venues)]
+
+        exam = {
+            "day": DAYS[start.weekday()],
+            "time": f"{start:%I:%M%p}-{end:%I:%M%p}",
+        }
+        yield {
+            "institution": institution_id,
+            "semester": BENCHMARK_SEMESTER,
+            "course_code": _course_code(profile, index),
+            "start_time": start.isoformat(),
+            "end_time": end.isoformat(),
+            "venue": venue,
+            "coordinator": f"Coordinator {rng.randint(1, 60)}",
+            "hrs": str(profile.hours),
+            "raw_data": profile.extra(rng, exam),
+        }
@@ -0,0 +1,174 @@
+import hashlib
+import json
+import logging
+import uuid
+from typing import Any, Callable, Iterable
+
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.response import Response
+
+from professor.cache import MISSING, TTLCache
+
+from .models import ExamSchedule
+
+logger = logging.getLogger(__name__)
+
+LOCAL_TTL = 30
+SHARED_TIMEOUT = 60 * 60 * 24
+# Versions outlive the responses cached under them. One that expires is
+# replaced by a new random version, which only costs a cache miss.
+VERSION_TIMEOUT = SHARED_TIMEOUT * 7
+
+LATEST_SEMESTER_KEY = "examtimetable:latest-semester:{institution_id}"
+TIMETABLE_VERSION_KEY = "examtimetable:version:{institution_id}"
+STUDENT_VERSION_KEY = "examtimetable:student-version:{student_id}"
+RESPONSE_KEY = "examtimetable:response:{digest}"
+
+_latest_semesters = TTLCache(maxsize=4096, ttl=LOCAL_TTL)
+
+
+def get_latest_semester_id(institution_id=None) -> int | None:
+    """
+    Resolve the semester of the most recent exam for an institution, or across
+    all institutions when ``institution_id`` is None.
+
+    The answer is held in a short-lived in-process cache in front of the shared
+    cache, and is invalidated whenever an ingestion for the institution commits.
+    """
+    key = LATEST_SEMESTER_KEY.format(institution_id=institution_id or "all")
+
+    semester_id = _latest_semesters.get(key)
+    if semester_id is not MISSING:
+        return semester_id
+
+    semester_id = cache.get(key, MISSING)
+    if semester_id is MISSING:
+        exams = ExamSchedule.objects.all()
+        if institution_id:
+            exams = exams.filter(institution_id=institution_id)
+        semester_id = (
+            exams.order_by("-start_time", "-pk")
+            .values_list("semester_id", flat=True)
+            .first()
+        )
+        cache.set(key, semester_id, SHARED_TIMEOUT)
+
+    _latest_semesters.set(key, semester_id)
+    return semester_id
+
+
+def invalidate_latest_semester(institution_ids: Iterable) -> None:
+    """
+    Drop the cached latest semester for the given institutions, and for the
+    cross-institution view that depends on all of them.
+    """
+    keys = [
+        LATEST_SEMESTER_KEY.format(institution_id=institution_id)
+        for institution_id in institution_ids
+    ]
+    keys.append(LATEST_SEMESTER_KEY.format(institution_id="all"))
+
+    for key in keys:
+        _latest_semesters.delete(key)
+    cache.delete_many(keys)
+    logger.info("Invalidated latest exam semester cache", extra={"keys": keys})
+
+
+def _get_version(key: str) -> str:
+    # Versions are random tokens rather than counters so that an evicted key
+    # can never resurrect a stale response cached under an old version.
+    version = cache.get(key)
+    if version is None:
+        version = uuid.uuid4().hex
+        if not cache.add(key, version, VERSION_TIMEOUT):
+            version = cache.get(key, version)
+    return version
+
+
+def get_timetable_version(institution_id) -> str:
+    return _get_version(TIMETABLE_VERSION_KEY.format(institution_id=institution_id))
+
+
+def get_student_version(student_id) -> str:
+    return _get_version(STUDENT_VERSION_KEY.format(student_id=student_id))
+
+
+def bump_timetable_version(institution_ids: Iterable) -> None:
+    cache.set_many(
+        {
+            TIMETABLE_VERSION_KEY.format(
+                institution_id=institution_id
+            ): uuid.uuid4().hex
+            for institution_id in institution_ids
+        },
+        VERSION_TIMEOUT,
+    )
+
+
+def bump_student_version(student_id) -> None:
+    """
+    Invalidate cached exam responses for a student whose enrollments changed.
+    """
+    cache.set(
+        STUDENT_VERSION_KEY.format(student_id=student_id),
+        uuid.uuid4().hex,
+        VERSION_TIMEOUT,
+    )
+
+
+def invalidate_timetables(institution_ids: Iterable) -> None:
+    """
+    Called once an ingestion commits: forget the latest semester and move every
+    cached timetable response for the institutions to a new version.
+    """
+    institution_ids = list(institution_ids)
+    invalidate_latest_semester(institution_ids)
+    bump_timetable_version(institution_ids)
+
+
+def _etag_matches(request, etag: str) -> bool:
+    if_none_match = request.headers.get("If-None-Match")
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return "*" in candidates or any(
+        candidate.removeprefix("W/") == etag for candidate in candidates
+    )
+
+
+def cached_exam_response(
+    request, scope: dict, versions: list[str], build: Callable[[], Any]
+) -> Response:
+    """
+    Serve exam timetable data from the shared cache.
+
+    ``scope`` describes what was asked for (view, institution, semester, codes)
+    and ``versions`` are the timetable/enrollment versions it depends on, so
+    the cache key and the strong ETag change exactly when ingestion or an
+    enrollment change makes the response stale. ``build`` is only called on a
+    miss and must return plain, picklable data.
+    """
+    fingerprint = json.dumps(
+        {
+            "scope": scope,
+            "versions": versions,
+            "format": getattr(request, "accepted_media_type", None),
+        },
+        sort_keys=True,
+        default=str,
+    )
+    digest = hashlib.sha256(fingerprint.encode()).hexdigest()
+    etag = f'"{digest}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+    if request.method in ("GET", "HEAD") and _etag_matches(request, etag):
+        return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    key = RESPONSE_KEY.format(digest=digest)
+    data = cache.get(key)
+    if data is None:
+        data = build()
+        cache.set(key, data, SHARED_TIMEOUT)
+
+    return Response(data, status=status.HTTP_200_OK, headers=headers)
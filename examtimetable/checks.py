@@ -0,0 +1,31 @@
+import sys
+
+from django.core.checks import Tags, Warning, register
+
+from professor.cache import is_process_local
+
+
+@register(Tags.caches)
+def check_shared_cache(app_configs, **kwargs):
+    """
+    The ingestion worker, the event consumers and management commands such as
+    load_exam_schedules run outside the web process and invalidate cached
+    timetables, snapshots, semester calendars and user snapshots through the
+    default cache. With a process-local cache the web process never sees
+    those invalidations and serves stale data until entries expire.
+
+    Not reported under the test runner, where a single process does all the
+    work and a local-memory cache is what we want.
+    """
+    if sys.argv[1:2] == ["test"] or not is_process_local():
+        return []
+
+    return [
+        Warning(
+            "The default cache is local to each process, so invalidations made "
+            "by the ingestion worker, the event consumers and management "
+            "commands never reach the web process.",
+            hint="Set REDIS_URL so that every process shares the cache.",
+            id="examtimetable.W001",
+        )
+    ]
@@ -0,0 +1,193 @@
+import csv
+import io
+import logging
+from typing import Iterable, Iterator
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .ingestion import (
+    CHUNK_SIZE,
+    OPTIONAL_FIELDS,
+    UNIQUE_CONSTRAINT,
+    UPSERT_COLUMNS,
+    IngestResult,
+    IngestValidationError,
+    InvalidPayloadError,
+    build_row,
+    chunked,
+    deduplicate_items,
+    publish_ingestion,
+    validate_items,
+)
+from .models import ExamSchedule
+
+logger = logging.getLogger(__name__)
+
+STAGING_TABLE = "examtimetable_examschedule_staging"
+KEY_COLUMNS = ("course_code", "institution_id", "semester_id")
+
+
+class RowStream(io.RawIOBase):
+    """
+    A read-only file object that renders rows to CSV lazily, so COPY can pull
+    an unbounded number of rows without them ever being held in memory.
+
+    psycopg2 replaces any exception raised while COPY reads with a generic
+    error, so the original is kept in ``error`` for the caller to re-raise.
+    """
+
+    def __init__(self, rows: Iterable[list]) -> None:
+        self.error = None
+        self._rows = iter(rows)
+        self._buffer = b""
+        self._text = io.StringIO()
+        self._writer = csv.writer(self._text, lineterminator="\n")
+
+    def readable(self) -> bool:
+        return True
+
+    def _render(self, row: list) -> bytes:
+        self._text.seek(0)
+        self._text.truncate()
+        self._writer.writerow(row)
+        return self._text.getvalue().encode()
+
+    def readinto(self, buffer) -> int:
+        while len(self._buffer) < len(buffer):
+            try:
+                row = next(self._rows, None)
+            except Exception as e:
+                self.error = e
+                raise
+            if row is None:
+                break
+            self._buffer += self._render(row)
+
+        size = min(len(buffer), len(self._buffer))
+        buffer[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+
+def _csv_value(value):
+    # COPY's CSV format reads an unquoted empty field as NULL.
+    if value is None:
+        return ""
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return value
+
+
+def copy_load(
+    items: Iterable[dict], chunk_size: int = CHUNK_SIZE, publish: bool = True
+) -> IngestResult:
+    """
+    Load exam items through a staging table in a single transaction.
+
+    Items are validated in chunks, streamed into a temporary table with COPY,
+    then merged into examtimetable_examschedule with one
+    INSERT ... SELECT ... ON CONFLICT statement. Duplicate keys keep the last
+    occurrence. Unlike ``ingest_items``, every column is overwritten on
+    conflict, which suits full timetable (re)loads; rows whose content_hash
+    already matches are left untouched. Any validation error aborts the
+    whole load.
+    """
+    result = IngestResult()
+    semester_cache = {}
+    state = {"staged": 0, "skipped": 0}
+    now = timezone.now()
+
+    def staged_rows() -> Iterator[list]:
+        sequence = 0
+        for index, chunk in enumerate(chunked(items, chunk_size)):
+            try:
+                validated_data = validate_items(chunk, semester_cache)
+            except IngestValidationError as e:
+                e.chunk_index = index
+                e.offset = result.processed_count
+                raise
+            deduplicated_items, skipped_count = deduplicate_items(validated_data)
+            result.processed_count += len(chunk)
+            state["skipped"] += skipped_count
+
+            for key, item_data in deduplicated_items.items():
+                row = build_row(key, item_data, now, OPTIONAL_FIELDS)
+                sequence += 1
+                yield [sequence] + [
+                    _csv_value(row[column]) for column in UPSERT_COLUMNS
+                ]
+            state["staged"] = sequence
+
+    try:
+        distinct = _merge(staged_rows(), result)
+    except (IngestValidationError, InvalidPayloadError) as e:
+        e.result = result
+        raise
+
+    # Duplicates within a chunk were dropped in Python, duplicates across
+    # chunks by DISTINCT ON.
+    result.skipped_count = state["skipped"] + (state["staged"] - distinct)
+    logger.info(
+        "Loaded exam schedules with COPY",
+        extra={"staged": state["staged"], **result.counts()},
+    )
+
+    if publish and result.pairs:
+        publish_ingestion(result.pairs)
+    return result
+
+
+def _merge(rows: Iterator[list], result: IngestResult) -> int:
+    """
+    COPY the rows into a staging table and merge them, adding the counts and
+    written pairs to ``result``. Returns the number of distinct keys staged.
+    """
+    table = connection.ops.quote_name(ExamSchedule._meta.db_table)
+    columns = ", ".join(connection.ops.quote_name(column) for column in UPSERT_COLUMNS)
+    keys = ", ".join(connection.ops.quote_name(column) for column in KEY_COLUMNS)
+    assignments = ", ".join(
+        f"{connection.ops.quote_name(column)} = EXCLUDED.{connection.ops.quote_name(column)}"
+        for column in UPSERT_COLUMNS
+        if column != "created_at" and column not in KEY_COLUMNS
+    )
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE TEMP TABLE {STAGING_TABLE} ON COMMIT DROP AS "
+            f"SELECT {columns} FROM {table} WITH NO DATA"
+        )
+        cursor.execute(f"ALTER TABLE {STAGING_TABLE} ADD COLUMN seq bigint")
+        stream = RowStream(rows)
+        try:
+            cursor.cursor.copy_expert(
+                f"COPY {STAGING_TABLE} (seq, {columns}) FROM STDIN WITH (FORMAT csv)",
+                stream,
+            )
+        except Exception:
+            if stream.error is not None:
+                raise stream.error from None
+            raise
+        cursor.execute(
+            f"SELECT COUNT(*) FROM (SELECT DISTINCT {keys} FROM {STAGING_TABLE}) AS s"
+        )
+        (distinct,) = cursor.fetchone()
+        cursor.execute(
+            f"INSERT INTO {table} ({columns}) "
+            f"SELECT DISTINCT ON ({keys}) {columns} FROM {STAGING_TABLE} "
+            f"ORDER BY {keys}, seq DESC "
+            f"ON CONFLICT ON CONSTRAINT {UNIQUE_CONSTRAINT} "
+            f"DO UPDATE SET {assignments} "
+            f"WHERE {table}.content_hash IS DISTINCT FROM EXCLUDED.content_hash "
+            f"RETURNING (xmax = 0) AS inserted, institution_id, semester_id"
+        )
+        written = cursor.fetchall()
+        for inserted, institution_id, semester_id in written:
+            if inserted:
+                result.created_count += 1
+            else:
+                result.updated_count += 1
+            result.pairs.add((institution_id, semester_id))
+        result.unchanged_count = distinct - len(written)
+
+    return distinct
@@ -0,0 +1,38 @@
+"""
+Per-institution exam timetable parsers. Each parser is registered under a
+name and reads one sheet at a time, so workbooks stream through in bounded
+memory and straight into ingestion via ``iter_exam_items``.
+"""
+
+from .common import to_ingest_item
+from .daystar import parse_school_exam_timetable
+from .kca import kca_extractor
+from .nursing import nursing_exam_timetable_parser
+from .parallel import parse_timetables
+from .registry import (
+    PARSERS,
+    get_parser,
+    iter_exam_items,
+    iter_timetable,
+    parser_for_domains,
+    register,
+)
+from .strath import strath_extractor
+from .workbook import Workbook, is_spreadsheet
+
+__all__ = [
+    "PARSERS",
+    "Workbook",
+    "get_parser",
+    "is_spreadsheet",
+    "iter_exam_items",
+    "iter_timetable",
+    "kca_extractor",
+    "nursing_exam_timetable_parser",
+    "parse_school_exam_timetable",
+    "parse_timetables",
+    "parser_for_domains",
+    "register",
+    "strath_extractor",
+    "to_ingest_item",
+]
@@ -0,0 +1,259 @@
+import re
+from datetime import date, datetime, time, timedelta
+from typing import Iterable, Iterator
+from zoneinfo import ZoneInfo
+
+from dateutil import parser as date_parser
+
+# Every institution we parse timetables for is in Kenya.
+EXAM_TIMEZONE = ZoneInfo("Africa/Nairobi")
+DEFAULT_VENUE = "TBA"
+
+# How far down a sheet to look for its header row.
+HEADER_SCAN_ROWS = 30
+
+COURSE_CODE = re.compile(r"\b([A-Z]{2,5})\s?-?\s?(\d{3,4}[A-Z]?)\b")
+TIME_RANGE = re.compile(
+    r"(\d{1,2})(?:[:.]?(\d{2}))?\s*(am|pm|a\.m\.|p\.m\.)?\s*"
+    r"(?:-|–|—|to)\s*"
+    r"(\d{1,2})(?:[:.]?(\d{2}))?\s*(am|pm|a\.m\.|p\.m\.|hrs)?",
+    re.IGNORECASE,
+)
+WEEKDAY = re.compile(
+    r"\b(mon|tue|tues|wed|thu|thur|thurs|fri|sat|sun)(day|nesday|rsday|urday)?\b",
+    re.IGNORECASE,
+)
+
+# Header spellings seen across institutions, per field.
+FIELD_HEADERS = {
+    "date": ("date", "day/date", "date/day", "day & date", "exam date"),
+    "day": ("day",),
+    "time": ("time", "session", "exam time", "time slot"),
+    "course_code": ("course code", "unit code", "code", "course", "unit"),
+    "course_title": ("course title", "unit title", "course name", "unit name", "title"),
+    "venue": ("venue", "room", "rooms", "exam venue", "hall"),
+    "coordinator": ("coordinator", "course coordinator", "examiner"),
+    "invigilator": ("invigilator", "invigilators", "chief invigilator"),
+    "lecturer": ("lecturer", "lecturers"),
+    "campus": ("campus",),
+    "program": ("programme", "program", "class", "cohort"),
+    "group": ("group", "grp", "stream"),
+    "hrs": ("hrs", "hours", "duration"),
+}
+
+
+def clean(value) -> str:
+    """
+    Render a cell as single-spaced text; whole floats lose their ``.0``.
+    """
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return " ".join(str(value).split())
+
+
+def find_course_codes(text: str) -> list[str]:
+    return [
+        f"{prefix} {number}" for prefix, number in COURSE_CODE.findall(text.upper())
+    ]
+
+
+def match_headers(row: tuple, fields: Iterable[str]) -> dict[str, int]:
+    """
+    Map the fields to column indexes using the header spellings in
+    FIELD_HEADERS. The first matching column wins.
+    """
+    columns = {}
+    labels = [clean(cell).lower().rstrip(":") for cell in row]
+    for field in fields:
+        for index, label in enumerate(labels):
+            if label in FIELD_HEADERS[field] and index not in columns.values():
+                columns[field] = index
+                break
+    return columns
+
+
+def iter_table(
+    rows: Iterable[tuple],
+    fields: Iterable[str],
+    fill_down: Iterable[str] = ("date", "day", "time"),
+) -> Iterator[dict]:
+    """
+    Yield one dict per course code found in a tabular sheet.
+
+    The header row is the first row, within HEADER_SCAN_ROWS, that names a
+    course code column and at least one other field. Merged cells only hold a
+    value in their first row, so ``fill_down`` fields carry their last value
+    forward. Header rows repeated further down (multi-page exports) are
+    skipped. A cell listing several codes (``BIT 1101/BBIT 1101``) yields one
+    dict per code.
+    """
+    fields = list(fields)
+    rows = iter(rows)
+    columns = None
+    for index, row in enumerate(rows):
+        if index >= HEADER_SCAN_ROWS:
+            return
+        candidate = match_headers(row, fields)
+        if "course_code" in candidate and len(candidate) > 1:
+            columns = candidate
+            break
+    if columns is None:
+        return
+
+    carried = {}
+    for row in rows:
+        values = {
+            field: clean(row[column]) if column < len(row) else ""
+            for field, column in columns.items()
+        }
+        raw_values = {
+            field: row[column] if column < len(row) else None
+            for field, column in columns.items()
+        }
+        if match_headers(row, fields) == columns:
+            continue
+
+        for field in fill_down:
+            if field not in columns:
+                continue
+            if values[field]:
+                carried[field] = raw_values[field]
+            elif field in carried:
+                raw_values[field] = carried[field]
+                values[field] = clean(carried[field])
+
+        for course_code in find_course_codes(values.get("course_code", "")):
+            entry = {
+                field: value
+                for field, value in values.items()
+                if value and field != "course_code"
+            }
+            entry["course_code"] = course_code
+            if isinstance(raw_values.get("date"), (date, datetime)):
+                entry["date"] = raw_values["date"]
+            if isinstance(raw_values.get("time"), (time, datetime)):
+                entry["time"] = raw_values["time"]
+            yield entry
+
+
+def parse_date(value, default_year: int | None = None) -> date | None:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    text = WEEKDAY.sub(" ", clean(value))
+    text = re.sub(r"(\d)(st|nd|rd|th)\b", r"\1", text, flags=re.IGNORECASE)
+    if not re.search(r"\d", text):
+        return None
+    default = datetime(default_year or date.today().year, 1, 1)
+    try:
+        return date_parser.parse(
+            text, dayfirst=True, fuzzy=True, default=default
+        ).date()
+    except (ValueError, OverflowError):
+        return None
+
+
+def _clock(hour: str, minute: str | None, meridiem: str | None) -> time | None:
+    hour, minute = int(hour), int(minute or 0)
+    meridiem = (meridiem or "").lower().replace(".", "")
+    if meridiem == "pm" and hour < 12:
+        hour += 12
+    elif meridiem == "am" and hour == 12:
+        hour = 0
+    if hour > 23 or minute > 59:
+        return None
+    return time(hour, minute)
+
+
+def parse_time_range(value) -> tuple[time, time] | None:
+    """
+    Parse ``8:30AM-10:30AM``, ``0830-1030HRS``, ``2.00 - 5.00pm`` and the
+    like. A start without am/pm follows the end's, and bare hours before 7
+    are taken to be afternoon exams.
+    """
+    if isinstance(value, (time, datetime)):
+        return None
+    match = TIME_RANGE.search(clean(value))
+    if not match:
+        return None
+    start_hour, start_minute, start_meridiem = match.group(1, 2, 3)
+    end_hour, end_minute, end_meridiem = match.group(4, 5, 6)
+    if end_meridiem and end_meridiem.lower() == "hrs":
+        end_meridiem = None
+
+    if not start_meridiem and end_meridiem:
+        start_meridiem = end_meridiem
+        start_after_end = int(start_hour) > int(end_hour)
+        if end_meridiem.lower().startswith("p") and start_after_end:
+            # 11.00-1.00pm starts in the morning; 12.00-3.00pm at noon.
+            start_meridiem = "pm" if int(start_hour) == 12 else "am"
+
+    start = _clock(start_hour, start_minute, start_meridiem)
+    end = _clock(end_hour, end_minute, end_meridiem)
+    if start is None or end is None:
+        return None
+    if not start_meridiem and start.hour < 7:
+        start = start.replace(hour=start.hour + 12)
+    if not end_meridiem and end.hour < 7:
+        end = end.replace(hour=end.hour + 12)
+    return start, end
+
+
+def to_ingest_item(
+    entry: dict, institution_id, semester: str | None = None, default_hours: int = 2
+) -> dict | None:
+    """
+    Convert a parsed timetable entry into the ingestion contract. Returns None
+    when the entry has no usable date or time.
+    """
+    exam_date = parse_date(entry.get("date")) or parse_date(entry.get("day"))
+    if exam_date is None:
+        return None
+
+    time_range = parse_time_range(entry.get("time"))
+    hours = entry.get("hrs")
+    if time_range:
+        start, end = time_range
+    elif isinstance(entry.get("time"), (time, datetime)):
+        start = (
+            entry["time"] if isinstance(entry["time"], time) else entry["time"].time()
+        )
+        end = None
+    else:
+        return None
+
+    starts_at = datetime.combine(exam_date, start, tzinfo=EXAM_TIMEZONE)
+    if end is None:
+        duration = (
+            float(hours)
+            if hours and re.fullmatch(r"\d+(\.\d+)?", str(hours))
+            else default_hours
+        )
+        ends_at = starts_at + timedelta(hours=duration)
+    else:
+        ends_at = datetime.combine(exam_date, end, tzinfo=EXAM_TIMEZONE)
+    if not hours:
+        hours = clean(round((ends_at - starts_at).total_seconds() / 3600, 1))
+
+    raw_data = {
+        key: value.isoformat() if isinstance(value, (date, time)) else value
+        for key, value in entry.items()
+        if key not in ("course_code", "venue", "coordinator", "hrs")
+    }
+    item = {
+        "institution": institution_id,
+        "course_code": entry["course_code"],
+        "start_time": starts_at.isoformat(),
+        "end_time": ends_at.isoformat(),
+        "venue": entry.get("venue") or DEFAULT_VENUE,
+        "hrs": str(hours),
+        "raw_data": raw_data,
+    }
+    if semester:
+        item["semester"] = semester
+    if entry.get("coordinator"):
+        item["coordinator"] = entry["coordinator"]
+    return item
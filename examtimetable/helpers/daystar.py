@@ -0,0 +1,19 @@
+from typing import Iterator
+
+from .common import iter_table
+from .registry import iter_timetable, register
+
+FIELDS = ("date", "day", "time", "course_code", "course_title", "venue", "hrs")
+
+
+@register("daystar")
+def parse_daystar_sheet(rows: Iterator[tuple], sheet_name: str) -> Iterator[dict]:
+    """
+    Daystar publishes one table per school, with the date and time merged
+    across every exam in the session.
+    """
+    yield from iter_table(rows, FIELDS)
+
+
+def parse_school_exam_timetable(path) -> list[dict]:
+    return list(iter_timetable(path, "daystar"))
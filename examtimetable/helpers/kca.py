@@ -0,0 +1,29 @@
+from typing import Iterator
+
+from .common import iter_table
+from .registry import iter_timetable, register
+
+FIELDS = (
+    "date",
+    "day",
+    "time",
+    "course_code",
+    "course_title",
+    "program",
+    "venue",
+    "invigilator",
+    "campus",
+)
+
+
+@register("kca")
+def parse_kca_sheet(rows: Iterator[tuple], sheet_name: str) -> Iterator[dict]:
+    """
+    KCA lists every exam on its own row with the programme taking it, and
+    merges the date and session cells.
+    """
+    yield from iter_table(rows, FIELDS)
+
+
+def kca_extractor(path) -> list[dict]:
+    return list(iter_timetable(path, "kca"))
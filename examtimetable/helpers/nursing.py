@@ -0,0 +1,30 @@
+from typing import Iterator
+
+from .common import iter_table
+from .registry import iter_timetable, register
+
+FIELDS = (
+    "date",
+    "day",
+    "time",
+    "course_code",
+    "course_title",
+    "campus",
+    "venue",
+    "coordinator",
+    "invigilator",
+    "hrs",
+)
+
+
+@register("nursing")
+def parse_nursing_sheet(rows: Iterator[tuple], sheet_name: str) -> Iterator[dict]:
+    """
+    Nursing timetables are tabular, one sheet per campus or cohort, and name
+    a coordinator and invigilator for every paper.
+    """
+    yield from iter_table(rows, FIELDS, fill_down=("date", "day", "time", "campus"))
+
+
+def nursing_exam_timetable_parser(path) -> list[dict]:
+    return list(iter_timetable(path, "nursing"))
@@ -0,0 +1,81 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable
+
+from .common import to_ingest_item
+from .registry import get_parser
+from .workbook import Workbook
+
+
+def parse_sheet(task: tuple) -> tuple[list[dict], int]:
+    """
+    Parse one sheet of one workbook into ingestion items. Runs in a worker
+    process, which opens its own copy of the workbook. Returns the items and
+    the number of entries left out for lacking a date or time.
+    """
+    path, sheet_name, parser_name, institution_id, semester = task
+    parser = get_parser(parser_name)
+    items = []
+    skipped = 0
+    with Workbook(path) as workbook:
+        for entry in parser(workbook.iter_rows(sheet_name), sheet_name):
+            entry.setdefault("sheet", sheet_name)
+            item = to_ingest_item(entry, institution_id, semester)
+            if item is None:
+                skipped += 1
+            else:
+                items.append(item)
+    return items, skipped
+
+
+def merge_items(results: Iterable[list[dict]]) -> tuple[list[dict], int]:
+    """
+    Merge per-sheet items, keeping the last item for each (institution,
+    semester, course_code). Returns the items and the number of duplicates
+    dropped.
+    """
+    merged = {}
+    duplicates = 0
+    for items in results:
+        for item in items:
+            key = (item["institution"], item.get("semester"), item["course_code"])
+            if key in merged:
+                duplicates += 1
+            merged[key] = item
+    return list(merged.values()), duplicates
+
+
+def parse_timetables(
+    paths: Iterable,
+    parser_name: str,
+    institution_id,
+    semester: str | None = None,
+    workers: int | None = None,
+) -> tuple[list[dict], int, int]:
+    """
+    Parse every sheet of every workbook in a pool of ``workers`` processes
+    (one per CPU by default) and merge the results for a single upsert.
+    Sheets are merged in file and sheet order, so a later sheet wins a
+    duplicate just as it would when parsing sequentially.
+
+    Returns the merged items, the number of duplicates dropped and the number
+    of entries left out for lacking a date or time.
+    """
+    get_parser(parser_name)
+    tasks = []
+    for path in paths:
+        with Workbook(path) as workbook:
+            tasks.extend(
+                (str(path), sheet_name, parser_name, institution_id, semester)
+                for sheet_name in workbook.sheet_names
+            )
+
+    workers = min(workers or os.cpu_count() or 1, len(tasks) or 1)
+    if workers == 1:
+        results = [parse_sheet(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(parse_sheet, tasks))
+
+    items, duplicates = merge_items(items for items, _ in results)
+    return items, duplicates, sum(skipped for _, skipped in results)
@@ -0,0 +1,81 @@
+import logging
+from typing import Callable, Iterator
+
+from .common import to_ingest_item
+from .workbook import Workbook
+
+logger = logging.getLogger(__name__)
+
+# A sheet parser takes a sheet's rows and name and yields timetable entries.
+SheetParser = Callable[[Iterator[tuple], str], Iterator[dict]]
+
+PARSERS: dict[str, SheetParser] = {}
+
+# The parser to use for an institution, by one of its email domains.
+DOMAIN_PARSERS = {
+    "daystar.ac.ke": "daystar",
+    "kca.ac.ke": "kca",
+    "strathmore.edu": "strath",
+}
+
+
+def register(name: str) -> Callable[[SheetParser], SheetParser]:
+    def decorator(parser: SheetParser) -> SheetParser:
+        PARSERS[name] = parser
+        return parser
+
+    return decorator
+
+
+def get_parser(name: str) -> SheetParser:
+    try:
+        return PARSERS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown timetable parser '{name}'. "
+            f"Expected one of: {', '.join(sorted(PARSERS))}"
+        )
+
+
+def parser_for_domains(domains) -> str | None:
+    for domain in domains or ():
+        domain = domain.lower().removeprefix("www.")
+        for known, parser_name in DOMAIN_PARSERS.items():
+            if domain == known or domain.endswith(f".{known}"):
+                return parser_name
+    return None
+
+
+def iter_timetable(path, parser_name: str) -> Iterator[dict]:
+    """
+    Stream the entries of every sheet in a workbook through a registered
+    parser, one row at a time.
+    """
+    parser = get_parser(parser_name)
+    with Workbook(path) as workbook:
+        for sheet_name in workbook.sheet_names:
+            for entry in parser(workbook.iter_rows(sheet_name), sheet_name):
+                entry.setdefault("sheet", sheet_name)
+                yield entry
+
+
+def iter_exam_items(
+    path, parser_name: str, institution_id, semester: str | None = None
+) -> Iterator[dict]:
+    """
+    Parse a workbook into ingestion items, ready for ``ingest_stream``.
+    Entries without a usable date or time are logged and left out.
+    """
+    skipped = 0
+    for entry in iter_timetable(path, parser_name):
+        item = to_ingest_item(entry, institution_id, semester)
+        if item is None:
+            skipped += 1
+            continue
+        yield item
+
+    if skipped:
+        logger.warning(
+            "Skipped timetable entries without a date or time",
+            extra={"parser": parser_name, "skipped": skipped},
+        )
@@ -0,0 +1,81 @@
+import re
+from typing import Iterator
+
+from .common import (
+    HEADER_SCAN_ROWS,
+    clean,
+    find_course_codes,
+    parse_date,
+    parse_time_range,
+)
+from .registry import iter_timetable, register
+
+GROUP = re.compile(r"\b(?:grp|group)\.?\s*([A-Z0-9]+)\b", re.IGNORECASE)
+VENUE_SEPARATOR = re.compile(r"\s+(?:-|–|@|venue:?)\s+", re.IGNORECASE)
+
+
+def _session_columns(row: tuple) -> dict[int, str]:
+    return {
+        index: clean(cell)
+        for index, cell in enumerate(row)
+        if parse_time_range(cell) is not None
+    }
+
+
+def _entries(cell: str) -> Iterator[dict]:
+    # A cell lists one paper per line, e.g. "BBS 3104 Grp A - STMB 5".
+    for line in re.split(r"[\n;]+", cell):
+        codes = find_course_codes(line)
+        if not codes:
+            continue
+        parts = VENUE_SEPARATOR.split(line)
+        venue = clean(parts[-1]) if len(parts) > 1 else ""
+        if find_course_codes(venue):
+            venue = ""
+        group = GROUP.search(line)
+        for course_code in codes:
+            entry = {"course_code": course_code}
+            if venue:
+                entry["venue"] = venue
+            if group:
+                entry["group"] = group.group(1).upper()
+            yield entry
+
+
+@register("strath")
+def parse_strath_sheet(rows: Iterator[tuple], sheet_name: str) -> Iterator[dict]:
+    """
+    Strathmore publishes a grid: one row per exam day, one column per
+    session, and the papers sitting in that session listed in the cell.
+    """
+    rows = iter(rows)
+    sessions = None
+    for index, row in enumerate(rows):
+        if index >= HEADER_SCAN_ROWS:
+            return
+        sessions = _session_columns(row)
+        if len(sessions) >= 2:
+            break
+    else:
+        return
+
+    day_column = min(sessions) - 1
+    current_day = None
+    for row in rows:
+        if day_column >= 0 and day_column < len(row) and row[day_column]:
+            current_day = row[day_column]
+        if current_day is None or parse_date(current_day) is None:
+            continue
+
+        for column, session in sessions.items():
+            if column >= len(row) or not row[column]:
+                continue
+            for entry in _entries(str(row[column])):
+                entry["date"] = current_day
+                entry["day"] = clean(current_day)
+                entry["time"] = session
+                yield entry
+
+
+def strath_extractor(path) -> list[dict]:
+    return list(iter_timetable(path, "strath"))
@@ -0,0 +1,78 @@
+from pathlib import Path
+from typing import Iterator
+
+import openpyxl
+import xlrd
+
+SPREADSHEET_SUFFIXES = (".xlsx", ".xlsm", ".xls")
+
+
+class Workbook:
+    """
+    Read-only, streaming access to the sheets of an .xlsx or .xls file.
+
+    .xlsx files are opened in openpyxl's read_only mode, so rows are parsed
+    from the sheet XML as they are iterated. .xls files are opened with
+    on_demand=True, so only the sheet being read is loaded, and it is
+    unloaded again once it has been iterated.
+    """
+
+    def __init__(self, path) -> None:
+        self.path = Path(path)
+        suffix = self.path.suffix.lower()
+        if suffix not in SPREADSHEET_SUFFIXES:
+            raise ValueError(f"Unsupported spreadsheet type: {self.path.name}")
+        self.is_xls = suffix == ".xls"
+        self._book = None
+
+    def __enter__(self) -> "Workbook":
+        if self.is_xls:
+            self._book = xlrd.open_workbook(str(self.path), on_demand=True)
+        else:
+            self._book = openpyxl.load_workbook(
+                self.path, read_only=True, data_only=True
+            )
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self.is_xls:
+            self._book.release_resources()
+        else:
+            self._book.close()
+        self._book = None
+
+    @property
+    def sheet_names(self) -> list[str]:
+        if self.is_xls:
+            return self._book.sheet_names()
+        return self._book.sheetnames
+
+    def iter_rows(self, sheet_name: str) -> Iterator[tuple]:
+        """
+        Yield each row of a sheet as a tuple of plain Python values; dates
+        come back as datetimes for both formats.
+        """
+        if not self.is_xls:
+            yield from self._book[sheet_name].iter_rows(values_only=True)
+            return
+
+        sheet = self._book.sheet_by_name(sheet_name)
+        try:
+            for index in range(sheet.nrows):
+                yield tuple(self._xls_value(cell) for cell in sheet.row(index))
+        finally:
+            self._book.unload_sheet(sheet_name)
+
+    def _xls_value(self, cell):
+        if cell.ctype in (xlrd.XL_CELL_EMPTY, xlrd.XL_CELL_BLANK):
+            return None
+        if cell.ctype == xlrd.XL_CELL_DATE:
+            try:
+                return xlrd.xldate_as_datetime(cell.value, self._book.datemode)
+            except (ValueError, xlrd.xldate.XLDateError):
+                return cell.value
+        return cell.value
+
+
+def is_spreadsheet(name: str) -> bool:
+    return str(name).lower().endswith(SPREADSHEET_SUFFIXES)
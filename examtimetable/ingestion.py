@@ -0,0 +1,480 @@
+import codecs
+import hashlib
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import timedelta
+from itertools import islice
+from typing import Callable, Iterable, Iterator
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from courses.semesters import resolve_semester_ids
+
+from .cache import invalidate_timetables
+from .models import ExamSchedule
+from .snapshots import rebuild_snapshots
+from .utils import normalize_course_code
+from .validation import validate_exam_items
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 500
+READ_SIZE = 64 * 1024
+# What may follow the part of a streamed number read so far. The empty string
+# stands for the end of the buffer.
+NUMBER_CONTINUATIONS = frozenset(["", *"0123456789.eE+-"])
+
+UPSERT_BATCH_SIZE = 1000
+UNIQUE_CONSTRAINT = "unique_exam_schedule"
+
+UPSERT_COLUMNS = [
+    "course_code",
+    "normalized_course_code",
+    "semester_id",
+    "start_time",
+    "end_time",
+    "venue",
+    "coordinator",
+    "hrs",
+    "institution_id",
+    "raw_data",
+    "content_hash",
+    "created_at",
+    "updated_at",
+]
+# Always overwritten on conflict.
+UPDATE_FIELDS = [
+    "start_time",
+    "end_time",
+    "venue",
+    "hrs",
+    "normalized_course_code",
+    "content_hash",
+    "updated_at",
+]
+# Only overwritten when the client sent them.
+OPTIONAL_FIELDS = ("coordinator", "raw_data")
+# The ingestible values a row's content_hash is computed from, together with
+# whichever optional fields were written.
+HASHED_FIELDS = (
+    "course_code",
+    "semester_id",
+    "institution_id",
+    "start_time",
+    "end_time",
+    "venue",
+    "hrs",
+)
+
+
+class IngestValidationError(Exception):
+    """
+    Raised when a batch of exam items fails validation. ``field_errors`` keeps
+    the DRF ``many=True`` shape: one error dict per submitted item.
+    """
+
+    def __init__(self, field_errors, chunk_index=None, offset=0):
+        super().__init__("The request payload is invalid.")
+        self.field_errors = field_errors
+        self.chunk_index = chunk_index
+        self.offset = offset
+        self.result = None
+
+
+class InvalidPayloadError(ValueError):
+    """
+    Raised when a streamed payload is not well-formed NDJSON or a JSON array.
+    """
+
+    def __init__(self, message):
+        super().__init__(message)
+        self.result = None
+
+
+def error_details(error: Exception) -> list[dict]:
+    """
+    Describe an ingestion error in the API's ``errors`` format.
+    """
+    if isinstance(error, InvalidPayloadError):
+        return [{"code": "invalid_request", "message": str(error)}]
+
+    detail = {
+        "code": "invalid_request",
+        "message": "The request payload is invalid.",
+        "field_errors": error.field_errors,
+    }
+    if error.chunk_index is not None:
+        detail["chunk"] = error.chunk_index
+        detail["offset"] = error.offset
+    return [detail]
+
+
+@dataclass
+class IngestResult:
+    created_count: int = 0
+    updated_count: int = 0
+    unchanged_count: int = 0
+    skipped_count: int = 0
+    processed_count: int = 0
+    pairs: set = field(default_factory=set)
+    chunks: list = field(default_factory=list)
+
+    def add_chunk(self, index: int, size: int, chunk: "IngestResult") -> None:
+        self.created_count += chunk.created_count
+        self.updated_count += chunk.updated_count
+        self.unchanged_count += chunk.unchanged_count
+        self.skipped_count += chunk.skipped_count
+        self.processed_count += size
+        self.pairs |= chunk.pairs
+        self.chunks.append(
+            {
+                "chunk": index,
+                "items": size,
+                "created_count": chunk.created_count,
+                "updated_count": chunk.updated_count,
+                "unchanged_count": chunk.unchanged_count,
+                "skipped_count": chunk.skipped_count,
+            }
+        )
+
+    def counts(self) -> dict:
+        return {
+            "created_count": self.created_count,
+            "updated_count": self.updated_count,
+            "unchanged_count": self.unchanged_count,
+            "skipped_count": self.skipped_count,
+        }
+
+
+def _new_semester(code: str) -> dict:
+    today = timezone.now().date()
+    return {"name": code, "start_date": today, "end_date": today + timedelta(weeks=13)}
+
+
+def resolve_semester_codes(items: list, semester_cache: dict) -> None:
+    """
+    Replace semester codes on the raw items with SemesterInfo ids, creating
+    semesters that do not exist yet. All codes in the batch are resolved
+    together, so a batch costs at most one lookup and one insert.
+    """
+    codes = {
+        item["semester"]
+        for item in items
+        if isinstance(item, dict) and isinstance(item.get("semester"), str)
+    }
+    missing = codes - semester_cache.keys()
+    if missing:
+        semester_cache.update(resolve_semester_ids(missing, defaults=_new_semester))
+
+    for item in items:
+        if isinstance(item, dict) and isinstance(item.get("semester"), str):
+            item["semester"] = semester_cache[item["semester"]]
+
+
+def validate_items(items_data: list, semester_cache: dict) -> list[dict]:
+    """
+    Resolve semester codes and validate a batch of raw exam items, returning
+    the validated data or raising IngestValidationError.
+    """
+    resolve_semester_codes(items_data, semester_cache)
+
+    validated_data, field_errors = validate_exam_items(items_data)
+    if field_errors:
+        raise IngestValidationError(field_errors)
+    return validated_data
+
+
+def deduplicate_items(validated_data: list[dict]) -> tuple[dict, int]:
+    """
+    Key validated items by (institution, semester, course_code), keeping the
+    last occurrence. Returns the mapping and the number of dropped duplicates.
+    """
+    deduplicated_items = {}
+    skipped_count = 0
+    for item_data in validated_data:
+        inst = item_data["institution"]
+        sem = item_data.get("semester")
+
+        key = (
+            inst.pk if inst else None,
+            sem.id if sem else None,
+            item_data["course_code"],
+        )
+        if key in deduplicated_items:
+            skipped_count += 1
+        deduplicated_items[key] = item_data
+    return deduplicated_items, skipped_count
+
+
+def content_hash(row: dict, fields: Iterable[str]) -> str:
+    """
+    Fingerprint the ingestible values of a row, so a re-upload of an
+    unchanged exam can be recognised by comparing one column.
+    """
+    values = {field: row[field] for field in fields}
+    return hashlib.sha256(
+        json.dumps(values, sort_keys=True, default=str).encode()
+    ).hexdigest()
+
+
+def build_row(
+    key: tuple, item_data: dict, now, optional_fields: Iterable[str] | None = None
+) -> dict:
+    """
+    Turn a validated item into a row for UPSERT_COLUMNS. ``optional_fields``
+    are the optional columns that will be written, and default to the ones
+    the item carries.
+    """
+    inst_id, sem_id, course_code = key
+    if optional_fields is None:
+        optional_fields = [f for f in OPTIONAL_FIELDS if f in item_data]
+
+    row = {
+        "course_code": course_code,
+        "normalized_course_code": normalize_course_code(course_code),
+        "semester_id": sem_id,
+        "start_time": item_data["start_time"],
+        "end_time": item_data["end_time"],
+        "venue": item_data["venue"],
+        "coordinator": item_data.get("coordinator"),
+        "hrs": item_data["hrs"],
+        "institution_id": inst_id,
+        "raw_data": json.dumps(item_data.get("raw_data") or {}, sort_keys=True),
+        "created_at": now,
+        "updated_at": now,
+    }
+    row["content_hash"] = content_hash(row, [*HASHED_FIELDS, *optional_fields])
+    return row
+
+
+def ingest_items(items_data: list, semester_cache: dict | None = None) -> IngestResult:
+    """
+    Validate, deduplicate and upsert one batch of exam items in a single
+    transaction. Callers are responsible for calling ``publish_ingestion``
+    with the returned pairs once they are done.
+    """
+    if semester_cache is None:
+        semester_cache = {}
+    validated_data = validate_items(items_data, semester_cache)
+    deduplicated_items, skipped_count = deduplicate_items(validated_data)
+
+    # Upsert in set-based statements. Optional fields the client left out
+    # must not overwrite stored values, so rows are grouped by which optional
+    # fields they carry and each group updates only those columns.
+    now = timezone.now()
+    groups = {}
+    for key, item_data in deduplicated_items.items():
+        provided = tuple(f for f in OPTIONAL_FIELDS if f in item_data)
+        groups.setdefault(provided, []).append(build_row(key, item_data, now))
+
+    result = IngestResult(skipped_count=skipped_count, processed_count=len(items_data))
+    with transaction.atomic():
+        for provided, rows in groups.items():
+            upsert_exam_schedules(rows, UPDATE_FIELDS + list(provided), result)
+
+    return result
+
+
+def upsert_exam_schedules(
+    rows: list[dict], update_fields: list[str], result: IngestResult
+) -> None:
+    """
+    Insert rows, or update ``update_fields`` on rows that already exist,
+    with INSERT ... ON CONFLICT against the unique_exam_schedule constraint.
+    Rows must already be unique on (course_code, institution, semester).
+
+    Existing rows whose content_hash already matches are left untouched.
+    Counts are added to ``result`` as reported by PostgreSQL: a returned row
+    whose xmax is 0 was freshly inserted, and rows that are not returned were
+    unchanged. Only institutions and semesters that were written are added
+    to ``result.pairs``.
+    """
+    table = connection.ops.quote_name(ExamSchedule._meta.db_table)
+    columns = ", ".join(connection.ops.quote_name(column) for column in UPSERT_COLUMNS)
+    assignments = ", ".join(
+        f"{connection.ops.quote_name(column)} = EXCLUDED.{connection.ops.quote_name(column)}"
+        for column in UPSERT_COLUMNS
+        if column in update_fields
+    )
+    placeholder = "({})".format(
+        ", ".join(
+            "%s::jsonb" if column == "raw_data" else "%s" for column in UPSERT_COLUMNS
+        )
+    )
+
+    with connection.cursor() as cursor:
+        for batch in chunked(rows, UPSERT_BATCH_SIZE):
+            sql = (
+                f"INSERT INTO {table} ({columns}) "
+                f"VALUES {', '.join([placeholder] * len(batch))} "
+                f"ON CONFLICT ON CONSTRAINT {UNIQUE_CONSTRAINT} "
+                f"DO UPDATE SET {assignments} "
+                f"WHERE {table}.content_hash IS DISTINCT FROM EXCLUDED.content_hash "
+                f"RETURNING (xmax = 0) AS inserted, institution_id, semester_id"
+            )
+            params = [row[column] for row in batch for column in UPSERT_COLUMNS]
+            cursor.execute(sql, params)
+            written = cursor.fetchall()
+            for inserted, institution_id, semester_id in written:
+                if inserted:
+                    result.created_count += 1
+                else:
+                    result.updated_count += 1
+                result.pairs.add((institution_id, semester_id))
+            result.unchanged_count += len(batch) - len(written)
+
+
+def publish_ingestion(pairs: Iterable[tuple]) -> None:
+    """
+    Make committed ingestion visible to readers: invalidate the cached latest
+    semesters and responses, then rebuild the timetable snapshots.
+    """
+    pairs = set(pairs)
+    if not pairs:
+        return
+    invalidate_timetables({institution_id for institution_id, _ in pairs})
+    rebuild_snapshots(pairs)
+
+
+def chunked(items: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def ingest_stream(
+    items: Iterable[dict],
+    chunk_size: int = CHUNK_SIZE,
+    on_chunk: Callable[[IngestResult], None] | None = None,
+    publish: bool = True,
+) -> IngestResult:
+    """
+    Ingest an arbitrarily long iterable of exam items in bounded chunks, each
+    validated and committed on its own, so memory stays proportional to
+    ``chunk_size`` rather than to the payload.
+
+    Duplicates are only detected within a chunk; a repeat in a later chunk is
+    applied as an update. If a chunk fails, earlier chunks stay committed and
+    the partial result is attached to the raised error.
+    """
+    result = IngestResult()
+    semester_cache = {}
+    index = 0
+    try:
+        for index, chunk in enumerate(chunked(items, chunk_size)):
+            try:
+                chunk_result = ingest_items(chunk, semester_cache)
+            except IngestValidationError as e:
+                e.chunk_index = index
+                e.offset = result.processed_count
+                raise
+
+            result.add_chunk(index, len(chunk), chunk_result)
+            logger.info(
+                "Ingested exam schedule chunk",
+                extra={"chunk": index, "items": len(chunk), **chunk_result.counts()},
+            )
+            if on_chunk:
+                on_chunk(result)
+    except (IngestValidationError, InvalidPayloadError) as e:
+        e.result = result
+        raise
+    finally:
+        if publish and result.pairs:
+            publish_ingestion(result.pairs)
+
+    return result
+
+
+def iter_ndjson(stream) -> Iterator[dict]:
+    """
+    Yield one item per non-blank line of a newline-delimited JSON stream.
+    """
+    for line_number, line in enumerate(iter(stream.readline, b""), start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as e:
+            raise InvalidPayloadError(f"Invalid JSON on line {line_number}: {e.msg}")
+
+
+def iter_json_array(stream, read_size: int = READ_SIZE) -> Iterator[dict]:
+    """
+    Incrementally decode a top-level JSON array, yielding each element as soon
+    as it is complete, while holding at most one element plus one read in
+    memory. Separators are checked as strictly as json.loads would, and
+    anything but whitespace after the closing bracket is rejected.
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    eof = False
+    # What comes next: "[", the first item or "]", an item, "," or "]",
+    # or nothing but whitespace.
+    expect = "open"
+
+    def fill():
+        nonlocal buffer, eof
+        data = stream.read(read_size)
+        if not data:
+            eof = True
+            buffer += text_decoder.decode(b"", final=True)
+        else:
+            buffer += text_decoder.decode(data)
+
+    while True:
+        buffer = buffer.lstrip()
+        if not buffer:
+            if not eof:
+                fill()
+                continue
+            if expect == "end":
+                return
+            raise InvalidPayloadError("Unexpected end of JSON array")
+
+        char = buffer[0]
+        if expect == "open":
+            if char != "[":
+                raise InvalidPayloadError("Streamed payload must be a JSON array")
+            buffer = buffer[1:]
+            expect = "first"
+            continue
+        if expect == "end":
+            raise InvalidPayloadError("Unexpected data after the JSON array")
+        if expect == "separator":
+            if char not in ",]":
+                raise InvalidPayloadError("Expected ',' or ']' after an array item")
+            buffer = buffer[1:]
+            expect = "item" if char == "," else "end"
+            continue
+        if char == "]" and expect == "first":
+            buffer = buffer[1:]
+            expect = "end"
+            continue
+        if char in ",]":
+            raise InvalidPayloadError(f"Expected an array item, got '{char}'")
+
+        try:
+            item, end = decoder.raw_decode(buffer)
+        except json.JSONDecodeError as e:
+            if eof:
+                raise InvalidPayloadError(f"Invalid JSON array: {e.msg}")
+            fill()
+            continue
+        if (
+            not eof
+            and isinstance(item, (int, float))
+            and buffer[end : end + 1] in NUMBER_CONTINUATIONS
+        ):
+            # The number may continue in the next read: "12" of "123", or
+            # "1" of "1.5" when the read ended after the dot.
+            fill()
+            continue
+
+        buffer = buffer[end:]
+        expect = "separator"
+        yield item
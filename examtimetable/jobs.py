@@ -0,0 +1,260 @@
+import json
+import logging
+import shutil
+import tempfile
+import threading
+from contextlib import contextmanager
+from datetime import timedelta
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from django.core.files import File
+from django.db import connection, transaction
+from django.db.models import Q
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from .copy_loader import copy_load
+from .helpers import iter_exam_items
+from .ingestion import (
+    IngestResult,
+    IngestValidationError,
+    InvalidPayloadError,
+    error_details,
+    ingest_stream,
+    iter_ndjson,
+)
+from .models import IngestionJob
+
+logger = logging.getLogger(__name__)
+
+# Payloads up to this size are spooled in memory before being uploaded.
+SPOOL_SIZE = 8 * 1024 * 1024
+
+LOADERS = {"upsert": ingest_stream, "copy": copy_load}
+
+# How often a running job's heartbeat is refreshed, and how long without one
+# before the job is considered abandoned and handed to another worker.
+HEARTBEAT_INTERVAL = 30
+STALE_AFTER = timedelta(minutes=5)
+# A job claimed this many times without finishing is failed rather than
+# retried, so a payload that kills its worker cannot do so forever.
+MAX_ATTEMPTS = 3
+
+
+def enqueue_ingestion(
+    items: Iterable[dict], loader: str, chunk_size: int
+) -> IngestionJob:
+    """
+    Store the items as NDJSON in the default storage and queue a job for the
+    ingestion worker. Malformed payloads raise InvalidPayloadError before
+    anything is stored.
+    """
+    job = IngestionJob(loader=loader, chunk_size=chunk_size)
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_SIZE) as spool:
+        for item in items:
+            spool.write(json.dumps(item).encode())
+            spool.write(b"\n")
+        spool.seek(0)
+        job.payload.save(f"{job.id}.ndjson", File(spool), save=False)
+    job.save()
+
+    logger.info("Queued exam ingestion job", extra={"job_id": str(job.id)})
+    return job
+
+
+def enqueue_spreadsheet(
+    upload,
+    parser_name: str,
+    institution_id,
+    semester: str | None,
+    loader: str,
+    chunk_size: int,
+) -> IngestionJob:
+    """
+    Store an uploaded spreadsheet as it is and queue a job for the ingestion
+    worker, which parses it with ``parser_name``. Nothing is parsed here.
+    """
+    job = IngestionJob(
+        loader=loader,
+        chunk_size=chunk_size,
+        parser=parser_name,
+        institution_id=institution_id,
+        semester=semester or "",
+    )
+    suffix = Path(upload.name).suffix.lower()
+    job.payload.save(f"{job.id}{suffix}", upload, save=False)
+    job.save()
+
+    logger.info(
+        "Queued exam spreadsheet ingestion job",
+        extra={"job_id": str(job.id), "parser": parser_name},
+    )
+    return job
+
+
+def claim_next_job() -> IngestionJob | None:
+    """
+    Mark the oldest queued job as running and return it. Rows locked by other
+    workers are skipped, so any number of workers can poll the same queue.
+    Running jobs whose heartbeat stopped more than STALE_AFTER ago were left
+    behind by a worker that died, and are claimed again.
+    """
+    while True:
+        now = timezone.now()
+        with transaction.atomic():
+            job = (
+                IngestionJob.objects.select_for_update(skip_locked=True)
+                .alias(last_seen=Coalesce("heartbeat_at", "started_at"))
+                .filter(
+                    Q(status=IngestionJob.Status.QUEUED)
+                    | Q(
+                        status=IngestionJob.Status.RUNNING,
+                        last_seen__lt=now - STALE_AFTER,
+                    )
+                )
+                .order_by("created_at")
+                .first()
+            )
+            if job is None:
+                return None
+
+            if job.attempts >= MAX_ATTEMPTS:
+                logger.error(
+                    "Giving up on abandoned exam ingestion job",
+                    extra={"job_id": str(job.id), "attempts": job.attempts},
+                )
+                job.status = IngestionJob.Status.FAILED
+                job.errors = [
+                    {
+                        "code": "server_error",
+                        "message": f"Abandoned after {job.attempts} attempts",
+                    }
+                ]
+                job.finished_at = now
+                job.save(update_fields=["status", "errors", "finished_at"])
+                continue
+            if job.status == IngestionJob.Status.RUNNING:
+                logger.warning(
+                    "Reclaiming abandoned exam ingestion job",
+                    extra={"job_id": str(job.id), "attempts": job.attempts},
+                )
+
+            job.status = IngestionJob.Status.RUNNING
+            job.attempts += 1
+            job.started_at = job.heartbeat_at = now
+            job.save(update_fields=["status", "attempts", "started_at", "heartbeat_at"])
+        return job
+
+
+def _heartbeat(job_id, stop: threading.Event) -> None:
+    try:
+        while not stop.wait(HEARTBEAT_INTERVAL):
+            IngestionJob.objects.filter(
+                pk=job_id, status=IngestionJob.Status.RUNNING
+            ).update(heartbeat_at=timezone.now())
+    except Exception as e:
+        logger.exception(f"Failed to record heartbeat for job {job_id}: {e}")
+    finally:
+        connection.close()
+
+
+def fail_job(job: IngestionJob, error: Exception) -> None:
+    """
+    Mark a job that is still running as failed, after an error outside the
+    loader, e.g. the database or storage going away mid-job.
+    """
+    IngestionJob.objects.filter(pk=job.pk, status=IngestionJob.Status.RUNNING).update(
+        status=IngestionJob.Status.FAILED,
+        errors=[{"code": "server_error", "message": str(error)}],
+        finished_at=timezone.now(),
+    )
+
+
+def _record_progress(job: IngestionJob, result: IngestResult) -> None:
+    IngestionJob.objects.filter(pk=job.pk).update(
+        processed_count=result.processed_count,
+        chunks=result.chunks,
+        **result.counts(),
+    )
+
+
+@contextmanager
+def open_items(job: IngestionJob) -> Iterator[Iterable[dict]]:
+    """
+    The items of a job's payload. Spreadsheets are copied out of the storage
+    into a local file first, since the workbook readers need a path.
+    """
+    with job.payload.open("rb") as stream:
+        if not job.parser:
+            yield iter_ndjson(stream)
+            return
+
+        suffix = Path(job.payload.name).suffix
+        with tempfile.NamedTemporaryFile(suffix=suffix) as spreadsheet:
+            shutil.copyfileobj(stream, spreadsheet)
+            spreadsheet.flush()
+            yield iter_exam_items(
+                spreadsheet.name,
+                job.parser,
+                job.institution_id,
+                job.semester or None,
+            )
+
+
+def run_job(job: IngestionJob) -> IngestionJob:
+    """
+    Ingest a claimed job's payload, recording progress after every committed
+    chunk and the final counts or errors once it finishes.
+    """
+    options = {"chunk_size": job.chunk_size}
+    if job.loader == "upsert":
+        # The COPY loader commits once at the end, so only the chunked
+        # upsert has intermediate progress worth reporting.
+        options["on_chunk"] = lambda progress: _record_progress(job, progress)
+
+    result = None
+    stop = threading.Event()
+    heartbeat = threading.Thread(
+        target=_heartbeat, args=(job.pk, stop), name=f"heartbeat-{job.pk}", daemon=True
+    )
+    heartbeat.start()
+    try:
+        with open_items(job) as items:
+            result = LOADERS[job.loader](items, **options)
+    except (IngestValidationError, InvalidPayloadError) as e:
+        result = e.result
+        job.status = IngestionJob.Status.FAILED
+        job.errors = error_details(e)
+    except Exception as e:
+        logger.exception(f"Exam ingestion job {job.id} failed: {e}")
+        job.status = IngestionJob.Status.FAILED
+        job.errors = [{"code": "server_error", "message": str(e)}]
+    else:
+        job.status = IngestionJob.Status.SUCCEEDED
+    finally:
+        stop.set()
+        heartbeat.join()
+
+    if result is not None:
+        job.processed_count = result.processed_count
+        job.created_count = result.created_count
+        job.updated_count = result.updated_count
+        job.unchanged_count = result.unchanged_count
+        job.skipped_count = result.skipped_count
+        job.chunks = result.chunks
+    job.finished_at = timezone.now()
+    job.save()
+
+    if job.status == IngestionJob.Status.SUCCEEDED:
+        # Failed payloads are kept so they can be inspected and resubmitted.
+        try:
+            job.payload.delete(save=True)
+        except Exception as e:
+            logger.exception(f"Failed to delete payload of job {job.id}: {e}")
+
+    logger.info(
+        "Finished exam ingestion job",
+        extra={"job_id": str(job.id), "status": job.status},
+    )
+    return job
@@ -0,0 +1,151 @@
+import json
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from courses.models import SemesterInfo
+from examtimetable.benchmarks import (
+    BENCHMARK_SEMESTER,
+    PROFILES,
+    add_allow_writes_argument,
+    ensure_writes_allowed,
+    generate_items,
+)
+from examtimetable.copy_loader import copy_load
+from examtimetable.ingestion import (
+    CHUNK_SIZE,
+    chunked,
+    deduplicate_items,
+    ingest_stream,
+    validate_items,
+)
+from examtimetable.models import ExamSchedule
+from examtimetable.utils import normalize_course_code
+from institutions.models import Institution
+
+ORM_FIELDS = [
+    "start_time",
+    "end_time",
+    "venue",
+    "coordinator",
+    "hrs",
+    "raw_data",
+    "normalized_course_code",
+    "updated_at",
+]
+
+
+def orm_load(items, chunk_size: int = CHUNK_SIZE):
+    """
+    The prefetch + bulk_create/bulk_update path ingestion used before the
+    upsert engine, kept here as the benchmark baseline.
+    """
+    semester_cache = {}
+    for chunk in chunked(items, chunk_size):
+        deduplicated_items, _ = deduplicate_items(validate_items(chunk, semester_cache))
+        existing_map = {
+            (exam.institution_id, exam.semester_id, exam.course_code): exam
+            for exam in ExamSchedule.objects.filter(
+                institution_id__in={key[0] for key in deduplicated_items},
+                course_code__in=[key[2] for key in deduplicated_items],
+            )
+        }
+
+        items_to_create = []
+        items_to_update = []
+        now = timezone.now()
+        for key, item_data in deduplicated_items.items():
+            if key in existing_map:
+                obj = existing_map[key]
+                for field, value in item_data.items():
+                    setattr(obj, field, value)
+                obj.normalized_course_code = normalize_course_code(key[2])
+                obj.updated_at = now
+                items_to_update.append(obj)
+            else:
+                items_to_create.append(
+                    ExamSchedule(
+                        **item_data,
+                        normalized_course_code=normalize_course_code(key[2]),
+                    )
+                )
+
+        with transaction.atomic():
+            ExamSchedule.objects.bulk_create(items_to_create, batch_size=100)
+            ExamSchedule.objects.bulk_update(
+                items_to_update, ORM_FIELDS, batch_size=100
+            )
+
+
+LOADERS = {
+    "orm": orm_load,
+    "upsert": lambda items: ingest_stream(items, publish=False),
+    "copy": lambda items: copy_load(items, publish=False),
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the ORM bulk, upsert and COPY exam loaders on a synthetic "
+        "institution timetable. It creates and deletes a benchmark institution, "
+        "so it only runs with DEBUG on or --allow-writes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000]
+        )
+        parser.add_argument(
+            "--loaders", nargs="+", choices=list(LOADERS), default=list(LOADERS)
+        )
+        parser.add_argument("--profile", choices=list(PROFILES), default="du")
+        parser.add_argument("--output", help="Write results to this JSON file")
+        add_allow_writes_argument(parser)
+
+    def handle(self, *args, **options):
+        ensure_writes_allowed(options)
+        institution = Institution.objects.create(
+            name="Benchmark University",
+            web_pages=["https://benchmark.invalid"],
+            domains=["benchmark.invalid"],
+            country="Kenya",
+        )
+        results = []
+        try:
+            for size in options["sizes"]:
+                for name in options["loaders"]:
+                    load = LOADERS[name]
+                    for phase, revision in (("insert", 0), ("update", 1)):
+                        started = time.perf_counter()
+                        load(
+                            generate_items(
+                                options["profile"], institution.pk, size, revision
+                            )
+                        )
+                        elapsed = time.perf_counter() - started
+                        results.append(
+                            {
+                                "loader": name,
+                                "rows": size,
+                                "phase": phase,
+                                "seconds": round(elapsed, 4),
+                                "rows_per_second": round(size / elapsed),
+                            }
+                        )
+                        self.stdout.write(
+                            f"{name:>7} {phase:>6} {size:>8} rows "
+                            f"{elapsed:9.3f}s {size / elapsed:>10.0f} rows/s"
+                        )
+                    ExamSchedule.objects.filter(institution=institution).delete()
+        finally:
+            institution.delete()
+            SemesterInfo.objects.filter(code=BENCHMARK_SEMESTER).delete()
+
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as f:
+                json.dump(results, f, indent=2)
+            self.stdout.write(
+                self.style.SUCCESS(f"Results written to {options['output']}")
+            )
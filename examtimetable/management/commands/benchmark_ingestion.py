@@ -0,0 +1,191 @@
+import json
+import platform
+import time
+import tracemalloc
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory
+
+from courses.models import SemesterInfo
+from examtimetable.benchmarks import (
+    BENCHMARK_SEMESTER,
+    BENCHMARK_SIZES,
+    PROFILES,
+    add_allow_writes_argument,
+    ensure_writes_allowed,
+    generate_items,
+)
+from examtimetable.ingestion import CHUNK_SIZE
+from examtimetable.models import ExamSchedule
+from examtimetable.views import NDJSON_MEDIA_TYPE, IngestExamScheduleView
+from institutions.models import Institution
+
+# Each size is uploaded three times: into an empty table, unchanged, and as a
+# corrected draft.
+PHASES = [("insert", 0), ("reupload", 0), ("update", 1)]
+
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+class Command(BaseCommand):
+    help = (
+        "Time POST /api/exams/ingest/ end to end on synthetic DU, KCA, "
+        "Strathmore and Nursing timetables, recording wall time, query count "
+        "and peak Python memory. It creates and deletes benchmark institutions, "
+        "so it only runs with DEBUG on or --allow-writes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--profiles", nargs="+", choices=list(PROFILES), default=list(PROFILES)
+        )
+        parser.add_argument("--sizes", type=int, nargs="+", default=BENCHMARK_SIZES)
+        parser.add_argument(
+            "--mode",
+            choices=["json", "ndjson"],
+            default="json",
+            help="Send one JSON document, or stream NDJSON in chunks",
+        )
+        parser.add_argument("--loader", choices=["upsert", "copy"], default="upsert")
+        parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+        parser.add_argument(
+            "--no-memory",
+            action="store_true",
+            help="Skip tracemalloc, which slows ingestion down noticeably",
+        )
+        parser.add_argument("--output", help="Write results to this JSON file")
+        add_allow_writes_argument(parser)
+
+    def handle(self, *args, **options):
+        ensure_writes_allowed(options)
+        if not settings.INGEST_API_KEY:
+            raise CommandError("INGEST_API_KEY must be set to call the ingest view")
+
+        results = []
+        try:
+            for profile_name in options["profiles"]:
+                results.extend(self.run_profile(profile_name, options))
+        finally:
+            # Deleted once at the end: the semester id stays cached in-process.
+            SemesterInfo.objects.filter(code=BENCHMARK_SEMESTER).delete()
+
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "recorded_at": timezone.now().isoformat(),
+                        "python": platform.python_version(),
+                        "database": connection.vendor,
+                        "options": {
+                            key: options[key]
+                            for key in ("mode", "loader", "chunk_size", "no_memory")
+                        },
+                        "results": results,
+                    },
+                    f,
+                    indent=2,
+                )
+            self.stdout.write(
+                self.style.SUCCESS(f"Results written to {options['output']}")
+            )
+
+    def run_profile(self, profile_name, options):
+        institution = Institution.objects.create(
+            name=f"Benchmark {PROFILES[profile_name].name}",
+            web_pages=["https://benchmark.invalid"],
+            domains=["benchmark.invalid"],
+            country="Kenya",
+        )
+        results = []
+        try:
+            for size in options["sizes"]:
+                for phase, revision in PHASES:
+                    result = self.run_once(
+                        profile_name, institution.pk, size, revision, options
+                    )
+                    result["phase"] = phase
+                    results.append(result)
+                    self.report(result)
+                ExamSchedule.objects.filter(institution=institution).delete()
+        finally:
+            institution.delete()
+        return results
+
+    def build_request(self, items, options):
+        factory = APIRequestFactory()
+        query = f"?loader={options['loader']}&chunk_size={options['chunk_size']}"
+        if options["mode"] == "ndjson":
+            body = "\n".join(json.dumps(item) for item in items)
+            content_type = NDJSON_MEDIA_TYPE
+        else:
+            body = json.dumps({"items": items})
+            content_type = "application/json"
+        return factory.post(
+            f"/api/exams/ingest/{query}",
+            data=body.encode(),
+            content_type=content_type,
+            HTTP_X_API_KEY=settings.INGEST_API_KEY,
+        )
+
+    def run_once(self, profile_name, institution_id, size, revision, options):
+        items = list(generate_items(profile_name, institution_id, size, revision))
+        request = self.build_request(items, options)
+        view = IngestExamScheduleView.as_view()
+        counter = QueryCounter()
+        trace_memory = not options["no_memory"]
+
+        if trace_memory:
+            tracemalloc.start()
+        started = time.perf_counter()
+        with connection.execute_wrapper(counter):
+            response = view(request)
+        elapsed = time.perf_counter() - started
+        peak = None
+        if trace_memory:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+        body = response.data or {}
+        return {
+            "profile": profile_name,
+            "rows": size,
+            "status": response.status_code,
+            "seconds": round(elapsed, 4),
+            "rows_per_second": round(size / elapsed),
+            "queries": counter.count,
+            "peak_memory_mb": round(peak / 2**20, 2) if peak is not None else None,
+            "counts": {
+                key: body.get(key)
+                for key in (
+                    "created_count",
+                    "updated_count",
+                    "unchanged_count",
+                    "skipped_count",
+                )
+            },
+        }
+
+    def report(self, result):
+        memory = (
+            f"{result['peak_memory_mb']:>8.1f}MB"
+            if result["peak_memory_mb"] is not None
+            else ""
+        )
+        line = (
+            f"{result['profile']:>8} {result['phase']:>8} {result['rows']:>7} rows "
+            f"{result['seconds']:9.3f}s {result['queries']:>6} queries {memory}"
+        )
+        if result["status"] >= 400:
+            self.stdout.write(self.style.ERROR(f"{line} HTTP {result['status']}"))
+        else:
+            self.stdout.write(line)
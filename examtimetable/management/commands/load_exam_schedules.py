@@ -0,0 +1,115 @@
+import json
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from examtimetable.copy_loader import copy_load
+from examtimetable.helpers import PARSERS, is_spreadsheet, parse_timetables
+from examtimetable.ingestion import (
+    CHUNK_SIZE,
+    IngestValidationError,
+    InvalidPayloadError,
+    iter_json_array,
+    iter_ndjson,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Bulk load exam schedules from a JSON array, NDJSON file or timetable "
+        "spreadsheet through a COPY-fed staging table"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "paths",
+            nargs="+",
+            metavar="path",
+            help="File containing the exam items; several spreadsheets may be given",
+        )
+        parser.add_argument(
+            "--format",
+            choices=["json", "ndjson"],
+            help="Payload format; guessed from the file extension by default",
+        )
+        parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+        parser.add_argument(
+            "--parser",
+            choices=sorted(PARSERS),
+            help="Timetable parser to read an .xlsx/.xls file with",
+        )
+        parser.add_argument(
+            "--institution", type=int, help="Institution id for spreadsheet rows"
+        )
+        parser.add_argument("--semester", help="Semester code for spreadsheet rows")
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=settings.TIMETABLE_PARSE_WORKERS,
+            help="Processes to parse spreadsheet sheets with; one per CPU by default",
+        )
+
+    def handle(self, *args, **options):
+        paths = [Path(path) for path in options["paths"]]
+        for path in paths:
+            if not path.exists():
+                raise CommandError(f"{path} does not exist")
+
+        if all(is_spreadsheet(path.name) for path in paths):
+            result = self.load_spreadsheets(paths, options)
+        elif len(paths) == 1:
+            path = paths[0]
+            payload_format = options["format"] or (
+                "ndjson" if path.suffix in (".ndjson", ".jsonl") else "json"
+            )
+            with path.open("rb") as stream:
+                items = (
+                    iter_ndjson(stream)
+                    if payload_format == "ndjson"
+                    else iter_json_array(stream)
+                )
+                result = self.load(items, options)
+        else:
+            raise CommandError("Only spreadsheets can be loaded several at a time")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Loaded {result.processed_count} items: "
+                f"{result.created_count} created, {result.updated_count} updated, "
+                f"{result.unchanged_count} unchanged, {result.skipped_count} skipped"
+            )
+        )
+
+    def load(self, items, options):
+        try:
+            return copy_load(items, chunk_size=options["chunk_size"])
+        except IngestValidationError as e:
+            raise CommandError(
+                f"Validation failed in chunk {e.chunk_index} "
+                f"(items from offset {e.offset}): "
+                f"{json.dumps(e.field_errors, default=str)}"
+            )
+        except InvalidPayloadError as e:
+            raise CommandError(str(e))
+
+    def load_spreadsheets(self, paths, options):
+        if not options["parser"] or not options["institution"]:
+            raise CommandError(
+                "--parser and --institution are required for spreadsheets"
+            )
+        items, duplicates, incomplete = parse_timetables(
+            paths,
+            options["parser"],
+            options["institution"],
+            options["semester"],
+            workers=options["workers"],
+        )
+        if incomplete:
+            self.stderr.write(
+                f"Left out {incomplete} timetable entries without a date or time"
+            )
+        result = self.load(items, options)
+        result.processed_count += duplicates
+        result.skipped_count += duplicates
+        return result
@@ -0,0 +1,64 @@
+import logging
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from examtimetable.jobs import claim_next_job, fail_job, run_job
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Process queued asynchronous exam ingestion jobs"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=2.0,
+            help="Seconds to wait between polls when the queue is empty",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit once the queue is empty instead of polling",
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write(self.style.SUCCESS("Starting exam ingestion worker..."))
+
+        try:
+            while True:
+                if not self.poll(options) and options["once"]:
+                    return
+        except KeyboardInterrupt:
+            self.stdout.write(self.style.WARNING("Stopping exam ingestion worker"))
+
+    def poll(self, options) -> bool:
+        """
+        Claim and run one job, returning False if the queue was empty. Errors
+        are logged rather than raised so that one bad job, or the database or
+        storage briefly going away, does not stop the worker.
+        """
+        job = None
+        try:
+            close_old_connections()
+            job = claim_next_job()
+            if job is None:
+                if not options["once"]:
+                    time.sleep(options["poll_interval"])
+                return False
+
+            self.stdout.write(f"Running ingestion job {job.id}")
+            job = run_job(job)
+            self.stdout.write(f"Ingestion job {job.id} {job.status}")
+        except Exception as e:
+            logger.exception(f"Exam ingestion worker error: {e}")
+            if job is not None:
+                try:
+                    fail_job(job, e)
+                except Exception as error:
+                    logger.exception(f"Failed to mark job {job.id} as failed: {error}")
+            time.sleep(options["poll_interval"])
+        return True
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.13 on 2026-10-18 02:31
+
+from django.db import migrations, models
+
+from examtimetable.utils import normalize_course_code
+
+
+def backfill_normalized_course_code(apps, schema_editor):
+    ExamSchedule = apps.get_model('examtimetable', 'ExamSchedule')
+    batch = []
+    for exam in ExamSchedule.objects.only('id', 'course_code').iterator(chunk_size=1000):
+        exam.normalized_course_code = normalize_course_code(exam.course_code)
+        batch.append(exam)
+        if len(batch) >= 1000:
+            ExamSchedule.objects.bulk_update(batch, ['normalized_course_code'])
+            batch = []
+    if batch:
+        ExamSchedule.objects.bulk_update(batch, ['normalized_course_code'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0002_course_institution'),
+        ('examtimetable', '0007_examschedule_institution_fk'),
+        ('institutions', '0002_alter_institution_state_province'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='examschedule',
+            name='normalized_course_code',
+            field=models.CharField(blank=True, default='', editable=False, max_length=50),
+        ),
+        migrations.RunPython(backfill_normalized_course_code, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='examschedule',
+            index=models.Index(fields=['institution', 'semester', 'normalized_course_code'], name='examtimetab_inst_sem_norm_idx'),
+        ),
+    ]
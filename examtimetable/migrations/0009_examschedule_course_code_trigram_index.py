@@ -0,0 +1,22 @@
+# Generated by Django 5.2.13 on 2026-10-18 02:31
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0002_course_institution'),
+        ('examtimetable', '0008_examschedule_normalized_course_code'),
+        ('institutions', '0002_alter_institution_state_province'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name='examschedule',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['normalized_course_code'], name='examtimetab_norm_code_trgm', opclasses=['gin_trgm_ops']),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.13 on 2026-10-18 02:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0002_course_institution'),
+        ('examtimetable', '0009_examschedule_course_code_trigram_index'),
+        ('institutions', '0002_alter_institution_state_province'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='examschedule',
+            index=models.Index(fields=['institution', '-start_time', '-id'], name='examtimetab_inst_latest_idx'),
+        ),
+    ]
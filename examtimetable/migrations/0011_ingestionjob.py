@@ -0,0 +1,64 @@
+# Generated by Django 5.2.13 on 2026-10-18 02:39
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("examtimetable", "0010_examschedule_latest_exam_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="IngestionJob",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("queued", "Queued"),
+                            ("running", "Running"),
+                            ("succeeded", "Succeeded"),
+                            ("failed", "Failed"),
+                        ],
+                        default="queued",
+                        max_length=20,
+                    ),
+                ),
+                ("loader", models.CharField(default="upsert", max_length=20)),
+                ("chunk_size", models.PositiveIntegerField()),
+                (
+                    "payload",
+                    models.FileField(blank=True, upload_to="exam-ingestion-jobs/"),
+                ),
+                ("processed_count", models.PositiveIntegerField(default=0)),
+                ("created_count", models.PositiveIntegerField(default=0)),
+                ("updated_count", models.PositiveIntegerField(default=0)),
+                ("skipped_count", models.PositiveIntegerField(default=0)),
+                ("chunks", models.JSONField(blank=True, default=list)),
+                ("errors", models.JSONField(blank=True, default=list)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("started_at", models.DateTimeField(blank=True, null=True)),
+                ("finished_at", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["status", "created_at"],
+                        name="examtimetab_job_queue_idx",
+                    )
+                ],
+            },
+        ),
+    ]
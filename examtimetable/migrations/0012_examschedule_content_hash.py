@@ -0,0 +1,25 @@
+# Generated by Django 5.2.13 on 2026-10-18 02:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("examtimetable", "0011_ingestionjob"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="examschedule",
+            name="content_hash",
+            field=models.CharField(
+                blank=True, default="", editable=False, max_length=64
+            ),
+        ),
+        migrations.AddField(
+            model_name="ingestionjob",
+            name="unchanged_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.13 on 2026-10-18 02:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("courses", "0003_semesterinfo_canonical_code"),
+        ("examtimetable", "0012_examschedule_content_hash"),
+        ("institutions", "0002_alter_institution_state_province"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="examschedule",
+            index=models.Index(
+                fields=["semester", "start_time", "id"],
+                name="examtimetab_sem_start_idx",
+            ),
+        ),
+    ]
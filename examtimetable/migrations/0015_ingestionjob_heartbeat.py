@@ -0,0 +1,23 @@
+# Generated by Django 5.2.13 on 2026-10-18 03:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("examtimetable", "0013_examschedule_semester_start_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="ingestionjob",
+            name="attempts",
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="ingestionjob",
+            name="heartbeat_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.13 on 2026-10-18 03:24
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("examtimetable", "0015_ingestionjob_heartbeat"),
+        ("institutions", "0002_alter_institution_state_province"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="ingestionjob",
+            name="institution",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="ingestion_jobs",
+                to="institutions.institution",
+            ),
+        ),
+        migrations.AddField(
+            model_name="ingestionjob",
+            name="parser",
+            field=models.CharField(blank=True, max_length=20),
+        ),
+        migrations.AddField(
+            model_name="ingestionjob",
+            name="semester",
+            field=models.CharField(blank=True, max_length=50),
+        ),
+    ]
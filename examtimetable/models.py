@@ -1,11 +1,19 @@
+import uuid
+
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 
 from courses.models import SemesterInfo
 from institutions.models import Institution
 
+from .utils import normalize_course_code
+
 
 class ExamSchedule(models.Model):
     course_code = models.CharField(max_length=50)
+    normalized_course_code = models.CharField(
+        max_length=50, default="", blank=True, editable=False
+    )
     semester = models.ForeignKey(
         SemesterInfo,
         on_delete=models.CASCADE,
@@ -23,6 +31,11 @@ class ExamSchedule(models.Model):
     )
 
     raw_data = models.JSONField(default=dict, blank=True)
+    # Fingerprint of the values last written by ingestion, used to skip
+    # re-uploads of unchanged rows. Blank when the row was saved otherwise.
+    content_hash = models.CharField(
+        max_length=64, default="", blank=True, editable=False
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -36,7 +49,94 @@ class ExamSchedule(models.Model):
         ]
         indexes = [
             models.Index(fields=["institution", "semester", "course_code"]),
+            models.Index(
+                fields=["institution", "semester", "normalized_course_code"],
+                name="examtimetab_inst_sem_norm_idx",
+            ),
+            models.Index(
+                fields=["institution", "-start_time", "-id"],
+                name="examtimetab_inst_latest_idx",
+            ),
+            models.Index(
+                fields=["semester", "start_time", "id"],
+                name="examtimetab_sem_start_idx",
+            ),
+            GinIndex(
+                fields=["normalized_course_code"],
+                opclasses=["gin_trgm_ops"],
+                name="examtimetab_norm_code_trgm",
+            ),
         ]
 
+    def save(self, *args, **kwargs):
+        self.normalized_course_code = normalize_course_code(self.course_code)
+        self.content_hash = ""
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            update_fields = {*update_fields, "content_hash"}
+            if "course_code" in update_fields:
+                update_fields.add("normalized_course_code")
+            kwargs["update_fields"] = update_fields
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f"{self.course_code} - {self.start_time}"
+
+
+class IngestionJob(models.Model):
+    """
+    An exam upload accepted with ?async=true. The payload is kept in the
+    default storage until a worker has ingested it: as NDJSON, or as the
+    uploaded spreadsheet when ``parser`` is set, in which case the worker
+    parses it for ``institution`` and ``semester``.
+    """
+
+    class Status(models.TextChoices):
+        QUEUED = "queued", "Queued"
+        RUNNING = "running", "Running"
+        SUCCEEDED = "succeeded", "Succeeded"
+        FAILED = "failed", "Failed"
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    status = models.CharField(
+        max_length=20, choices=Status.choices, default=Status.QUEUED
+    )
+    loader = models.CharField(max_length=20, default="upsert")
+    chunk_size = models.PositiveIntegerField()
+    payload = models.FileField(upload_to="exam-ingestion-jobs/", blank=True)
+    parser = models.CharField(max_length=20, blank=True)
+    institution = models.ForeignKey(
+        Institution,
+        on_delete=models.CASCADE,
+        related_name="ingestion_jobs",
+        null=True,
+        blank=True,
+    )
+    semester = models.CharField(max_length=50, blank=True)
+
+    processed_count = models.PositiveIntegerField(default=0)
+    created_count = models.PositiveIntegerField(default=0)
+    updated_count = models.PositiveIntegerField(default=0)
+    unchanged_count = models.PositiveIntegerField(default=0)
+    skipped_count = models.PositiveIntegerField(default=0)
+    chunks = models.JSONField(default=list, blank=True)
+    errors = models.JSONField(default=list, blank=True)
+
+    attempts = models.PositiveSmallIntegerField(default=0)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    # Refreshed by the worker while the job runs, so jobs left running by a
+    # worker that died can be told apart and picked up again.
+    heartbeat_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["status", "created_at"], name="examtimetab_job_queue_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.id} ({self.status})"
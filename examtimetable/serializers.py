@@ -1,6 +1,6 @@
 from rest_framework import serializers
 
-from .models import ExamSchedule
+from .models import ExamSchedule, IngestionJob
 
 
 class ExamScheduleSerializer(serializers.ModelSerializer):
@@ -34,3 +34,31 @@ class ExamScheduleSerializer(serializers.ModelSerializer):
             "hrs": {"required": True, "allow_null": False},
         }
         validators = []
+
+
+class IngestionJobSerializer(serializers.ModelSerializer):
+    """
+    Serializer for IngestionJob status polling.
+    """
+
+    job_id = serializers.UUIDField(source="id", read_only=True)
+
+    class Meta:
+        model = IngestionJob
+        fields = [
+            "job_id",
+            "status",
+            "loader",
+            "parser",
+            "processed_count",
+            "created_count",
+            "updated_count",
+            "unchanged_count",
+            "skipped_count",
+            "chunks",
+            "errors",
+            "created_at",
+            "started_at",
+            "finished_at",
+        ]
+        read_only_fields = fields
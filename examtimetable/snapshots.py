@@ -0,0 +1,209 @@
+import gzip
+import hashlib
+import logging
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseNotModified
+from rest_framework.renderers import JSONRenderer
+
+from courses.models import SemesterInfo
+from institutions.models import Institution
+from professor.cache import MISSING, TTLCache
+
+from .cache import get_latest_semester_id, get_timetable_version
+from .models import ExamSchedule
+from .serializers import ExamScheduleSerializer
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional at runtime
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+ENCODINGS = ("br", "gzip", "identity")
+SUFFIXES = {"identity": ".json", "gzip": ".json.gz", "br": ".json.br"}
+
+_snapshots = TTLCache(maxsize=64, ttl=60 * 60)
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """
+    A pre-serialized exam timetable for one institution and semester, held in
+    every encoding we can serve so requests never touch the ORM or DRF.
+    """
+
+    digest: str
+    bodies: dict[str, bytes]
+
+    def etag(self, encoding: str) -> str:
+        if encoding == "identity":
+            return f'"{self.digest}"'
+        return f'"{self.digest}-{encoding}"'
+
+
+def _cache_key(institution_id, semester_id, version: str) -> tuple:
+    return (str(institution_id), str(semester_id or "none"), version)
+
+
+def _snapshot_dir(institution_id, semester_id) -> Path:
+    return (
+        Path(settings.EXAM_SNAPSHOT_DIR)
+        / str(institution_id)
+        / str(semester_id or "none")
+    )
+
+
+def _write_atomic(path: Path, content: bytes) -> None:
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".snapshot-")
+    try:
+        with os.fdopen(fd, "wb") as tmp:
+            tmp.write(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _encode(body: bytes) -> dict[str, bytes]:
+    bodies = {"identity": body, "gzip": gzip.compress(body, compresslevel=9)}
+    if brotli is not None:
+        bodies["br"] = brotli.compress(body, quality=11)
+    return bodies
+
+
+def build_snapshot(institution_id, semester_id, version: str) -> Snapshot:
+    """
+    Serialize the timetable for an institution and semester, compress it and
+    persist it to the snapshot directory under the given timetable version.
+    """
+    exams = ExamSchedule.objects.filter(institution_id=institution_id)
+    if semester_id:
+        exams = exams.filter(semester_id=semester_id)
+
+    body = JSONRenderer().render(ExamScheduleSerializer(exams, many=True).data)
+    snapshot = Snapshot(digest=hashlib.sha256(body).hexdigest(), bodies=_encode(body))
+
+    directory = _snapshot_dir(institution_id, semester_id)
+    directory.mkdir(parents=True, exist_ok=True)
+    for encoding, content in snapshot.bodies.items():
+        _write_atomic(directory / f"{version}{SUFFIXES[encoding]}", content)
+
+    # Older versions can no longer be served, so drop them.
+    for path in directory.iterdir():
+        if path.is_file() and not path.name.startswith(version):
+            path.unlink(missing_ok=True)
+
+    _snapshots.set(_cache_key(institution_id, semester_id, version), snapshot)
+    logger.info(
+        "Built exam timetable snapshot",
+        extra={
+            "institution_id": institution_id,
+            "semester_id": semester_id,
+            "bytes": len(body),
+        },
+    )
+    return snapshot
+
+
+def _load_snapshot(institution_id, semester_id, version: str) -> Snapshot | None:
+    directory = _snapshot_dir(institution_id, semester_id)
+    try:
+        body = (directory / f"{version}{SUFFIXES['identity']}").read_bytes()
+        bodies = {"identity": body}
+        for encoding in ("gzip", "br"):
+            path = directory / f"{version}{SUFFIXES[encoding]}"
+            if path.exists():
+                bodies[encoding] = path.read_bytes()
+    except FileNotFoundError:
+        return None
+    return Snapshot(digest=hashlib.sha256(body).hexdigest(), bodies=bodies)
+
+
+def _timetable_exists(institution_id: int, semester_id: int | None) -> bool:
+    if not Institution.objects.filter(pk=institution_id).exists():
+        return False
+    return semester_id is None or SemesterInfo.objects.filter(pk=semester_id).exists()
+
+
+def get_snapshot(institution_id: int, semester_id: int | None) -> Snapshot | None:
+    """
+    Return the current snapshot from process memory, the snapshot directory,
+    or by building it, in that order. Returns None rather than building a
+    snapshot when the institution or semester does not exist.
+    """
+    version = get_timetable_version(institution_id)
+    key = _cache_key(institution_id, semester_id, version)
+
+    snapshot = _snapshots.get(key)
+    if snapshot is not MISSING:
+        return snapshot
+
+    snapshot = _load_snapshot(institution_id, semester_id, version)
+    if snapshot is None:
+        if not _timetable_exists(institution_id, semester_id):
+            return None
+        return build_snapshot(institution_id, semester_id, version)
+
+    _snapshots.set(key, snapshot)
+    return snapshot
+
+
+def rebuild_snapshots(pairs: Iterable[tuple]) -> None:
+    """
+    Rebuild snapshots for the ingested (institution, semester) pairs, plus the
+    institution's current semester which is what clients ask for by default.
+    Must run after the timetable version has been bumped.
+    """
+    pairs = set(pairs)
+    for institution_id in {institution_id for institution_id, _ in pairs}:
+        pairs.add((institution_id, get_latest_semester_id(institution_id)))
+
+    for institution_id, semester_id in pairs:
+        try:
+            build_snapshot(
+                institution_id, semester_id, get_timetable_version(institution_id)
+            )
+        except Exception as e:
+            # Snapshots are rebuilt lazily on the next read if this fails.
+            logger.exception(f"Failed to build exam timetable snapshot: {e}")
+
+
+def _negotiate_encoding(request, snapshot: Snapshot) -> str:
+    accept_encoding = request.headers.get("Accept-Encoding", "")
+    accepted = {
+        token.split(";")[0].strip().lower() for token in accept_encoding.split(",")
+    }
+    for encoding in ENCODINGS:
+        if encoding in snapshot.bodies and (
+            encoding == "identity" or encoding in accepted
+        ):
+            return encoding
+    return "identity"
+
+
+def snapshot_response(request, snapshot: Snapshot) -> HttpResponse:
+    encoding = _negotiate_encoding(request, snapshot)
+    etag = snapshot.etag(encoding)
+
+    if_none_match = request.headers.get("If-None-Match", "")
+    candidates = {candidate.strip() for candidate in if_none_match.split(",")}
+    if "*" in candidates or etag in candidates:
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(
+            snapshot.bodies[encoding], content_type="application/json"
+        )
+        if encoding != "identity":
+            response["Content-Encoding"] = encoding
+
+    response["ETag"] = etag
+    response["Cache-Control"] = "private, no-cache"
+    response["Vary"] = "Accept-Encoding"
+    return response
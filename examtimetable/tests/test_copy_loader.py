@@ -0,0 +1,63 @@
+from datetime import date
+
+from django.test import TestCase, override_settings
+from rest_framework.test import APIRequestFactory
+
+from courses.models import SemesterInfo
+from examtimetable.copy_loader import copy_load
+from examtimetable.ingestion import IngestValidationError
+from examtimetable.models import ExamSchedule
+from examtimetable.views import IngestExamScheduleView
+from institutions.models import Institution
+
+
+@override_settings(INGEST_API_KEY="test-key")
+class CopyLoaderValidationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.institution = Institution.objects.create(
+            name="Test University",
+            web_pages=["https://test.ac.ke"],
+            domains=["test.ac.ke"],
+            country="Kenya",
+        )
+        cls.semester = SemesterInfo.objects.create(
+            code="JAN26",
+            name="JAN26",
+            start_date=date(2026, 1, 1),
+            end_date=date(2026, 4, 30),
+        )
+        cls.item = {
+            "institution": cls.institution.pk,
+            "semester": cls.semester.pk,
+            "course_code": "BIT 101",
+            "start_time": "2026-04-06T08:00:00+03:00",
+            "end_time": "2026-04-06T10:00:00+03:00",
+            "venue": "Main Hall",
+            "hrs": 2,
+        }
+
+    def items(self):
+        invalid = {k: v for k, v in self.item.items() if k != "venue"}
+        return [self.item, {**invalid, "course_code": "BIT 102"}]
+
+    def test_invalid_row_raises_validation_error(self):
+        with self.assertRaises(IngestValidationError) as raised:
+            copy_load(self.items(), publish=False)
+
+        self.assertIn("venue", raised.exception.field_errors[1])
+        self.assertFalse(ExamSchedule.objects.exists())
+
+    def test_invalid_row_is_a_bad_request(self):
+        request = APIRequestFactory().post(
+            "/api/exams/ingest/?loader=copy",
+            self.items(),
+            format="json",
+            HTTP_X_API_KEY="test-key",
+        )
+        response = IngestExamScheduleView.as_view()(request)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data["error"], "validation_failed")
+        self.assertIn("venue", response.data["errors"][0]["field_errors"][1])
+        self.assertFalse(ExamSchedule.objects.exists())
@@ -0,0 +1,125 @@
+import base64
+import json
+from datetime import date, timedelta
+from urllib.parse import parse_qs, urlparse
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from courses.models import SemesterInfo
+from examtimetable import cache as exam_cache
+from examtimetable.models import ExamSchedule
+from examtimetable.views import ExamScheduleListView
+from institutions.models import Institution
+from users.models import User
+
+
+class ExamScheduleCourseCodeSearchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.institution = Institution.objects.create(
+            name="Test University",
+            web_pages=["https://test.ac.ke"],
+            domains=["test.ac.ke"],
+            country="Kenya",
+        )
+        cls.semester = SemesterInfo.objects.create(
+            code="JAN26",
+            name="JAN26",
+            start_date=date(2026, 1, 1),
+            end_date=date(2026, 4, 30),
+        )
+        cls.user = User.objects.create(name="Test Student", username="student")
+        start = timezone.now() + timedelta(days=7)
+        for offset, course_code in enumerate(["NUR 101A", "NUR 102", "BIT 101"]):
+            ExamSchedule.objects.create(
+                course_code=course_code,
+                semester=cls.semester,
+                institution=cls.institution,
+                start_time=start + timedelta(hours=offset),
+                end_time=start + timedelta(hours=offset + 2),
+                venue="Hall A",
+                hrs="2",
+            )
+
+    def setUp(self):
+        self.factory = APIRequestFactory()
+        cache.clear()
+        exam_cache._latest_semesters.clear()
+
+    def list_codes(self, **params):
+        request = self.factory.get(
+            "/api/exams/",
+            {
+                "institution_id": self.institution.pk,
+                "semester_id": self.semester.pk,
+                **params,
+            },
+        )
+        force_authenticate(request, user=self.user)
+        response = ExamScheduleListView.as_view()(request)
+        self.assertEqual(response.status_code, 200)
+        return [exam["course_code"] for exam in response.data["results"]]
+
+    def test_full_nursing_code_matches_its_own_row(self):
+        self.assertEqual(self.list_codes(course_code="NUR101A"), ["NUR 101A"])
+
+    def test_nursing_code_without_variant_matches(self):
+        self.assertEqual(self.list_codes(course_code="nur 101"), ["NUR 101A"])
+        self.assertEqual(self.list_codes(course_code="NUR102"), ["NUR 102"])
+
+    def test_fuzzy_search_with_full_nursing_code(self):
+        self.assertEqual(self.list_codes(search="NUR101A")[0], "NUR 101A")
+
+    def list_page(self, cursor, **params):
+        request = self.factory.get(
+            "/api/exams/",
+            {
+                "institution_id": self.institution.pk,
+                "semester_id": self.semester.pk,
+                "cursor": cursor,
+                **params,
+            },
+        )
+        force_authenticate(request, user=self.user)
+        return ExamScheduleListView.as_view()(request)
+
+    def test_cursor_walks_every_exam(self):
+        response = self.list_page("", page_size=2)
+        self.assertEqual(response.status_code, 200)
+        codes = [exam["course_code"] for exam in response.data["results"]]
+
+        cursor = parse_qs(urlparse(response.data["next"]).query)["cursor"][0]
+        response = self.list_page(cursor, page_size=2)
+        self.assertEqual(response.status_code, 200)
+        codes += [exam["course_code"] for exam in response.data["results"]]
+
+        self.assertEqual(codes, ["NUR 101A", "NUR 102", "BIT 101"])
+        self.assertIsNone(response.data["next"])
+
+    def test_cursor_with_wrong_value_types_is_not_found(self):
+        for position in (
+            ["not a date", 1],
+            [timezone.now().isoformat(), "abc"],
+            [timezone.now().isoformat(), None],
+            [{"start_time": 1}, 1],
+            [timezone.now().isoformat()],
+        ):
+            with self.subTest(position=position):
+                cursor = base64.urlsafe_b64encode(json.dumps(position).encode())
+                response = self.list_page(cursor.decode())
+                self.assertEqual(response.status_code, 404)
+
+    def test_non_integer_ids_are_rejected(self):
+        for params in ({"institution_id": "abc"}, {"semester_id": "1.5"}):
+            with self.subTest(params=params):
+                request = self.factory.get("/api/exams/", params)
+                force_authenticate(request, user=self.user)
+                response = ExamScheduleListView.as_view()(request)
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(
+                    response.data,
+                    {"error": "institution_id and semester_id must be integers"},
+                )
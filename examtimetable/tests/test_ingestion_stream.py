@@ -0,0 +1,69 @@
+import io
+import json
+
+from django.test import SimpleTestCase
+
+from examtimetable.ingestion import InvalidPayloadError, iter_json_array
+
+
+class IterJsonArrayTests(SimpleTestCase):
+    def decode(self, payload: str, read_size: int = 8192) -> list:
+        return list(iter_json_array(io.BytesIO(payload.encode()), read_size))
+
+    def assertInvalid(self, payload: str):
+        for read_size in (1, 3, 8192):
+            with self.subTest(read_size=read_size), self.assertRaises(
+                InvalidPayloadError
+            ):
+                self.decode(payload, read_size)
+
+    def test_matches_json_loads_at_every_read_size(self):
+        payload = json.dumps(
+            [
+                {"course_code": "BIT 101", "hrs": 12345, "venue": "Ukumbi wa Élodie"},
+                1234567890,
+                -0.5e10,
+                "🎓 exam",
+                [1, [2, 3]],
+                True,
+                None,
+            ],
+            ensure_ascii=False,
+        )
+        for read_size in range(1, 12):
+            with self.subTest(read_size=read_size):
+                self.assertEqual(self.decode(payload, read_size), json.loads(payload))
+
+    def test_number_split_across_reads(self):
+        self.assertEqual(self.decode("[12345, 678]", read_size=3), [12345, 678])
+        self.assertEqual(self.decode("[1.5e10]", read_size=4), [1.5e10])
+
+    def test_whitespace_and_empty_arrays(self):
+        self.assertEqual(self.decode("  [ ]  \n"), [])
+        self.assertEqual(
+            self.decode('\n[ {"a": 1} ,\n {"b": 2} ]\n', 2),
+            [
+                {"a": 1},
+                {"b": 2},
+            ],
+        )
+
+    def test_malformed_separators(self):
+        self.assertInvalid('[{"a": 1} {"b": 2}]')
+        self.assertInvalid("[1 2]")
+        self.assertInvalid("[1,,2]")
+        self.assertInvalid("[,1]")
+        self.assertInvalid("[1,]")
+        self.assertInvalid("[1;2]")
+
+    def test_trailing_data(self):
+        self.assertInvalid("[1] 2")
+        self.assertInvalid("[1]]")
+        self.assertInvalid("[1][2]")
+
+    def test_not_an_array_or_truncated(self):
+        self.assertInvalid('{"a": 1}')
+        self.assertInvalid("")
+        self.assertInvalid("[1, 2")
+        self.assertInvalid('[{"a": ')
+        self.assertInvalid("[1, tru]")
@@ -0,0 +1,145 @@
+import shutil
+import tempfile
+from io import BytesIO
+from unittest import mock
+
+import openpyxl
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from examtimetable import jobs
+from examtimetable.ingestion import IngestResult
+from examtimetable.management.commands.run_ingestion_worker import Command
+from examtimetable.models import IngestionJob
+from institutions.models import Institution
+
+
+class IngestionWorkerTests(TestCase):
+    def create_job(self, **fields):
+        return IngestionJob.objects.create(loader="upsert", chunk_size=500, **fields)
+
+    def abandoned(self, **fields):
+        long_ago = timezone.now() - jobs.STALE_AFTER * 2
+        fields = {
+            "status": IngestionJob.Status.RUNNING,
+            "started_at": long_ago,
+            "heartbeat_at": long_ago,
+            "attempts": 1,
+            **fields,
+        }
+        return self.create_job(**fields)
+
+    def test_claims_queued_job(self):
+        job = self.create_job()
+        claimed = jobs.claim_next_job()
+
+        self.assertEqual(claimed.pk, job.pk)
+        self.assertEqual(claimed.status, IngestionJob.Status.RUNNING)
+        self.assertEqual(claimed.attempts, 1)
+        self.assertIsNotNone(claimed.heartbeat_at)
+
+    def test_reclaims_abandoned_running_job(self):
+        job = self.abandoned()
+        claimed = jobs.claim_next_job()
+
+        self.assertEqual(claimed.pk, job.pk)
+        self.assertEqual(claimed.attempts, 2)
+
+    def test_reclaims_running_job_without_heartbeat_by_start_time(self):
+        job = self.abandoned(heartbeat_at=None)
+        self.assertEqual(jobs.claim_next_job().pk, job.pk)
+
+    def test_leaves_live_running_job_alone(self):
+        now = timezone.now()
+        self.create_job(
+            status=IngestionJob.Status.RUNNING, started_at=now, heartbeat_at=now
+        )
+        self.assertIsNone(jobs.claim_next_job())
+
+    def test_fails_job_abandoned_too_often(self):
+        gave_up = self.abandoned(attempts=jobs.MAX_ATTEMPTS)
+        queued = self.create_job()
+
+        self.assertEqual(jobs.claim_next_job().pk, queued.pk)
+        gave_up.refresh_from_db()
+        self.assertEqual(gave_up.status, IngestionJob.Status.FAILED)
+        self.assertIsNotNone(gave_up.finished_at)
+
+    def test_worker_survives_unexpected_errors(self):
+        job = self.create_job()
+        command = Command()
+        options = {"once": True, "poll_interval": 0}
+
+        with mock.patch(
+            "examtimetable.management.commands.run_ingestion_worker.run_job",
+            side_effect=OSError("storage unavailable"),
+        ):
+            self.assertTrue(command.poll(options))
+        self.assertFalse(command.poll(options))
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, IngestionJob.Status.FAILED)
+        self.assertEqual(job.errors[0]["message"], "storage unavailable")
+
+
+def strath_workbook() -> SimpleUploadedFile:
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(["Day", "8:30 - 10:30", "11:00 - 13:00"])
+    sheet.append(["Monday 12/01/2026", "BBS 3104 - STMB 5", "BIT 2201 - LT 1"])
+    content = BytesIO()
+    workbook.save(content)
+    return SimpleUploadedFile("timetable.xlsx", content.getvalue())
+
+
+class SpreadsheetJobTests(TestCase):
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        storages = override_settings(
+            STORAGES={
+                "default": {
+                    "BACKEND": "django.core.files.storage.FileSystemStorage",
+                    "OPTIONS": {"location": media_root},
+                },
+            }
+        )
+        storages.enable()
+        self.addCleanup(storages.disable)
+        self.institution = Institution.objects.create(
+            name="Test University",
+            web_pages=["https://test.ac.ke"],
+            domains=["test.ac.ke"],
+            country="Kenya",
+        )
+
+    def test_spreadsheet_is_stored_and_parsed_by_the_worker(self):
+        with mock.patch.object(
+            jobs, "iter_exam_items", wraps=jobs.iter_exam_items
+        ) as iter_exam_items:
+            job = jobs.enqueue_spreadsheet(
+                strath_workbook(), "strath", self.institution.pk, "JAN26", "upsert", 500
+            )
+            self.assertFalse(iter_exam_items.called)
+        self.assertTrue(job.payload.name.endswith(".xlsx"))
+
+        ingested = []
+
+        def load(items, **options):
+            ingested.extend(items)
+            return IngestResult(created_count=len(ingested))
+
+        with mock.patch.dict(jobs.LOADERS, {"upsert": load}):
+            job = jobs.run_job(jobs.claim_next_job())
+
+        self.assertEqual(job.status, IngestionJob.Status.SUCCEEDED)
+        self.assertEqual(job.created_count, 2)
+        self.assertEqual(
+            [(item["course_code"], item["venue"]) for item in ingested],
+            [("BBS 3104", "STMB 5"), ("BIT 2201", "LT 1")],
+        )
+        self.assertEqual(
+            {(item["institution"], item["semester"]) for item in ingested},
+            {(self.institution.pk, "JAN26")},
+        )
@@ -0,0 +1,85 @@
+import tempfile
+from datetime import date, timedelta
+from pathlib import Path
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from courses.models import SemesterInfo
+from examtimetable import cache as exam_cache
+from examtimetable.models import ExamSchedule
+from examtimetable.views import ExamScheduleByInstitutionView
+from institutions.models import Institution
+from users.models import User
+
+
+class ExamScheduleByInstitutionViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.institution = Institution.objects.create(
+            name="Test University",
+            web_pages=["https://test.ac.ke"],
+            domains=["test.ac.ke"],
+            country="Kenya",
+        )
+        cls.semester = SemesterInfo.objects.create(
+            code="JAN26",
+            name="JAN26",
+            start_date=date(2026, 1, 1),
+            end_date=date(2026, 4, 30),
+        )
+        cls.user = User.objects.create(name="Test Student", username="student")
+        start = timezone.now() + timedelta(days=7)
+        ExamSchedule.objects.create(
+            course_code="BIT 101",
+            semester=cls.semester,
+            institution=cls.institution,
+            start_time=start,
+            end_time=start + timedelta(hours=2),
+            venue="Hall A",
+            hrs="2",
+        )
+
+    def setUp(self):
+        self.factory = APIRequestFactory()
+        cache.clear()
+        exam_cache._latest_semesters.clear()
+        snapshot_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(snapshot_dir.cleanup)
+        self.snapshot_dir = Path(snapshot_dir.name)
+        settings_override = override_settings(EXAM_SNAPSHOT_DIR=snapshot_dir.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def get(self, **params):
+        request = self.factory.get("/api/exams/institution/", params)
+        force_authenticate(request, user=self.user)
+        return ExamScheduleByInstitutionView.as_view()(request)
+
+    def test_serves_snapshot(self):
+        response = self.get(
+            institution_id=self.institution.pk, semester_id=self.semester.pk
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue((self.snapshot_dir / str(self.institution.pk)).is_dir())
+
+    def test_non_numeric_ids_are_rejected(self):
+        self.assertEqual(self.get(institution_id="abc").status_code, 400)
+        self.assertEqual(
+            self.get(
+                institution_id=self.institution.pk, semester_id="../x"
+            ).status_code,
+            400,
+        )
+
+    def test_unknown_ids_do_not_build_snapshots(self):
+        self.assertEqual(self.get(institution_id=999999).status_code, 404)
+        self.assertEqual(
+            self.get(
+                institution_id=self.institution.pk, semester_id=999999
+            ).status_code,
+            404,
+        )
+        self.assertEqual(list(self.snapshot_dir.iterdir()), [])
@@ -0,0 +1,111 @@
+from datetime import date, timedelta
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from courses.models import Course, SemesterInfo, StudentCourseEnrollment
+from examtimetable import cache as exam_cache
+from examtimetable.models import ExamSchedule
+from examtimetable.views import StudentExamScheduleView
+from institutions.models import Institution
+from users.models import StudentProfile, User
+
+
+class StudentExamScheduleQueryCountTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.institution = Institution.objects.create(
+            name="Test University",
+            web_pages=["https://test.ac.ke"],
+            domains=["test.ac.ke"],
+            country="Kenya",
+        )
+        cls.semester = SemesterInfo.objects.create(
+            code="JAN26",
+            name="JAN26",
+            start_date=date(2026, 1, 1),
+            end_date=date(2026, 4, 30),
+        )
+        cls.user = User.objects.create(name="Test Student", username="student")
+        cls.student = StudentProfile.objects.create(
+            user=cls.user, student_id="S-0001", institution=cls.institution
+        )
+
+    def setUp(self):
+        self.factory = APIRequestFactory()
+        self.enrolled = 0
+
+    def enroll(self, count):
+        start = timezone.now() + timedelta(days=7)
+        for _ in range(count):
+            self.enrolled += 1
+            course_code = f"BIT{100 + self.enrolled}"
+            course = Course.objects.create(
+                course_code=course_code,
+                course_name=f"Course {self.enrolled}",
+                semester=self.semester,
+                institution=self.institution,
+            )
+            StudentCourseEnrollment.objects.create(
+                student=self.student, course=course, semester=self.semester
+            )
+            ExamSchedule.objects.create(
+                course_code=course_code,
+                semester=self.semester,
+                institution=self.institution,
+                start_time=start + timedelta(hours=self.enrolled),
+                end_time=start + timedelta(hours=self.enrolled + 2),
+                venue="Hall A",
+                hrs="2",
+            )
+
+    def get_schedule(self):
+        cache.clear()
+        exam_cache._latest_semesters.clear()
+        request = self.factory.get(
+            "/api/exams/student/", {"student_id": self.student.student_id}
+        )
+        force_authenticate(request, user=self.user)
+        return StudentExamScheduleView.as_view()(request)
+
+    def test_query_count_does_not_grow_with_enrollments(self):
+        self.enroll(1)
+        with CaptureQueriesContext(connection) as single_enrollment:
+            response = self.get_schedule()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data), 1)
+
+        self.enroll(7)
+        with self.assertNumQueries(len(single_enrollment)):
+            response = self.get_schedule()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data), 8)
+
+    def test_default_semester_is_the_students_latest_exam(self):
+        self.enroll(2)
+        later = SemesterInfo.objects.create(
+            code="MAY26",
+            name="MAY26",
+            start_date=date(2026, 5, 1),
+            end_date=date(2026, 8, 31),
+        )
+        start = timezone.now() + timedelta(days=120)
+        ExamSchedule.objects.create(
+            course_code="ACS999",
+            semester=later,
+            institution=self.institution,
+            start_time=start,
+            end_time=start + timedelta(hours=2),
+            venue="Hall B",
+            hrs="2",
+        )
+
+        response = self.get_schedule()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [exam["course_code"] for exam in response.data], ["BIT101", "BIT102"]
+        )
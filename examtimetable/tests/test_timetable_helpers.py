@@ -0,0 +1,169 @@
+from datetime import date, datetime, time
+
+from django.test import SimpleTestCase
+
+from examtimetable.helpers.common import (
+    HEADER_SCAN_ROWS,
+    iter_table,
+    parse_date,
+    parse_time_range,
+    to_ingest_item,
+)
+
+FIELDS = ["date", "time", "course_code", "venue"]
+HEADER = ("Date", "Time", "Course Code", "Venue")
+
+
+class ParseTimeRangeTests(SimpleTestCase):
+    def test_formats(self):
+        cases = {
+            "8:30AM-10:30AM": (time(8, 30), time(10, 30)),
+            "0830-1030HRS": (time(8, 30), time(10, 30)),
+            "8.30-10.30": (time(8, 30), time(10, 30)),
+            "2.00 - 5.00pm": (time(14), time(17)),
+            "9.00 a.m. to 11.00 a.m.": (time(9), time(11)),
+            "9:00am – 12:00pm": (time(9), time(12)),
+        }
+        for value, expected in cases.items():
+            with self.subTest(value=value):
+                self.assertEqual(parse_time_range(value), expected)
+
+    def test_start_follows_end_meridiem(self):
+        self.assertEqual(parse_time_range("11.00-1.00pm"), (time(11), time(13)))
+        self.assertEqual(parse_time_range("12.00-3.00pm"), (time(12), time(15)))
+
+    def test_bare_early_hours_are_afternoon(self):
+        self.assertEqual(parse_time_range("2-4"), (time(14), time(16)))
+
+    def test_unparseable(self):
+        for value in ("TBA", "", None, "25:00-26:00", time(9)):
+            with self.subTest(value=value):
+                self.assertIsNone(parse_time_range(value))
+
+
+class ParseDateTests(SimpleTestCase):
+    def test_formats(self):
+        for value in ("Monday 6th April 2026", "06/04/2026", datetime(2026, 4, 6, 9)):
+            with self.subTest(value=value):
+                self.assertEqual(parse_date(value), date(2026, 4, 6))
+
+    def test_without_a_date(self):
+        for value in ("TBA", "Friday", None):
+            with self.subTest(value=value):
+                self.assertIsNone(parse_date(value))
+
+
+class IterTableTests(SimpleTestCase):
+    def test_header_found_below_title_rows(self):
+        rows = [
+            ("DAYSTAR UNIVERSITY", None, None, None),
+            (None, None, None, None),
+            HEADER,
+            ("6/4/2026", "8.30-10.30am", "ACS 101", "Hall A"),
+        ]
+        self.assertEqual(
+            list(iter_table(rows, FIELDS)),
+            [
+                {
+                    "date": "6/4/2026",
+                    "time": "8.30-10.30am",
+                    "venue": "Hall A",
+                    "course_code": "ACS 101",
+                }
+            ],
+        )
+
+    def test_no_header_within_scan_rows(self):
+        rows = [("Exam timetable",)] * HEADER_SCAN_ROWS + [
+            HEADER,
+            ("6/4/2026", "8.30-10.30am", "ACS 101", "Hall A"),
+        ]
+        self.assertEqual(list(iter_table(rows, FIELDS)), [])
+        self.assertEqual(list(iter_table([("Course Code",)], FIELDS)), [])
+
+    def test_merged_cells_fill_down_and_blank_rows_are_skipped(self):
+        rows = [
+            HEADER,
+            (datetime(2026, 4, 6), "8.30-10.30am", "ACS 101", "Hall A"),
+            (None, None, "ACS 102", "Hall B"),
+            (None, None, None, None),
+            (None, "2.00-4.00pm", "MAT 200"),
+        ]
+        entries = list(iter_table(rows, FIELDS))
+
+        self.assertEqual(
+            [e["course_code"] for e in entries], ["ACS 101", "ACS 102", "MAT 200"]
+        )
+        self.assertEqual({e["date"] for e in entries}, {datetime(2026, 4, 6)})
+        self.assertEqual(entries[1]["time"], "8.30-10.30am")
+        self.assertEqual(entries[2]["time"], "2.00-4.00pm")
+        self.assertNotIn("venue", entries[2])
+
+    def test_repeated_headers_are_skipped(self):
+        rows = [
+            HEADER,
+            ("6/4/2026", "8.30-10.30am", "ACS 101", "Hall A"),
+            HEADER,
+            ("7/4/2026", "8.30-10.30am", "ACS 102", "Hall A"),
+        ]
+        self.assertEqual(
+            [e["course_code"] for e in iter_table(rows, FIELDS)],
+            ["ACS 101", "ACS 102"],
+        )
+
+    def test_cell_with_several_codes(self):
+        rows = [HEADER, ("6/4/2026", "8.30-10.30am", "BIT 1101/BBIT 1101", "Hall A")]
+        self.assertEqual(
+            [e["course_code"] for e in iter_table(rows, FIELDS)],
+            ["BIT 1101", "BBIT 1101"],
+        )
+
+
+class ToIngestItemTests(SimpleTestCase):
+    def test_time_range(self):
+        item = to_ingest_item(
+            {
+                "date": datetime(2026, 4, 6),
+                "time": "8.30-10.30am",
+                "course_code": "ACS 101",
+                "venue": "Hall A",
+            },
+            1,
+            "JAN26",
+        )
+        self.assertEqual(
+            item,
+            {
+                "institution": 1,
+                "course_code": "ACS 101",
+                "start_time": "2026-04-06T08:30:00+03:00",
+                "end_time": "2026-04-06T10:30:00+03:00",
+                "venue": "Hall A",
+                "hrs": "2",
+                "raw_data": {"date": "2026-04-06T00:00:00", "time": "8.30-10.30am"},
+                "semester": "JAN26",
+            },
+        )
+
+    def test_start_time_and_duration(self):
+        item = to_ingest_item(
+            {
+                "date": "7/4/2026",
+                "time": time(14),
+                "hrs": "3",
+                "course_code": "ACS 101",
+            },
+            1,
+        )
+        self.assertEqual(item["start_time"], "2026-04-07T14:00:00+03:00")
+        self.assertEqual(item["end_time"], "2026-04-07T17:00:00+03:00")
+        self.assertEqual(item["venue"], "TBA")
+        self.assertNotIn("semester", item)
+
+    def test_without_a_date_or_time(self):
+        self.assertIsNone(
+            to_ingest_item({"day": "Friday", "time": "9-11am", "course_code": "A"}, 1)
+        )
+        self.assertIsNone(
+            to_ingest_item({"date": "7/4/2026", "time": "TBA", "course_code": "A"}, 1)
+        )
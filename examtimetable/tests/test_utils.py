@@ -0,0 +1,28 @@
+from django.test import SimpleTestCase
+
+from examtimetable.utils import normalize_course_code
+
+
+class NormalizeCourseCodeTests(SimpleTestCase):
+    def test_nursing_variant_is_dropped(self):
+        self.assertEqual(normalize_course_code("NUR101A"), "NUR101")
+        self.assertEqual(normalize_course_code("nup 210 b"), "NUP210")
+
+    def test_nursing_code_without_variant_is_kept(self):
+        self.assertEqual(normalize_course_code("NUR101"), "NUR101")
+        self.assertEqual(normalize_course_code(" NUP 210 "), "NUP210")
+
+    def test_submitted_and_stored_codes_agree(self):
+        self.assertEqual(
+            normalize_course_code("NUR 101"), normalize_course_code("NUR101A")
+        )
+
+    def test_only_a_trailing_letter_after_the_digits_is_dropped(self):
+        self.assertEqual(normalize_course_code("NURS101A"), "NURS101A")
+        self.assertEqual(normalize_course_code("BNUR101A"), "BNUR101A")
+        self.assertEqual(normalize_course_code("NUR101AB"), "NUR101AB")
+
+    def test_other_codes(self):
+        self.assertEqual(normalize_course_code(" acs 101 "), "ACS101")
+        self.assertEqual(normalize_course_code("ACS101A"), "ACS101A")
+        self.assertEqual(normalize_course_code(None), "")
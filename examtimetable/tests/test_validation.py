@@ -0,0 +1,73 @@
+from datetime import date
+
+from django.test import TestCase
+
+from courses.models import SemesterInfo
+from examtimetable.serializers import ExamScheduleSerializer
+from examtimetable.validation import validate_exam_items
+from institutions.models import Institution
+
+
+class BatchValidatorParityTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.institution = Institution.objects.create(
+            name="Test University",
+            web_pages=["https://test.ac.ke"],
+            domains=["test.ac.ke"],
+            country="Kenya",
+        )
+        cls.semester = SemesterInfo.objects.create(
+            code="JAN26",
+            name="JAN26",
+            start_date=date(2026, 1, 1),
+            end_date=date(2026, 4, 30),
+        )
+        cls.item = {
+            "institution": cls.institution.pk,
+            "semester": cls.semester.pk,
+            "course_code": " BIT 101 ",
+            "start_time": "2026-04-06T08:00:00+03:00",
+            "end_time": "2026-04-06 10:00",
+            "venue": "Main Hall",
+            "coordinator": "Élodie Wanjiru",
+            "hrs": 2,
+            "raw_data": {"day": "Monday"},
+        }
+
+    def assertMatchesSerializer(self, items):
+        serializer = ExamScheduleSerializer(data=items, many=True)
+        valid = serializer.is_valid()
+        validated_data, field_errors = validate_exam_items(items)
+
+        if not valid:
+            self.assertEqual(field_errors, serializer.errors)
+            return
+        self.assertIsNone(field_errors)
+        self.assertEqual(validated_data, serializer.validated_data)
+
+    def test_valid_items(self):
+        self.assertMatchesSerializer(
+            [self.item, {**self.item, "semester": None, "course_code": "BIT 102"}]
+        )
+
+    def test_invalid_items(self):
+        without_venue = {k: v for k, v in self.item.items() if k != "venue"}
+        cases = [
+            {**self.item, "institution": 999999},
+            {**self.item, "institution": "abc"},
+            {**self.item, "institution": True},
+            {**self.item, "institution": None},
+            {**self.item, "semester": 999999},
+            {**self.item, "venue": "   "},
+            {**self.item, "venue": None},
+            {**self.item, "hrs": "12345678901"},
+            {**self.item, "course_code": ["BIT 101"]},
+            {**self.item, "start_time": "next monday"},
+            {**self.item, "end_time": 5},
+            without_venue,
+            "BIT 101",
+        ]
+        for case in cases:
+            with self.subTest(case=case):
+                self.assertMatchesSerializer([self.item, case])
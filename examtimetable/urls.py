@@ -4,6 +4,8 @@ from . import views
 urlpatterns = [
     path('student/', views.StudentExamScheduleView.as_view(), name='student-exam-schedule'),
     path('ingest/', views.IngestExamScheduleView.as_view(), name='ingest-exam-schedule'),
+    path('ingest/spreadsheet/', views.IngestSpreadsheetView.as_view(), name='ingest-exam-schedule-spreadsheet'),
+    path('ingest/<uuid:job_id>/', views.IngestionJobView.as_view(), name='ingest-exam-schedule-job'),
     path('by-codes/', views.ExamScheduleByCourseCodesView.as_view(), name='exam-schedule-by-codes'),
     path('by-institution/', views.ExamScheduleByInstitutionView.as_view(), name='exam-schedule-by-institution'),
     path('', views.ExamScheduleListView.as_view(), name='exam-schedule-list'),
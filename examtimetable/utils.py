@@ -0,0 +1,22 @@
+import re
+
+WHITESPACE_RE = re.compile(r"\s+")
+# A nursing code followed by its variant letter, e.g. NUR101A.
+NURSING_VARIANT_RE = re.compile(r"^(NU[RP]\d+)[A-Z]$")
+
+
+def normalize_course_code(course_code: str | None) -> str:
+    """
+    Normalize a course code for exact, indexable lookups.
+
+    Whitespace is stripped and the code is upper-cased. Nursing codes
+    (NUR/NUP) carry a trailing variant letter after the digits that students
+    do not always submit, so it is dropped on both the stored and the queried
+    side: NUR101A and NUR101 both normalize to NUR101. Search terms go
+    through the same normalization so they match the stored column.
+    """
+    if not course_code:
+        return ""
+
+    normalized = WHITESPACE_RE.sub("", str(course_code)).upper()
+    return NURSING_VARIANT_RE.sub(r"\1", normalized)
@@ -0,0 +1,187 @@
+import json
+from collections.abc import Mapping
+from datetime import datetime
+
+from rest_framework.exceptions import ErrorDetail, ValidationError
+from rest_framework.fields import CharField, DateTimeField, JSONField, empty
+from rest_framework.settings import api_settings
+
+from courses.models import SemesterInfo
+from institutions.models import Institution
+
+from .serializers import ExamScheduleSerializer
+
+RELATED_MODELS = {"institution": Institution, "semester": SemesterInfo}
+
+
+class BatchValidator:
+    """
+    Validate a batch of raw exam items the way ``ExamScheduleSerializer``
+    with ``many=True`` would, without running the full field machinery for
+    every item.
+
+    Plain strings, ISO 8601 datetimes with an offset and integer ids take a
+    fast path that checks the same rules inline. Anything else goes through
+    the serializer's own field, so values are coerced and error messages come
+    out exactly as DRF would produce them. Related ids are collected across the batch and confirmed
+    with one query per model.
+    """
+
+    def __init__(self) -> None:
+        fields = ExamScheduleSerializer().fields
+        self.fields = {
+            name: field for name, field in fields.items() if not field.read_only
+        }
+        self.timezone = None
+        self.naive_is_safe = False
+
+    def validate(self, items: list) -> tuple[list[dict], list[dict] | None]:
+        """
+        Return ``(validated_data, None)`` when every item is valid, otherwise
+        ``([], field_errors)`` with one error dict per item, like
+        ``serializer.errors``.
+        """
+        validated = []
+        errors = []
+        related_ids = {name: set() for name in RELATED_MODELS}
+        # Resolved once per batch rather than once per datetime.
+        self.timezone = DateTimeField().default_timezone()
+        self.naive_is_safe = getattr(self.timezone, "key", None) == "UTC"
+
+        for item in items:
+            data, item_errors = self._validate_item(item, related_ids)
+            validated.append(data)
+            errors.append(item_errors)
+
+        instances = {
+            name: RELATED_MODELS[name].objects.in_bulk(ids) if ids else {}
+            for name, ids in related_ids.items()
+        }
+
+        for data, item_errors in zip(validated, errors):
+            for name, objects in instances.items():
+                pk = data.get(name)
+                if pk is None or name in item_errors:
+                    continue
+                if pk in objects:
+                    data[name] = objects[pk]
+                else:
+                    field = self.fields[name]
+                    item_errors[name] = [
+                        self._error(field, "does_not_exist", pk_value=pk)
+                    ]
+
+        if any(errors):
+            return [], [self._in_field_order(item_errors) for item_errors in errors]
+        return validated, None
+
+    def _in_field_order(self, item_errors: dict) -> dict:
+        ordered = {
+            name: item_errors[name] for name in self.fields if name in item_errors
+        }
+        return ordered or item_errors
+
+    def _validate_item(self, item, related_ids: dict) -> tuple[dict, dict]:
+        if not isinstance(item, Mapping):
+            message = ExamScheduleSerializer.default_error_messages["invalid"]
+            return {}, {
+                api_settings.NON_FIELD_ERRORS_KEY: [
+                    ErrorDetail(
+                        message.format(datatype=type(item).__name__), code="invalid"
+                    )
+                ]
+            }
+
+        data = {}
+        item_errors = {}
+        for name, field in self.fields.items():
+            value = item.get(name, empty)
+            if value is empty and not field.required:
+                continue
+
+            try:
+                if name in RELATED_MODELS:
+                    value = self._validate_related(field, value)
+                    if value is not None:
+                        related_ids[name].add(value)
+                elif isinstance(field, CharField):
+                    value = self._validate_char(field, value)
+                elif isinstance(field, DateTimeField):
+                    value = self._validate_datetime(field, value)
+                elif isinstance(field, JSONField) and value is not None:
+                    self._validate_json(field, value)
+                else:
+                    value = field.run_validation(value)
+            except ValidationError as e:
+                item_errors[name] = e.detail
+            else:
+                data[name] = value
+
+        return data, item_errors
+
+    @staticmethod
+    def _validate_char(field: CharField, value):
+        if type(value) is int:
+            value = str(value)
+        if type(value) is str and "\x00" not in value and _no_surrogates(value):
+            stripped = value.strip() if field.trim_whitespace else value
+            if stripped and (
+                field.max_length is None or len(stripped) <= field.max_length
+            ):
+                return stripped
+        return field.run_validation(value)
+
+    def _validate_datetime(self, field: DateTimeField, value):
+        # Naive values need DRF's make_aware checks for ambiguous and missing
+        # local times, which can only be skipped when the zone is UTC.
+        if (
+            type(value) is str
+            and self.timezone is not None
+            and getattr(field, "timezone", None) is None
+        ):
+            try:
+                parsed = datetime.fromisoformat(value)
+                if parsed.tzinfo is not None:
+                    return parsed.astimezone(self.timezone)
+                if self.naive_is_safe:
+                    return parsed.replace(tzinfo=self.timezone)
+            except (ValueError, OverflowError):
+                pass
+        return field.run_validation(value)
+
+    @staticmethod
+    def _validate_json(field: JSONField, value) -> None:
+        try:
+            json.dumps(value, cls=field.encoder)
+        except (TypeError, ValueError):
+            field.fail("invalid")
+
+    @staticmethod
+    def _validate_related(field, value):
+        # Existence is checked once for the whole batch; only resolve the
+        # type here, leaving unusual values to DRF for its exact behaviour.
+        if type(value) is int:
+            return value
+        if type(value) is str and value.isascii() and value.isdigit():
+            return int(value)
+        if value is empty or value is None or value == "":
+            return field.run_validation(value)
+        return field.run_validation(value).pk
+
+    @staticmethod
+    def _error(field, key: str, **kwargs) -> ErrorDetail:
+        return ErrorDetail(field.error_messages[key].format(**kwargs), code=key)
+
+
+def _no_surrogates(value: str) -> bool:
+    if value.isascii():
+        return True
+    try:
+        value.encode()
+    except UnicodeEncodeError:
+        return False
+    return True
+
+
+def validate_exam_items(items: list) -> tuple[list[dict], list[dict] | None]:
+    return BatchValidator().validate(items)
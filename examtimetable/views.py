@@ -1,25 +1,101 @@
 import logging
+import zipfile
 
-from datetime import timedelta
-from django.db import transaction
-from django.db.models import QuerySet
-from django.utils import timezone
+from functools import reduce
+from operator import or_
+
+import xlrd
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.core.files.uploadhandler import TemporaryFileUploadHandler
+from django.db.models import Q, QuerySet
+from django.db.models.functions import Greatest
+from openpyxl.utils.exceptions import InvalidFileException
 from rest_framework import status
+from rest_framework.exceptions import ParseError
 from rest_framework.generics import ListAPIView
+from rest_framework.parsers import MultiPartParser
 from rest_framework.response import Response
+from rest_framework.reverse import reverse
 from rest_framework.views import APIView
 
 from courses.models import SemesterInfo, StudentCourseEnrollment
 
 from .auth import IngestAPIKeyPermission
 from professor.pagination import ResultsSetPagination
+from professor.verisafe_jwt_authentication import LazyVerisafeJWTAuthentication
+from institutions.models import Institution
 from users.models import StudentProfile
 
-from .models import ExamSchedule
-from .serializers import ExamScheduleSerializer
+from .cache import (
+    cached_exam_response,
+    get_latest_semester_id,
+    get_student_version,
+    get_timetable_version,
+)
+from .copy_loader import copy_load
+from .ingestion import (
+    CHUNK_SIZE,
+    IngestValidationError,
+    InvalidPayloadError,
+    error_details,
+    ingest_items,
+    ingest_stream,
+    iter_json_array,
+    iter_ndjson,
+    publish_ingestion,
+)
+from .helpers import (
+    PARSERS,
+    Workbook,
+    is_spreadsheet,
+    iter_exam_items,
+    parser_for_domains,
+)
+from .jobs import enqueue_ingestion, enqueue_spreadsheet
+from .models import ExamSchedule, IngestionJob
+from .serializers import ExamScheduleSerializer, IngestionJobSerializer
+from .snapshots import get_snapshot, snapshot_response
+from .utils import normalize_course_code
 
 logger = logging.getLogger(__name__)
 
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def fuzzy_course_code_search(
+    queryset: QuerySet[ExamSchedule], terms: list[str]
+) -> QuerySet[ExamSchedule]:
+    """
+    Filter exams whose normalized course code contains, or closely resembles,
+    any of the given terms, ranked by trigram word similarity.
+    Both predicates are served by the gin_trgm_ops index on normalized_course_code.
+    """
+    # Normalized like the column, so a full nursing code such as NUR101A
+    # matches its own row.
+    terms = [normalize_course_code(term) for term in terms if isinstance(term, str)]
+    terms = [term for term in terms if term]
+    if not terms:
+        return queryset.none()
+
+    matches = reduce(
+        or_,
+        (
+            Q(normalized_course_code__contains=term)
+            | Q(normalized_course_code__trigram_word_similar=term)
+            for term in terms
+        ),
+    )
+    similarities = [
+        TrigramWordSimilarity(term, "normalized_course_code") for term in terms
+    ]
+    similarity = similarities[0] if len(similarities) == 1 else Greatest(*similarities)
+
+    return (
+        queryset.filter(matches)
+        .annotate(similarity=similarity)
+        .order_by("-similarity", "start_time", "pk")
+    )
+
 
 class StudentExamScheduleView(APIView):
     """
@@ -38,58 +114,93 @@ class StudentExamScheduleView(APIView):
             )
 
         try:
-            student = StudentProfile.objects.get(student_id=student_id)
+            student = StudentProfile.objects.only("id", "institution_id").get(
+                student_id=student_id
+            )
         except StudentProfile.DoesNotExist:
             return Response(
                 {"error": "Student not found"}, status=status.HTTP_404_NOT_FOUND
             )
 
-        enrollments = StudentCourseEnrollment.objects.filter(student=student)
+        enrolled_course_codes = StudentCourseEnrollment.objects.filter(
+            student=student
+        ).values("course__course_code")
         if semester_id:
-            try:
-                semester = SemesterInfo.objects.get(id=semester_id)
-                enrollments = enrollments.filter(semester=semester)
-            except SemesterInfo.DoesNotExist:
+            if not SemesterInfo.objects.filter(id=semester_id).exists():
                 return Response(
                     {"error": "Semester not found"}, status=status.HTTP_404_NOT_FOUND
                 )
+            enrolled_course_codes = enrolled_course_codes.filter(
+                semester_id=semester_id
+            )
 
-        course_codes = [enrollment.course.course_code for enrollment in enrollments]
-
-        exams = ExamSchedule.objects.filter(course_code__in=course_codes)
-        if semester_id:
-            exams = exams.filter(semester_id=semester_id)
-        else:
-            latest_exam = exams.order_by("-start_time", "-pk").first()
-            if latest_exam and latest_exam.semester_id:
-                exams = exams.filter(semester_id=latest_exam.semester_id)
+        def build():
+            # Enrollments are resolved in a subquery so the cost stays constant
+            # regardless of how many courses the student is enrolled in.
+            exams = ExamSchedule.objects.filter(course_code__in=enrolled_course_codes)
+            if student.institution_id:
+                exams = exams.filter(institution_id=student.institution_id)
+            # Without a semester, default to the one of the student's own
+            # latest exam rather than the institution's latest semester.
+            exam_semester_id = semester_id or (
+                exams.order_by("-start_time", "-pk")
+                .values_list("semester_id", flat=True)
+                .first()
+            )
+            if exam_semester_id:
+                exams = exams.filter(semester_id=exam_semester_id)
+            return list(ExamScheduleSerializer(exams, many=True).data)
 
-        serializer = ExamScheduleSerializer(exams, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return cached_exam_response(
+            request,
+            scope={"view": "student", "student": student.pk, "semester": semester_id},
+            versions=[
+                get_timetable_version(student.institution_id),
+                get_student_version(student.pk),
+            ],
+            build=build,
+        )
 
 
 class ExamScheduleListView(ListAPIView):
     """
     List all exam schedules (paginated).
-    Query params: course_code (optional), semester_id (optional)
+    Query params: institution_id (optional), course_code (optional),
+    search (optional, fuzzy and ranked), semester_id (optional),
+    cursor (optional, walks the results in start_time order)
     """
 
     serializer_class = ExamScheduleSerializer
     pagination_class = ResultsSetPagination
+    cursor_ordering = ("start_time", "id")
 
     def get_queryset(self) -> QuerySet[ExamSchedule]:
         queryset = ExamSchedule.objects.all()
+        institution_id = self.request.query_params.get("institution_id")
         course_code = self.request.query_params.get("course_code")
+        search = self.request.query_params.get("search")
         semester_id = self.request.query_params.get("semester_id")
 
+        try:
+            institution_id = int(institution_id) if institution_id else None
+            semester_id = int(semester_id) if semester_id else None
+        except ValueError:
+            raise ParseError(
+                {"error": "institution_id and semester_id must be integers"}
+            )
+
+        if institution_id:
+            queryset = queryset.filter(institution_id=institution_id)
         if course_code:
-            queryset = queryset.filter(course_code__icontains=course_code)
+            queryset = queryset.filter(
+                normalized_course_code__contains=normalize_course_code(course_code)
+            )
+        if search:
+            queryset = fuzzy_course_code_search(queryset, [search])
+        if not semester_id:
+            semester_id = get_latest_semester_id(institution_id)
         if semester_id:
             queryset = queryset.filter(semester_id=semester_id)
-        else:
-            latest_exam = queryset.order_by("-start_time", "-pk").first()
-            if latest_exam and latest_exam.semester_id:
-                queryset = queryset.filter(semester_id=latest_exam.semester_id)
 
         return queryset
 
@@ -97,8 +208,13 @@ class ExamScheduleListView(ListAPIView):
 class ExamScheduleByCourseCodesView(APIView):
     """
     Get exam schedules for a list of course codes.
+    Body: institution_id (required), course_codes (required list),
+    semester_id (optional), match ("exact" by default, or "fuzzy" for ranked
+    substring and typo-tolerant matches)
     """
 
+    authentication_classes = [LazyVerisafeJWTAuthentication]
+
     def post(self, request):
         institution_id = request.data.get("institution_id")
         course_codes = request.data.get("course_codes")
@@ -115,47 +231,66 @@ class ExamScheduleByCourseCodesView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        semester_id = request.data.get("semester_id")
-        if not semester_id:
-            latest_exam = (
-                ExamSchedule.objects.filter(institution_id=institution_id)
-                .order_by("-start_time", "-pk")
-                .first()
+        match = request.data.get("match", "exact")
+        if match not in ("exact", "fuzzy"):
+            return Response(
+                {"error": "match must be either 'exact' or 'fuzzy'"},
+                status=status.HTTP_400_BAD_REQUEST,
             )
-            if latest_exam and latest_exam.semester_id:
-                semester_id = latest_exam.semester_id
-
-        exams_info = []  # will hold the Data to return
-
-        for course_code in course_codes:
-            # removing optional spaces to the search query to match spaces between searches
-            course_code = course_code.replace(" ", "")
 
-            if "NUR" in course_code or "NUP" in course_code:
-                course_code = course_code[:-1]
+        semester_id = request.data.get("semester_id") or get_latest_semester_id(
+            institution_id
+        )
 
-            mod_course_code = "".join(f"{char}\s*" for char in course_code)
-
-            qs = ExamSchedule.objects.filter(
-                course_code__iregex=f".*{mod_course_code}.*",
-                institution_id=institution_id,
+        if match == "fuzzy":
+            codes = sorted(
+                {code.strip().upper() for code in course_codes if isinstance(code, str)}
+            )
+        else:
+            codes = sorted(
+                {
+                    normalize_course_code(course_code)
+                    for course_code in course_codes
+                    if isinstance(course_code, str)
+                }
+                - {""}
             )
-            if semester_id:
-                qs = qs.filter(semester_id=semester_id)
-
-            for exam_info in qs.all():
-                exams_info.append(exam_info)
 
-        serializer = ExamScheduleSerializer(exams_info, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        def build():
+            exams_info = ExamSchedule.objects.filter(institution_id=institution_id)
+            if match == "fuzzy":
+                exams_info = fuzzy_course_code_search(exams_info, codes)
+            else:
+                exams_info = exams_info.filter(normalized_course_code__in=codes)
+            if semester_id:
+                exams_info = exams_info.filter(semester_id=semester_id)
+            return list(ExamScheduleSerializer(exams_info, many=True).data)
+
+        return cached_exam_response(
+            request,
+            scope={
+                "view": "by-codes",
+                "institution": str(institution_id),
+                "semester": semester_id,
+                "match": match,
+                "codes": codes,
+            },
+            versions=[get_timetable_version(institution_id)],
+            build=build,
+        )
 
 
 class ExamScheduleByInstitutionView(APIView):
     """
     Get exam schedules for a specific institution.
     Query params: institution_id (required), semester_id (optional)
+
+    Served from a pre-serialized, pre-compressed snapshot that ingestion
+    rebuilds, so no ORM or serializer work happens per request.
     """
 
+    authentication_classes = [LazyVerisafeJWTAuthentication]
+
     def get(self, request):
         institution_id = request.query_params.get("institution_id")
         semester_id = request.query_params.get("semester_id")
@@ -166,185 +301,298 @@ class ExamScheduleByInstitutionView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        exams = ExamSchedule.objects.filter(institution_id=institution_id)
+        try:
+            institution_id = int(institution_id)
+            semester_id = int(semester_id) if semester_id else None
+        except ValueError:
+            return Response(
+                {"error": "institution_id and semester_id must be integers"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
-        if semester_id:
-            exams = exams.filter(semester_id=semester_id)
-        else:
-            latest_exam = exams.order_by("-start_time", "-pk").first()
-            if latest_exam and latest_exam.semester_id:
-                exams = exams.filter(semester_id=latest_exam.semester_id)
+        if not semester_id:
+            semester_id = get_latest_semester_id(institution_id)
 
-        serializer = ExamScheduleSerializer(exams, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        snapshot = get_snapshot(institution_id, semester_id)
+        if snapshot is None:
+            return Response(
+                {"error": "Institution or semester not found"},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        return snapshot_response(request, snapshot)
 
 
 class IngestExamScheduleView(APIView):
     """
     Ingest exam schedules from JSON payload.
     POST: institution_id (required), semester_id (optional), items (required array)
+
+    Large uploads can be streamed instead, either as NDJSON
+    (Content-Type: application/x-ndjson) or as a bare JSON array with
+    ?stream=true. Streamed items are validated and committed in chunks of
+    ?chunk_size= items (default 500) and the response reports each chunk.
+
+    ?loader=copy loads either kind of payload through a COPY-fed staging
+    table in one transaction, for very large initial imports.
+
+    ?async=true stores the payload and returns 202 with a job id straight
+    away; the ingestion worker processes it and its progress can be polled
+    at /api/exams/ingest/<job_id>/.
     """
 
     authentication_classes = []
     permission_classes = [IngestAPIKeyPermission]
 
     def post(self, request):
-        if isinstance(request.data, list):
-            items_data = request.data
+        try:
+            loader, chunk_size = self.loader_options(request)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        streaming = self.is_streaming(request)
+        if streaming:
+            # Read from the underlying Django request so the body is never
+            # buffered whole by DRF's parsers.
+            stream = request._request
+            if request.content_type.startswith(NDJSON_MEDIA_TYPE):
+                items = iter_ndjson(stream)
+            else:
+                items = iter_json_array(stream)
         else:
-            items_data = request.data.get("items", request.data)
+            if isinstance(request.data, list):
+                items = request.data
+            else:
+                items = request.data.get("items", request.data)
 
-        if items_data is None or not isinstance(items_data, list):
-            return Response(
-                {"error": "items must be a list"},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
+            if items is None or not isinstance(items, list):
+                return Response(
+                    {"error": "items must be a list"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+        if self.is_enabled(request, "async"):
+            return self.post_async(items, loader, chunk_size)
+        if streaming:
+            return self.post_stream(items, loader, chunk_size)
+
+        try:
+            if loader == "copy":
+                result = copy_load(items)
+            else:
+                result = ingest_items(items)
+                publish_ingestion(result.pairs)
+        except IngestValidationError as e:
+            return self.validation_failed(e)
+        except Exception as e:
+            return self.ingestion_failed(e)
+
+        return self.ingestion_completed(result)
 
-        semester_cache = {}
-        for item in items_data:
-            if isinstance(item, dict) and "semester" in item:
-                sem_code = item["semester"]
-                if isinstance(sem_code, str):
-                    if sem_code not in semester_cache:
-                        sem_obj, _ = SemesterInfo.objects.get_or_create(
-                            code=sem_code,
-                            defaults={
-                                "name": sem_code,
-                                "start_date": timezone.now().date(),
-                                "end_date": timezone.now().date() + timedelta(weeks=13),
-                            },
-                        )
-                        semester_cache[sem_code] = sem_obj.id
-                    item["semester"] = semester_cache[sem_code]
-
-        serializer = ExamScheduleSerializer(data=items_data, many=True)
-        if not serializer.is_valid():
+    def post_stream(self, items, loader, chunk_size):
+        ingest = copy_load if loader == "copy" else ingest_stream
+        try:
+            result = ingest(items, chunk_size=chunk_size)
+        except IngestValidationError as e:
+            return self.validation_failed(e)
+        except InvalidPayloadError as e:
             return Response(
                 {
                     "error": "validation_failed",
-                    "errors": [
-                        {
-                            "code": "invalid_request",
-                            "message": "The request payload is invalid.",
-                            "field_errors": serializer.errors,
-                        }
-                    ],
+                    "errors": error_details(e),
+                    **e.result.counts(),
+                    "chunks": e.result.chunks,
                 },
                 status=status.HTTP_400_BAD_REQUEST,
             )
+        except Exception as e:
+            return self.ingestion_failed(e)
+
+        return self.ingestion_completed(result, chunks=result.chunks)
+
+    def post_async(self, items, loader, chunk_size):
+        return self.enqueue(lambda: enqueue_ingestion(items, loader, chunk_size))
+
+    def enqueue(self, create_job):
+        """
+        Queue a job with ``create_job`` and answer 202 with where to poll it.
+        """
+        try:
+            job = create_job()
+        except InvalidPayloadError as e:
+            return Response(
+                {"error": "validation_failed", "errors": error_details(e)},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        except Exception as e:
+            return self.ingestion_failed(e)
+
+        return Response(
+            {
+                "message": "Ingestion queued",
+                "job_id": str(job.id),
+                "status": job.status,
+                "status_url": reverse(
+                    "ingest-exam-schedule-job", kwargs={"job_id": job.id}
+                ),
+            },
+            status=status.HTTP_202_ACCEPTED,
+        )
 
-        items_data = serializer.validated_data
+    @staticmethod
+    def loader_options(request) -> tuple[str, int]:
+        loader = request.query_params.get("loader", "upsert")
+        if loader not in ("upsert", "copy"):
+            raise ValueError("loader must be either 'upsert' or 'copy'")
 
-        # 1. Deduplicate
-        deduplicated_items = {}
-        skipped_count = 0
-        for i, item_data in enumerate(items_data):
-            course_code = item_data["course_code"]
-            inst = item_data["institution"]
-            sem = item_data.get("semester")
+        try:
+            chunk_size = int(request.query_params.get("chunk_size", CHUNK_SIZE))
+        except ValueError:
+            chunk_size = 0
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be a positive integer")
+        return loader, chunk_size
+
+    @staticmethod
+    def is_enabled(request, param) -> bool:
+        return request.query_params.get(param, "").lower() in ("1", "true")
+
+    @classmethod
+    def is_streaming(cls, request) -> bool:
+        return request.content_type.startswith(NDJSON_MEDIA_TYPE) or cls.is_enabled(
+            request, "stream"
+        )
+
+    @staticmethod
+    def ingestion_completed(result, **extra):
+        return Response(
+            {
+                "message": "Ingestion completed successfully",
+                **result.counts(),
+                **extra,
+            },
+            status=(
+                status.HTTP_201_CREATED
+                if result.created_count > 0
+                else status.HTTP_200_OK
+            ),
+        )
+
+    @staticmethod
+    def validation_failed(error):
+        body = {"error": "validation_failed", "errors": error_details(error)}
+        if error.chunk_index is not None:
+            # Earlier chunks were committed; tell the client where to resume.
+            body.update(error.result.counts())
+            body["chunks"] = error.result.chunks
+        return Response(body, status=status.HTTP_400_BAD_REQUEST)
+
+    @staticmethod
+    def ingestion_failed(error):
+        logger.exception(f"Failed to ingest exam schedule: {error}")
+        return Response(
+            {
+                "error": "ingestion_failed",
+                "errors": [
+                    {
+                        "code": "server_error",
+                        "message": str(error),
+                    }
+                ],
+            },
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+
+
+class IngestSpreadsheetView(IngestExamScheduleView):
+    """
+    POST /api/exams/ingest/spreadsheet/
+    Ingest an .xlsx/.xls exam timetable as published by the institution.
 
-            inst_id = inst.pk if inst else None
-            sem_id = sem.id if sem else None
+    multipart/form-data: file (required), institution (required),
+    semester (optional), parser (optional; picked from the institution's
+    domains when left out). Accepts the same ?loader=, ?chunk_size= and
+    ?async= options as /api/exams/ingest/.
 
-            key = (inst_id, sem_id, course_code)
-            if key in deduplicated_items:
-                skipped_count += 1
-            deduplicated_items[key] = (i, item_data)
+    The upload is always written to a temporary file and read one row at a
+    time, so even the largest timetables are never held in memory. With
+    ?async=true the file is stored as it is and parsed by the worker.
+    """
+
+    parser_classes = [MultiPartParser]
 
-        created_count = 0
-        updated_count = 0
-        errors = []
+    def post(self, request):
+        request.upload_handlers = [TemporaryFileUploadHandler(request._request)]
 
-        # 2. Process items in bulk
         try:
-            course_codes = [
-                item_data["course_code"] for _, item_data in deduplicated_items.values()
-            ]
-            institution_ids = list(
-                set(
-                    [
-                        item_data["institution"].pk
-                        for _, item_data in deduplicated_items.values()
-                    ]
-                )
+            loader, chunk_size = self.loader_options(request)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        upload = request.FILES.get("file")
+        if upload is None or not is_spreadsheet(upload.name):
+            return Response(
+                {"error": "file must be an .xlsx or .xls spreadsheet"},
+                status=status.HTTP_400_BAD_REQUEST,
             )
 
-            # Fetch existing records to separate create vs update
-            existing_exams = ExamSchedule.objects.filter(
-                institution_id__in=institution_ids,
-                course_code__in=course_codes,
+        institution_id = request.data.get("institution")
+        institution = (
+            Institution.objects.filter(pk=institution_id).first()
+            if str(institution_id or "").isdigit()
+            else None
+        )
+        if institution is None:
+            return Response(
+                {"error": "institution must be the id of an existing institution"},
+                status=status.HTTP_400_BAD_REQUEST,
             )
-            existing_map = {
-                (exam.institution_id, exam.semester_id, exam.course_code): exam
-                for exam in existing_exams
-            }
-
-            items_to_create = []
-            items_to_update = []
-            now = timezone.now()
-
-            for key, (original_index, item_data) in deduplicated_items.items():
-                inst_id = key[0]
-                sem_id = key[1]
-                course_code = key[2]
-
-                map_key = (inst_id, sem_id, course_code)
-                if map_key in existing_map:
-                    obj = existing_map[map_key]
-                    for field, value in item_data.items():
-                        setattr(obj, field, value)
-                    obj.updated_at = now
-                    items_to_update.append(obj)
-                else:
-                    items_to_create.append(
-                        ExamSchedule(
-                            **item_data,
-                        )
-                    )
-
-            with transaction.atomic():
-                if items_to_create:
-                    ExamSchedule.objects.bulk_create(items_to_create, batch_size=100)
-                    created_count = len(items_to_create)
-
-                if items_to_update:
-                    fields_to_update = [
-                        "start_time",
-                        "end_time",
-                        "venue",
-                        "coordinator",
-                        "hrs",
-                        "raw_data",
-                        "updated_at",
-                    ]
-                    ExamSchedule.objects.bulk_update(
-                        items_to_update, fields_to_update, batch_size=100
-                    )
-                    updated_count = len(items_to_update)
 
+        parser_name = request.data.get("parser") or parser_for_domains(
+            institution.domains
+        )
+        if parser_name not in PARSERS:
             return Response(
-                {
-                    "message": "Ingestion completed successfully",
-                    "created_count": created_count,
-                    "updated_count": updated_count,
-                    "skipped_count": skipped_count,
-                },
-                status=(
-                    status.HTTP_201_CREATED if created_count > 0 else status.HTTP_200_OK
-                ),
+                {"error": "parser must be one of: " f"{', '.join(sorted(PARSERS))}"},
+                status=status.HTTP_400_BAD_REQUEST,
             )
 
-        except Exception as e:
-            logger.exception(f"Failed to ingest exam schedule: {e}")
+        path = upload.temporary_file_path()
+        try:
+            with Workbook(path):
+                pass
+        except (InvalidFileException, xlrd.XLRDError, zipfile.BadZipFile) as e:
             return Response(
-                {
-                    "error": "ingestion_failed",
-                    "errors": [
-                        {
-                            "code": "server_error",
-                            "message": str(e),
-                        }
-                    ],
-                },
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                {"error": f"The spreadsheet could not be read: {e}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        semester = request.data.get("semester") or None
+        if self.is_enabled(request, "async"):
+            # The worker parses the stored file, so large workbooks never
+            # hold up the request.
+            return self.enqueue(
+                lambda: enqueue_spreadsheet(
+                    upload, parser_name, institution.pk, semester, loader, chunk_size
+                )
+            )
+        items = iter_exam_items(path, parser_name, institution.pk, semester)
+        return self.post_stream(items, loader, chunk_size)
+
+
+class IngestionJobView(APIView):
+    """
+    GET /api/exams/ingest/<job_id>/
+    Report the status and counts of an asynchronous ingestion job.
+    """
+
+    authentication_classes = []
+    permission_classes = [IngestAPIKeyPermission]
+
+    def get(self, request, job_id):
+        job = IngestionJob.objects.filter(pk=job_id).first()
+        if job is None:
+            return Response(
+                {"error": "Ingestion job not found"},
+                status=status.HTTP_404_NOT_FOUND,
             )
+        return Response(IngestionJobSerializer(job).data, status=status.HTTP_200_OK)
@@ -2,6 +2,7 @@ from django.shortcuts import render
 from rest_framework.generics import CreateAPIView, RetrieveAPIView
 
 from magnet.models import MagnetScrappingCommand
+from professor.verisafe_jwt_authentication import LazyVerisafeJWTAuthentication
 from .serializers import MagnetScrappingCommandSerializer
 
 
@@ -15,6 +16,7 @@ class CreateMagnetCommandApiView(CreateAPIView):
 
 
 class RetrieveMagnetCommandApiView(RetrieveAPIView):
+    authentication_classes = [LazyVerisafeJWTAuthentication]
     lookup_field = "institution_id"
     lookup_url_kwarg = "institution_id"
     serializer_class = MagnetScrappingCommandSerializer
@@ -0,0 +1,138 @@
+from contextlib import contextmanager
+from functools import cache
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from django.db import connection
+from django.db.models import Manager, QuerySet
+from rest_framework import serializers
+
+
+class LazyLoadError(RuntimeError):
+    """
+    Raised in DEBUG when serializing a list runs a query, which means a
+    related object was not loaded up front.
+    """
+
+
+@contextmanager
+def forbid_queries(label: str):
+    """
+    In DEBUG, fail any query run inside the block. Does nothing otherwise.
+    """
+    if not settings.DEBUG:
+        yield
+        return
+
+    def blocker(execute, sql, params, many, context):
+        raise LazyLoadError(
+            f"{label} ran a query while serializing, so a relation it reads "
+            f"was not loaded up front. Add it to select_related: {sql}"
+        )
+
+    with connection.execute_wrapper(blocker):
+        yield
+
+
+@cache
+def select_related_paths(serializer_class) -> tuple[str, ...]:
+    """
+    Work out the select_related() paths a model serializer needs, from the
+    dotted sources of its fields (``source="student.user.username"`` needs
+    ``student__user``), its nested serializers and related fields that render
+    more than a primary key. Paths listed in ``Meta.select_related`` are
+    added as they are.
+    """
+    serializer = serializer_class()
+    model = serializer.Meta.model
+    paths = set(getattr(serializer.Meta, "select_related", ()))
+    _collect_paths(serializer, model, "", paths)
+    # Drop paths that a longer path already covers.
+    return tuple(
+        sorted(
+            path for path in paths if not any(p.startswith(f"{path}__") for p in paths)
+        )
+    )
+
+
+def _collect_paths(serializer, model, prefix: str, paths: set) -> None:
+    for field in serializer.fields.values():
+        if field.write_only or field.source == "*":
+            continue
+        parts = field.source.split(".")
+        loads_target = isinstance(field, serializers.BaseSerializer) or (
+            isinstance(field, serializers.RelatedField)
+            and not field.use_pk_only_optimization()
+        )
+        # The last part is an attribute, unless the field renders the
+        # related object itself.
+        relations = parts if loads_target else parts[:-1]
+
+        current, path = model, prefix
+        for part in relations:
+            relation = _forward_relation(current, part)
+            if relation is None:
+                break
+            path = f"{path}__{part}" if path else part
+            paths.add(path)
+            current = relation.related_model
+        else:
+            if isinstance(field, serializers.Serializer) and relations:
+                _collect_paths(field, current, path, paths)
+
+
+def _forward_relation(model, name: str):
+    try:
+        field = model._meta.get_field(name)
+    except FieldDoesNotExist:
+        return None
+    if field.is_relation and (field.many_to_one or field.one_to_one):
+        return field
+    return None
+
+
+class EagerListSerializer(serializers.ListSerializer):
+    """
+    Evaluates the queryset once, then serializes every item under
+    forbid_queries, so a lazy load per item fails loudly in DEBUG.
+    """
+
+    def to_representation(self, data):
+        items = data.all() if isinstance(data, Manager) else data
+        if isinstance(items, QuerySet):
+            items = list(items)
+        with forbid_queries(type(self.child).__name__):
+            return [self.child.to_representation(item) for item in items]
+
+
+class EagerLoadingMixin:
+    """
+    For model serializers that read related objects. ``eager_load()`` adds
+    the select_related() paths the serializer needs to a queryset, and lists
+    are serialized with EagerListSerializer.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        meta = getattr(cls, "Meta", None)
+        if meta is not None and not hasattr(meta, "list_serializer_class"):
+            meta.list_serializer_class = EagerListSerializer
+
+    @classmethod
+    def eager_load(cls, queryset: QuerySet) -> QuerySet:
+        paths = select_related_paths(cls)
+        return queryset.select_related(*paths) if paths else queryset
+
+
+class EagerQuerysetMixin:
+    """
+    For generic views: applies the serializer's eager_load() to the view's
+    queryset.
+    """
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        serializer_class = self.get_serializer_class()
+        if hasattr(serializer_class, "eager_load"):
+            queryset = serializer_class.eager_load(queryset)
+        return queryset
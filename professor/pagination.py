@@ -1,7 +1,177 @@
-from rest_framework.pagination import PageNumberPagination
+import base64
+import binascii
+import json
+from collections import OrderedDict
+
+from django.core.exceptions import ValidationError
+from django.db import connections
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+def estimate_count(queryset) -> int | None:
+    """
+    Estimate how many rows a queryset matches without running COUNT(*).
+    Unfiltered querysets read the table's row estimate from pg_class, and
+    filtered ones use the planner's estimate. Returns None when no estimate
+    is available, e.g. before the table was first analyzed or off PostgreSQL.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+
+    if not queryset.query.where:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                [connection.ops.quote_name(queryset.model._meta.db_table)],
+            )
+            row = cursor.fetchone()
+        return row[0] if row and row[0] >= 0 else None
+
+    plan = json.loads(queryset.order_by().explain(format="json"))
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+class KeysetPagination(BasePagination):
+    """
+    Forward-only cursor pagination on indexed columns. Each page is fetched
+    with a range condition on ``ordering`` instead of an OFFSET, so walking a
+    whole table costs the same for every page. ``count`` is an estimate.
+    """
+
+    cursor_query_param = "cursor"
+    page_size = 30
+    page_size_query_param = "page_size"
+    max_page_size = 1000
+
+    def __init__(self, ordering=("pk",)):
+        self.ordering = tuple(ordering)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.count = estimate_count(queryset)
+
+        queryset = queryset.order_by(*self.ordering)
+        position = self.decode_cursor(request, queryset.model)
+        if position is not None:
+            queryset = queryset.filter(self.after(position))
+
+        results = list(queryset[: self.page_size + 1])
+        self.has_next = len(results) > self.page_size
+        self.page = results[: self.page_size]
+        return self.page
+
+    def after(self, position) -> Q:
+        """
+        Rows that sort after ``position``: (a, b) > (x, y) is expanded to
+        a >= x AND (a > x OR (a = x AND b > y)), whose leading condition lets
+        the index range scan start at the cursor.
+        """
+        fields = [field.lstrip("-") for field in self.ordering]
+        lookups = ["lt" if field.startswith("-") else "gt" for field in self.ordering]
+
+        condition = Q()
+        for index in reversed(range(len(fields))):
+            strict = Q(**{f"{fields[index]}__{lookups[index]}": position[index]})
+            equal = Q(**{fields[index]: position[index]})
+            condition = (
+                strict if index == len(fields) - 1 else strict | (equal & condition)
+            )
+        leading = Q(**{f"{fields[0]}__{lookups[0]}e": position[0]})
+        return leading & condition
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(page_size, self.max_page_size) if page_size > 0 else self.page_size
+
+    def decode_cursor(self, request, model):
+        """
+        The position a cursor points at, with each value converted by its
+        model field, so a cursor holding values of the wrong type is a 404
+        rather than a database error.
+        """
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            position = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+        except (binascii.Error, ValueError):
+            raise NotFound("Invalid cursor")
+        if not isinstance(position, list) or len(position) != len(self.ordering):
+            raise NotFound("Invalid cursor")
+
+        values = []
+        for field, value in zip(self.ordering, position):
+            name = field.lstrip("-")
+            model_field = (
+                model._meta.pk if name == "pk" else model._meta.get_field(name)
+            )
+            if value is None or isinstance(value, (bool, list, dict)):
+                raise NotFound("Invalid cursor")
+            try:
+                values.append(model_field.to_python(value))
+            except (ValidationError, TypeError, ValueError):
+                raise NotFound("Invalid cursor")
+        return values
+
+    def encode_cursor(self, instance) -> str:
+        position = []
+        for field in self.ordering:
+            value = getattr(instance, field.lstrip("-"))
+            position.append(value.isoformat() if hasattr(value, "isoformat") else value)
+        return base64.urlsafe_b64encode(
+            json.dumps(position, default=str).encode()
+        ).decode()
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(self.page[-1])
+        )
+
+    def get_paginated_response(self, data):
+        return Response(
+            OrderedDict(
+                [
+                    ("count", self.count),
+                    ("next", self.get_next_link()),
+                    ("results", data),
+                ]
+            )
+        )
 
 
 class ResultsSetPagination(PageNumberPagination):
+    """
+    Page-number pagination by default. Passing ``?cursor=`` (empty for the
+    first page) switches to KeysetPagination, ordered by the view's
+    ``cursor_ordering`` (``("pk",)`` unless set), for clients that walk whole
+    tables.
+    """
+
     page_size = 30
     page_size_query_param = "page_size"
-    max_page_size = 1000
\ No newline at end of file
+    max_page_size = 1000
+
+    keyset = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if KeysetPagination.cursor_query_param in request.query_params:
+            self.keyset = KeysetPagination(getattr(view, "cursor_ordering", ("pk",)))
+            return self.keyset.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+        return super().get_paginated_response(data)
@@ -160,6 +160,39 @@ DATABASES = {
 }
 
 
+# Caches
+# Set REDIS_URL to share cached values across the web, consumer and worker
+# processes; without it every process keeps its own local-memory cache.
+# The ingestion worker and the event consumers run as separate processes and
+# invalidate cached data for the web process, so production needs a shared
+# cache. The local-memory fallback is only fit for development and tests; the
+# examtimetable.W001 system check warns about it.
+REDIS_URL = os.getenv("REDIS_URL", None)
+
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+            "KEY_PREFIX": "professor",
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "professor",
+        }
+    }
+
+# Pre-serialized, pre-compressed exam timetables served by
+# /api/exams/by-institution/. Rebuilt on ingest and lazily on a miss.
+EXAM_SNAPSHOT_DIR = os.getenv("EXAM_SNAPSHOT_DIR", BASE_DIR / "var" / "exam-snapshots")
+
+# Processes used to parse timetable spreadsheets; unset means one per CPU.
+TIMETABLE_PARSE_WORKERS = int(os.getenv("TIMETABLE_PARSE_WORKERS", 0)) or None
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -1,15 +1,42 @@
+import hashlib
 import logging
+import time
 
+from django.utils.functional import SimpleLazyObject
 from rest_framework import status
 from rest_framework.authentication import BaseAuthentication
 from rest_framework.exceptions import AuthenticationFailed
 
-from users.models import User
+from users.cache import get_cached_user, invalidate_user, is_provisioned
 
+from .cache import MISSING, TTLCache
 from .verisafe_jwt import verify_verisafe_jwt  # from earlier
 
 logger = logging.getLogger("django")
 
+# Verified claims are reused for this long, and never past the token's exp.
+CLAIMS_TTL = 5 * 60
+
+_claims = TTLCache(maxsize=4096, ttl=CLAIMS_TTL)
+
+
+def verify_cached(token: str) -> dict:
+    """
+    verify_verisafe_jwt, remembering the claims of tokens that passed so a
+    token is only verified once while it stays in the cache. Entries are
+    keyed by a digest of the token rather than the token itself.
+    """
+    digest = hashlib.sha256(token.encode()).hexdigest()
+    payload = _claims.get(digest)
+    if payload is MISSING:
+        payload = verify_verisafe_jwt(token)
+        ttl = CLAIMS_TTL
+        if isinstance(payload.get("exp"), (int, float)):
+            ttl = min(ttl, payload["exp"] - time.time())
+        if ttl > 0:
+            _claims.set(digest, payload, ttl)
+    return payload
+
 
 class VerisafeJWTAuthentication(BaseAuthentication):
     def authenticate(self, request):
@@ -25,7 +52,7 @@ class VerisafeJWTAuthentication(BaseAuthentication):
         token = auth_header.split(" ")[1]
 
         try:
-            payload = verify_verisafe_jwt(token)
+            payload = verify_cached(token)
             request.verisafe_claims = payload
             user_id = payload.get("sub")
             if not user_id:
@@ -33,9 +60,9 @@ class VerisafeJWTAuthentication(BaseAuthentication):
                     "Token missing required 'sub' claim", code="invalid_token"
                 )
             request.user_id = user_id
-            user = User.objects.filter(user_id=request.user_id).first()
+            user = self.get_user(request.user_id)
 
-            if not user:
+            if user is None:
                 logger.warning(
                     f"User {request.user_id} authenticated via JWT but not found in DB."
                 )
@@ -49,3 +76,32 @@ class VerisafeJWTAuthentication(BaseAuthentication):
             return (user, token)
         except Exception as e:
             raise AuthenticationFailed(str(e))
+
+    def get_user(self, user_id):
+        return get_cached_user(user_id)
+
+
+class LazyVerisafeJWTAuthentication(VerisafeJWTAuthentication):
+    """
+    For views that only need the token's subject (``request.user_id``).
+    Unprovisioned users are still rejected, but request.user is a lazy
+    proxy that loads the User row only when one of its attributes is read.
+    """
+
+    def get_user(self, user_id):
+        if not is_provisioned(user_id):
+            return None
+        return SimpleLazyObject(lambda: self.load_user(user_id))
+
+    @staticmethod
+    def load_user(user_id):
+        # The user may have been deleted since is_provisioned answered, or
+        # that answer came from a stale cache entry.
+        user = get_cached_user(user_id)
+        if user is None:
+            invalidate_user(user_id)
+            raise AuthenticationFailed(
+                "User account not provisioned. Please contact support.",
+                code="user_not_found",
+            )
+        return user
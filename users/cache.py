@@ -0,0 +1,103 @@
+import hashlib
+import logging
+import uuid
+
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+
+from professor.cache import MISSING, TTLCache, is_process_local
+
+from .models import User
+
+logger = logging.getLogger(__name__)
+
+# The consumer invalidates users in its own process, so other processes only
+# see a change once their in-process copy expires.
+LOCAL_TTL = 10
+SHARED_TIMEOUT = 60 * 60
+
+SNAPSHOT_FIELDS = [field.attname for field in User._meta.concrete_fields]
+# Snapshots are positional, so the key records the columns they were taken
+# with. After a migration changes them, older snapshots are simply misses.
+SNAPSHOT_VERSION = hashlib.sha256(",".join(SNAPSHOT_FIELDS).encode()).hexdigest()[:8]
+
+USER_KEY = f"users:snapshot:{SNAPSHOT_VERSION}:{{user_id}}"
+PROVISIONED_KEY = "users:provisioned:{user_id}"
+
+_users = TTLCache(maxsize=4096, ttl=LOCAL_TTL)
+
+
+def _user_key(user_id, template: str = USER_KEY) -> str | None:
+    try:
+        return template.format(user_id=uuid.UUID(str(user_id)))
+    except ValueError:
+        return None
+
+
+def _load_snapshot(user_id) -> tuple | None:
+    return User.objects.filter(user_id=user_id).values_list(*SNAPSHOT_FIELDS).first()
+
+
+def get_cached_user(user_id) -> User | None:
+    """
+    Load a User from a snapshot of its row, held briefly in-process in front
+    of the shared cache, so authenticating a request rarely needs a query.
+    The returned instance behaves like one fetched from the database.
+
+    A process-local default cache is skipped: the consumer's invalidations
+    would never reach it, so only the short in-process copy is kept.
+    """
+    key = _user_key(user_id)
+    if key is None:
+        return None
+
+    shared = not is_process_local()
+    values = _users.get(key)
+    if values is MISSING:
+        values = cache.get(key) if shared else None
+        if values is None:
+            values = _load_snapshot(user_id)
+            if values is None:
+                return None
+            if shared:
+                cache.set(key, values, SHARED_TIMEOUT)
+        _users.set(key, values)
+    return User.from_db(DEFAULT_DB_ALIAS, SNAPSHOT_FIELDS, values)
+
+
+def is_provisioned(user_id) -> bool:
+    """
+    Whether a User row exists, without loading it. A cached snapshot counts
+    as proof; otherwise the answer is cached like a snapshot. Unknown users
+    are not cached, so a user provisioned moments later is let in.
+    """
+    key = _user_key(user_id, PROVISIONED_KEY)
+    if key is None:
+        return False
+    snapshot_key = _user_key(user_id)
+    if _users.get(key) is not MISSING or _users.get(snapshot_key) is not MISSING:
+        return True
+
+    shared = not is_process_local()
+    if not (shared and cache.get(key)):
+        if not User.objects.filter(user_id=user_id).exists():
+            return False
+        if shared:
+            cache.set(key, True, SHARED_TIMEOUT)
+    _users.set(key, True)
+    return True
+
+
+def invalidate_user(user_id) -> None:
+    """
+    Drop a user's cached snapshot after it changed or was deleted. Other
+    processes see this through the shared cache once their in-process copy
+    expires, within LOCAL_TTL seconds.
+    """
+    keys = [_user_key(user_id), _user_key(user_id, PROVISIONED_KEY)]
+    if keys[0] is None:
+        return
+    for key in keys:
+        _users.delete(key)
+    cache.delete_many(keys)
+    logger.info("Invalidated cached user", extra={"user_id": str(user_id)})
@@ -6,6 +6,7 @@ from event_bus.consumer import BaseConsumer
 from event_bus.registry import register
 from institutions.models import Institution
 
+from .cache import invalidate_user
 from .models import StudentProfile, User
 
 
@@ -48,6 +49,7 @@ class VerisafeUserEventConsumer(BaseConsumer):
                             "vibe_points": payload.get("vibe_points", 0),
                         },
                     )
+                    invalidate_user(user.user_id)
                     action = "created" if created else "updated"
                     self.logger.info(
                         f"User @{user.username} {action} successfully",
@@ -59,6 +61,7 @@ class VerisafeUserEventConsumer(BaseConsumer):
                     deleted_count, _ = User.objects.filter(
                         user_id=uuid.UUID(user_id)
                     ).delete()
+                    invalidate_user(user_id)
                     if deleted_count:
                         self.logger.info(
                             f"User {user_id} deleted successfully",
@@ -7,6 +7,9 @@ from utils.base_64_helper import (
 )
 from .models import User, StudentProfile, Administrator
 
+# Most users a single lookup request may ask for, across all identifiers.
+MAX_USER_LOOKUP = 100
+
 
 class UserSerializer(serializers.ModelSerializer):
     class Meta:
@@ -24,6 +27,38 @@ class UserSerializer(serializers.ModelSerializer):
         ]
 
 
+class UserSummarySerializer(serializers.ModelSerializer):
+    """
+    The fields other services need to display a user.
+    """
+
+    class Meta:
+        model = User
+        fields = ["user_id", "name", "username", "email", "avatar_url"]
+
+
+class UserLookupSerializer(serializers.Serializer):
+    user_ids = serializers.ListField(child=serializers.UUIDField(), default=list)
+    usernames = serializers.ListField(
+        child=serializers.CharField(max_length=100), default=list
+    )
+    emails = serializers.ListField(
+        child=serializers.EmailField(max_length=255), default=list
+    )
+
+    def validate(self, attrs):
+        total = sum(len(set(values)) for values in attrs.values())
+        if not total:
+            raise serializers.ValidationError(
+                "Provide at least one of user_ids, usernames or emails"
+            )
+        if total > MAX_USER_LOOKUP:
+            raise serializers.ValidationError(
+                f"At most {MAX_USER_LOOKUP} users can be looked up at once"
+            )
+        return attrs
+
+
 class StudentProfileSerializer(serializers.ModelSerializer):
     profile_picture = serializers.CharField(
         required=False,
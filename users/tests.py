@@ -1,3 +1,161 @@
-from django.test import TestCase
+import multiprocessing
+import shutil
+import tempfile
+import time
+import uuid
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+from rest_framework.views import APIView
+
+from professor.verisafe_jwt_authentication import LazyVerisafeJWTAuthentication
+
+from users import cache as user_cache
+from users.models import User
+
+
+def invalidate_in_child_process(user_id):
+    process = multiprocessing.get_context("fork").Process(
+        target=user_cache.invalidate_user, args=(user_id,)
+    )
+    process.start()
+    process.join(timeout=30)
+    return process.exitcode
+
+
+def after_local_ttl(periods=1):
+    now = time.monotonic() + periods * (user_cache.LOCAL_TTL + 1)
+    return mock.patch("professor.cache.time.monotonic", return_value=now)
+
+
+class SharedCacheInvalidationTests(TestCase):
+    def setUp(self):
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir, ignore_errors=True)
+        settings = override_settings(
+            CACHES={
+                "default": {
+                    "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                    "LOCATION": cache_dir,
+                }
+            }
+        )
+        settings.enable()
+        self.addCleanup(settings.disable)
+        user_cache._users.clear()
+        self.addCleanup(user_cache._users.clear)
+        self.user = User.objects.create(name="Before", username="student")
+
+    def test_update_invalidated_by_another_process_is_seen(self):
+        self.assertEqual(user_cache.get_cached_user(self.user.user_id).name, "Before")
+        User.objects.filter(pk=self.user.pk).update(name="After")
+
+        self.assertEqual(invalidate_in_child_process(self.user.user_id), 0)
+
+        with after_local_ttl():
+            user = user_cache.get_cached_user(self.user.user_id)
+        self.assertEqual(user.name, "After")
+
+    def test_snapshots_of_other_columns_are_ignored(self):
+        # A snapshot cached before a migration changed the User columns.
+        cache.set(f"users:snapshot:{self.user.user_id}", ("stale",))
+        cache.set(f"users:snapshot:0badc0de:{self.user.user_id}", ("stale",) * 3)
+
+        user = user_cache.get_cached_user(self.user.user_id)
+        self.assertEqual((user.pk, user.name), (self.user.pk, "Before"))
+
+    def test_delete_invalidated_by_another_process_is_seen(self):
+        self.assertTrue(user_cache.is_provisioned(self.user.user_id))
+        self.assertIsNotNone(user_cache.get_cached_user(self.user.user_id))
+        User.objects.filter(pk=self.user.pk).delete()
+
+        self.assertEqual(invalidate_in_child_process(self.user.user_id), 0)
+
+        with after_local_ttl():
+            self.assertIsNone(user_cache.get_cached_user(self.user.user_id))
+            self.assertFalse(user_cache.is_provisioned(self.user.user_id))
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class ProcessLocalCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        user_cache._users.clear()
+        self.user = User.objects.create(name="Before", username="student")
+
+    def test_users_are_cached_in_process_only(self):
+        self.assertEqual(user_cache.get_cached_user(self.user.user_id).name, "Before")
+        self.assertTrue(user_cache.is_provisioned(self.user.user_id))
+        self.assertIsNone(cache.get(user_cache._user_key(self.user.user_id)))
+
+        User.objects.filter(pk=self.user.pk).update(name="After")
+        with self.assertNumQueries(0):
+            user = user_cache.get_cached_user(self.user.user_id)
+        self.assertEqual(user.name, "Before")
+        with after_local_ttl():
+            user = user_cache.get_cached_user(self.user.user_id)
+        self.assertEqual(user.name, "After")
+
+        User.objects.filter(pk=self.user.pk).delete()
+        with after_local_ttl(periods=2):
+            self.assertIsNone(user_cache.get_cached_user(self.user.user_id))
+            self.assertFalse(user_cache.is_provisioned(self.user.user_id))
+
+    def test_unknown_user_id(self):
+        self.assertIsNone(user_cache.get_cached_user(uuid.uuid4()))
+        self.assertIsNone(user_cache.get_cached_user("not-a-uuid"))
+
+
+class UserNameView(APIView):
+    authentication_classes = [LazyVerisafeJWTAuthentication]
+    permission_classes = []
+
+    def get(self, request):
+        return Response({"name": request.user.name})
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class LazyAuthenticationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        user_cache._users.clear()
+        self.user = User.objects.create(name="Student", username="student")
+        claims = mock.patch(
+            "professor.verisafe_jwt_authentication.verify_cached",
+            return_value={"sub": str(self.user.user_id)},
+        )
+        claims.start()
+        self.addCleanup(claims.stop)
+
+    def get(self):
+        request = APIRequestFactory().get("/", HTTP_AUTHORIZATION="Bearer token")
+        return UserNameView.as_view()(request)
+
+    def test_user_is_loaded_on_access(self):
+        response = self.get()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, {"name": "Student"})
+
+    def test_user_deleted_after_the_provisioned_check_is_rejected(self):
+        user_id = self.user.user_id
+
+        def provisioned_then_deleted(user_id):
+            User.objects.filter(user_id=user_id).delete()
+            return True
+
+        with mock.patch(
+            "professor.verisafe_jwt_authentication.is_provisioned",
+            side_effect=provisioned_then_deleted,
+        ):
+            response = self.get()
+
+        self.assertIn(response.status_code, (401, 403))
+        self.assertEqual(response.data["detail"].code, "user_not_found")
+        self.assertFalse(user_cache.is_provisioned(user_id))
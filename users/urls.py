@@ -6,12 +6,14 @@ from .views import (
     StudentProfileListView,
     StudentProfileRetrieveView,
     StudentProfileUpdateView,
+    UserLookupView,
     UserManagementView,
     AdministratorManagementView,
 )
 
 urlpatterns = [
     path("", UserManagementView.as_view(), name="verisafe-user-management"),
+    path("lookup/", UserLookupView.as_view(), name="user-lookup"),
     path(
         "administrators/", AdministratorManagementView.as_view(), name="administrators"
     ),
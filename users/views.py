@@ -1,3 +1,4 @@
+from django.db.models import Q
 from rest_framework import status
 from rest_framework.generics import (
     DestroyAPIView,
@@ -10,10 +11,14 @@ from rest_framework.generics import (
 from rest_framework.permissions import AllowAny
 from rest_framework.exceptions import NotFound
 from rest_framework.views import APIView, PermissionDenied, Response
+from professor.pagination import ResultsSetPagination
+from professor.verisafe_jwt_authentication import LazyVerisafeJWTAuthentication
 from users.models import StudentProfile, User, Administrator
 from users.serializers import (
     StudentProfileSerializer,
+    UserLookupSerializer,
     UserSerializer,
+    UserSummarySerializer,
     AdministratorSerializer,
 )
 
@@ -25,6 +30,56 @@ class UserManagementView(ListCreateAPIView):
     queryset = User.objects.all()
 
 
+class UserLookupView(APIView):
+    """
+    Look up many users in one query.
+    Body: any of user_ids, usernames and emails (lists, at most
+    MAX_USER_LOOKUP identifiers in total). Identifiers that matched no user
+    are returned under not_found.
+    """
+
+    authentication_classes = [LazyVerisafeJWTAuthentication]
+
+    def post(self, request):
+        serializer = UserLookupSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        data = serializer.validated_data
+        user_ids = set(data["user_ids"])
+        usernames = set(data["usernames"])
+        emails = set(data["emails"])
+
+        query = Q()
+        if user_ids:
+            query |= Q(user_id__in=user_ids)
+        if usernames:
+            query |= Q(username__in=usernames)
+        if emails:
+            query |= Q(email__in=emails)
+
+        users = list(
+            User.objects.filter(query)
+            .only(*UserSummarySerializer.Meta.fields)
+            .order_by("username", "user_id")
+        )
+
+        return Response(
+            {
+                "count": len(users),
+                "results": UserSummarySerializer(users, many=True).data,
+                "not_found": {
+                    "user_ids": sorted(
+                        str(user_id)
+                        for user_id in user_ids - {user.user_id for user in users}
+                    ),
+                    "usernames": sorted(usernames - {user.username for user in users}),
+                    "emails": sorted(emails - {user.email for user in users}),
+                },
+            }
+        )
+
+
 class AdministratorManagementView(ListCreateAPIView):
     """
     Allows creating and listing administrators.
@@ -72,6 +127,7 @@ class StudentProfileListView(ListAPIView):
 
     serializer_class = StudentProfileSerializer
     queryset = StudentProfile.objects.all()
+    pagination_class = ResultsSetPagination
 
     def get_queryset(self):
         queryset = StudentProfile.objects.all()